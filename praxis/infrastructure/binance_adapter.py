@@ -22,7 +22,7 @@ from collections.abc import Callable, Sequence
 from contextlib import AbstractAsyncContextManager
 from datetime import datetime, UTC
 from decimal import Decimal
-from typing import Any
+from typing import Any, cast
 from urllib.parse import urlencode
 
 import aiohttp
@@ -42,8 +42,10 @@ from praxis.infrastructure.venue_adapter import (
     AuthenticationError,
     BalanceEntry,
     CancelResult,
+    CancelToken,
     CommandQuantization,
     DuplicateClientOrderIdError,
+    ErrorCode,
     ExecutionReport,
     ImmediateFill,
     LocalOrderRejectedError,
@@ -53,6 +55,7 @@ from praxis.infrastructure.venue_adapter import (
     OrderRejectedError,
     OrderSubmitTimeoutError,
     RateLimitError,
+    SubmitCancelledError,
     SubmitResult,
     SymbolFilters,
     TransientError,
@@ -71,6 +74,7 @@ __all__ = [
 
 _API_KEY_HEADER = 'X-MBX-APIKEY'
 _SESSION_TIMEOUT = aiohttp.ClientTimeout(total=30)
+_CONNECTOR_LIMIT = 256
 _HTTP_OK = 200
 _HTTP_BAD_REQUEST = 400
 _HTTP_UNAUTHORIZED = 401
@@ -83,6 +87,7 @@ _MS_PER_SECOND = 1000
 _NOT_FOUND_CODES = frozenset({-2013, -2011})
 _DUPLICATE_CLIENT_ORDER_ID_CODE = -2010
 _LOCAL_FILTER_REJECT_CODE = -1013
+_RESTING_STATUSES = frozenset({OrderStatus.OPEN, OrderStatus.PARTIALLY_FILLED})
 _MAX_RETRIES = 3
 _RETRY_BASE_DELAY = 0.5
 _DEFAULT_WEIGHT_LIMIT = 6000
@@ -180,6 +185,11 @@ _BINANCE_EXECUTION_TYPE_MAP: dict[str, ExecutionType] = {
     'TRADE_PREVENTION': ExecutionType.TRADE_PREVENTION,
 }
 
+_BINANCE_SIDE_MAP: dict[str, OrderSide] = {
+    'BUY': OrderSide.BUY,
+    'SELL': OrderSide.SELL,
+}
+
 _BINANCE_OCO_STATUS_MAP: dict[str, OrderStatus] = {
     'EXECUTING': OrderStatus.OPEN,
     'REJECT': OrderStatus.REJECTED,
@@ -240,6 +250,7 @@ class BinanceAdapter:
         }
         self._clock_drift_ms: float = 0.0
         self._health_lock = threading.Lock()
+        self._hmac_cache: dict[str, hmac.HMAC] = {}
 
     def _decayed_used_weight(self) -> int:
 
@@ -371,6 +382,9 @@ class BinanceAdapter:
             credentials (Credentials): Resolved Binance credentials
         '''
 
+        previous = self._credentials.get(account_id)
+        if previous is not None:
+            self._hmac_cache.pop(previous.api_secret, None)
         self._credentials[account_id] = credentials
         with self._health_lock:
             self._health_trackers.setdefault(account_id, HealthTracker())
@@ -387,7 +401,8 @@ class BinanceAdapter:
             KeyError: If account_id is not registered
         '''
 
-        del self._credentials[account_id]
+        credentials = self._credentials.pop(account_id)
+        self._hmac_cache.pop(credentials.api_secret, None)
         with self._health_lock:
             self._health_trackers.pop(account_id, None)
 
@@ -422,6 +437,10 @@ class BinanceAdapter:
         shutdown and would otherwise resurrect a session the adapter
         no longer owns.
 
+        The session owns a pooled `TCPConnector` sized so bursty submit,
+        cancel and query traffic overlaps on kept-alive connections
+        instead of queueing behind the default pool limit.
+
         Returns:
             aiohttp.ClientSession: Active HTTP session
         '''
@@ -431,7 +450,8 @@ class BinanceAdapter:
             raise RuntimeError(msg)
 
         if self._session is None or self._session.closed:
-            self._session = aiohttp.ClientSession(timeout=_SESSION_TIMEOUT)
+            connector = aiohttp.TCPConnector(limit=_CONNECTOR_LIMIT)
+            self._session = aiohttp.ClientSession(timeout=_SESSION_TIMEOUT, connector=connector)
         return self._session
 
     def _sign_params(
@@ -447,6 +467,9 @@ class BinanceAdapter:
         HMAC-SHA256 signature. The caller must embed this directly in the
         request URL to avoid re-encoding by the HTTP client.
 
+        The keyed HMAC state (inner/outer pad) is built once per secret
+        and copied per request, so each signature only hashes the query.
+
         Args:
             params (dict[str, str]): Request parameters to sign
             api_secret (str): API secret used as HMAC key
@@ -458,12 +481,13 @@ class BinanceAdapter:
         signed = dict(params)
         signed['timestamp'] = str(int(time.time() * _MS_PER_SECOND))
         query = urlencode(signed)
-        signature = hmac.new(
-            api_secret.encode(),
-            query.encode(),
-            hashlib.sha256,
-        ).hexdigest()
-        return f'{query}&signature={signature}'
+        keyed = self._hmac_cache.get(api_secret)
+        if keyed is None:
+            keyed = hmac.new(api_secret.encode(), digestmod=hashlib.sha256)
+            self._hmac_cache[api_secret] = keyed
+        mac = keyed.copy()
+        mac.update(query.encode())
+        return f'{query}&signature={mac.hexdigest()}'
 
     async def _request_with_retry(
         self,
@@ -505,7 +529,7 @@ class BinanceAdapter:
             RateLimitError: On non-429 rate limit responses, or after retry exhaustion
         '''
 
-        last_error: TransientError | None = None
+        last_error: VenueError | None = None
         start = time.perf_counter()
         max_attempts = _MAX_RETRIES if idempotent else 1
 
@@ -517,69 +541,74 @@ class BinanceAdapter:
                     data: Any = await response.json()
                     self._record_health(account_id, start, succeeded=True)
                     return data
-            except TransientError as exc:
-                last_error = exc
-                if attempt + 1 == max_attempts:
-                    break
-                delay = random.uniform(0, _RETRY_BASE_DELAY * 2 ** attempt)
-                _log.warning(
-                    'Transient error on %s %s (attempt %d/%d), retrying in %.2fs: %s',
-                    method, path, attempt + 1, max_attempts, delay, exc,
-                )
-                await asyncio.sleep(delay)
-            except RateLimitError as exc:
-                if attempt + 1 == max_attempts or exc.status_code != _HTTP_TOO_MANY:
-                    self._record_health(account_id, start, succeeded=False)
+            except VenueError as exc:
+                code = exc.code
+                if code.is_retryable:
+                    if code is ErrorCode.RATE_LIMIT:
+                        # Only `RateLimitError` carries RATE_LIMIT.
+                        rate_limited = cast(RateLimitError, exc)
+                        if attempt + 1 == max_attempts or rate_limited.status_code != _HTTP_TOO_MANY:
+                            self._record_health(account_id, start, succeeded=False)
+                            raise
+                        retry_after = rate_limited.retry_after
+                        delay = max(0.0, retry_after) if retry_after is not None else random.uniform(0, _RETRY_BASE_DELAY * 2 ** attempt)
+                        _log.warning(
+                            'Rate limited on %s %s (attempt %d/%d), retrying in %.2fs',
+                            method, path, attempt + 1, max_attempts, delay,
+                        )
+                    else:
+                        last_error = exc
+                        if attempt + 1 == max_attempts:
+                            break
+                        delay = random.uniform(0, _RETRY_BASE_DELAY * 2 ** attempt)
+                        _log.warning(
+                            'Transient error on %s %s (attempt %d/%d), retrying in %.2fs: %s',
+                            method, path, attempt + 1, max_attempts, delay, exc,
+                        )
+                    await asyncio.sleep(delay)
+                    continue
+                if code is ErrorCode.NOT_FOUND:
+                    # When binsim is the venue, `NotFoundError` on routes
+                    # like `GET /api/v3/order` is a documented stub response
+                    # (the simulator does not retain non-terminal order
+                    # state — every `GET /api/v3/order` returns Binance
+                    # code `-2013`; see `docs/Binsim.md`). Counting these
+                    # legitimate stub responses as health failures
+                    # deadlocks `HealthLoop` after any restart that
+                    # re-reconciles prior orders: every lookup raises
+                    # `NotFoundError` → `consecutive_failures` and
+                    # `failure_rate` cross the halt thresholds →
+                    # `state.mode` flips to HALTED → INTAKE blocks ENTERs
+                    # → no fresh signed successes ever dilute the window
+                    # → permanent halt. On real venues (testnet / mainnet)
+                    # a `NotFoundError` is still a genuine signal
+                    # (deleted/missing order state) and is recorded as a
+                    # failure as before.
+                    if not _binsim_enabled():
+                        self._record_health(account_id, start, succeeded=False)
+                    raise
+                if code is ErrorCode.REJECTED:
+                    # Business-rule rejections (insufficient balance, MIN_NOTIONAL,
+                    # LOT_SIZE, etc.) mean the venue responded successfully and
+                    # applied its rules correctly — the order specifically cannot
+                    # proceed. Record the round-trip as a positive health signal
+                    # (`succeeded=True`): the latency sample is real and
+                    # `_consecutive_failures` resets so a prior transient
+                    # failure doesn't persist into the next genuine venue issue.
+                    # Same class of bug as the original prod incident — two
+                    # consecutive `-2010` rejections tripped the consecutive-
+                    # failure threshold, flipped `state.mode` to HALTED, and no
+                    # signed success could ever dilute the window (every
+                    # subsequent ENTER got rejected at intake with
+                    # `INTAKE_MODE_BLOCKS_ENTER`). `submit_order` may later
+                    # re-wrap an `OrderRejectedError` with
+                    # `_DUPLICATE_CLIENT_ORDER_ID_CODE` as
+                    # `DuplicateClientOrderIdError`, but that wrap happens
+                    # downstream of this site; the record-as-success here
+                    # applies regardless of how the caller classifies the
+                    # raise.
+                    self._record_health(account_id, start, succeeded=True)
                     raise
-                delay = max(0.0, exc.retry_after) if exc.retry_after is not None else random.uniform(0, _RETRY_BASE_DELAY * 2 ** attempt)
-                _log.warning(
-                    'Rate limited on %s %s (attempt %d/%d), retrying in %.2fs',
-                    method, path, attempt + 1, max_attempts, delay,
-                )
-                await asyncio.sleep(delay)
-            except NotFoundError:
-                # When binsim is the venue, `NotFoundError` on routes
-                # like `GET /api/v3/order` is a documented stub response
-                # (the simulator does not retain non-terminal order
-                # state — every `GET /api/v3/order` returns Binance
-                # code `-2013`; see `docs/Binsim.md`). Counting these
-                # legitimate stub responses as health failures
-                # deadlocks `HealthLoop` after any restart that
-                # re-reconciles prior orders: every lookup raises
-                # `NotFoundError` → `consecutive_failures` and
-                # `failure_rate` cross the halt thresholds →
-                # `state.mode` flips to HALTED → INTAKE blocks ENTERs
-                # → no fresh signed successes ever dilute the window
-                # → permanent halt. On real venues (testnet / mainnet)
-                # a `NotFoundError` is still a genuine signal
-                # (deleted/missing order state) and is recorded as a
-                # failure as before.
-                if not _binsim_enabled():
-                    self._record_health(account_id, start, succeeded=False)
-                raise
-            except OrderRejectedError:
-                # Business-rule rejections (insufficient balance, MIN_NOTIONAL,
-                # LOT_SIZE, etc.) mean the venue responded successfully and
-                # applied its rules correctly — the order specifically cannot
-                # proceed. Record the round-trip as a positive health signal
-                # (`succeeded=True`): the latency sample is real and
-                # `_consecutive_failures` resets so a prior transient
-                # failure doesn't persist into the next genuine venue issue.
-                # Same class of bug as the original prod incident — two
-                # consecutive `-2010` rejections tripped the consecutive-
-                # failure threshold, flipped `state.mode` to HALTED, and no
-                # signed success could ever dilute the window (every
-                # subsequent ENTER got rejected at intake with
-                # `INTAKE_MODE_BLOCKS_ENTER`). `submit_order` may later
-                # re-wrap an `OrderRejectedError` with
-                # `_DUPLICATE_CLIENT_ORDER_ID_CODE` as
-                # `DuplicateClientOrderIdError`, but that wrap happens
-                # downstream of this site; the record-as-success here
-                # applies regardless of how the caller classifies the
-                # raise.
-                self._record_health(account_id, start, succeeded=True)
-                raise
-            except VenueError:
                 self._record_health(account_id, start, succeeded=False)
                 raise
             except (aiohttp.ClientError, TimeoutError, ValueError) as exc:
@@ -793,6 +822,24 @@ class BinanceAdapter:
             msg = f"Unknown Binance order status: '{binance_status}'"
             raise ValueError(msg) from None
 
+    def _map_order_side(self, binance_side: str) -> OrderSide:
+
+        '''
+        Map a Binance side string to an OrderSide enum.
+
+        Args:
+            binance_side (str): Binance side value
+
+        Returns:
+            OrderSide: Corresponding domain side
+        '''
+
+        try:
+            return _BINANCE_SIDE_MAP[binance_side]
+        except KeyError:
+            msg = f"Unknown Binance order side: '{binance_side}'"
+            raise ValueError(msg) from None
+
     def _map_order_type(self, binance_type: str, time_in_force: str) -> OrderType:
 
         '''
@@ -840,7 +887,7 @@ class BinanceAdapter:
                 fee_asset=f['commissionAsset'],
                 is_maker=False,  # Binance FULL fills omit isMaker; always taker
             )
-            for f in data.get('fills', [])
+            for f in data.get('fills', ())
         )
         return SubmitResult(
             venue_order_id=str(data['orderId']),
@@ -872,8 +919,8 @@ class BinanceAdapter:
                 fee_asset=f['commissionAsset'],
                 is_maker=bool(f.get('isMaker', False)),
             )
-            for report in data.get('orderReports', [])
-            for f in report.get('fills', [])
+            for report in data.get('orderReports', ())
+            for f in report.get('fills', ())
         )
 
         list_status = data['listOrderStatus']
@@ -922,7 +969,7 @@ class BinanceAdapter:
             client_order_id=str(data['clientOrderId']),
             status=self._map_order_status(data['status']),
             symbol=data['symbol'],
-            side=OrderSide(data['side']),
+            side=self._map_order_side(data['side']),
             order_type=order_type,
             qty=Decimal(data['origQty']),
             filled_qty=Decimal(data['executedQty']),
@@ -946,7 +993,7 @@ class BinanceAdapter:
             venue_order_id=str(data['orderId']),
             client_order_id=str(data['clientOrderId']),
             symbol=data['symbol'],
-            side=OrderSide(data['side']),
+            side=self._map_order_side(data['side']),
             qty=Decimal(data['qty']),
             price=Decimal(data['price']),
             fee=Decimal(data['commission']),
@@ -1279,6 +1326,7 @@ class BinanceAdapter:
         client_order_id: str | None = None,
         time_in_force: str | None = None,
         quote_qty: Decimal | None = None,
+        cancel_token: CancelToken | None = None,
     ) -> SubmitResult:
 
         '''
@@ -1299,6 +1347,10 @@ class BinanceAdapter:
             quote_qty (Decimal | None): Quote-asset spend for quote-native
                 MARKET BUY. Sends Binance's `quoteOrderQty` parameter.
                 Mutually exclusive with `qty`; only valid for MARKET BUY.
+            cancel_token (CancelToken | None): When already fired, the
+                POST is not sent and `SubmitCancelledError` is raised;
+                when fired while the POST is in flight, the resting order
+                is cancelled once the venue acknowledges it.
 
         Returns:
             SubmitResult: Venue response with order ID, status, and immediate fills
@@ -1345,10 +1397,13 @@ class BinanceAdapter:
                 symbol, side, quote_qty,
                 client_order_id=client_order_id,
             )
+            self._check_cancel_token(cancel_token)
             data = await self._post_order(
                 '/api/v3/order', params, account_id, client_order_id,
             )
-            return self._parse_submit_response(data)
+            return await self._apply_cancel_token(
+                account_id, symbol, self._parse_submit_response(data), cancel_token,
+            )
 
         if qty is None:
             msg = 'submit_order requires qty or quote_qty'
@@ -1369,10 +1424,14 @@ class BinanceAdapter:
                 client_order_id=client_order_id,
                 time_in_force=time_in_force,
             )
+            self._check_cancel_token(cancel_token)
             data = await self._post_order(
                 '/api/v3/order/oco', params, account_id, client_order_id,
             )
-            return self._parse_oco_response(data)
+            return await self._apply_cancel_token(
+                account_id, symbol, self._parse_oco_response(data), cancel_token,
+                is_order_list=True,
+            )
 
         if stop_limit_price is not None:
             msg = 'stop_limit_price is only supported for OCO orders'
@@ -1384,10 +1443,87 @@ class BinanceAdapter:
             client_order_id=client_order_id,
             time_in_force=time_in_force,
         )
+        self._check_cancel_token(cancel_token)
         data = await self._post_order(
             '/api/v3/order', params, account_id, client_order_id,
         )
-        return self._parse_submit_response(data)
+        return await self._apply_cancel_token(
+            account_id, symbol, self._parse_submit_response(data), cancel_token,
+        )
+
+    @staticmethod
+    def _check_cancel_token(cancel_token: CancelToken | None) -> None:
+
+        '''
+        Refuse to send the POST when the caller already withdrew.
+
+        Args:
+            cancel_token (CancelToken | None): Caller cancellation signal
+
+        Raises:
+            SubmitCancelledError: If the token fired before the POST
+        '''
+
+        if cancel_token is not None and cancel_token.cancelled:
+            msg = 'cancel token fired before submit'
+            raise SubmitCancelledError(msg)
+
+    async def _apply_cancel_token(
+        self,
+        account_id: str,
+        symbol: str,
+        result: SubmitResult,
+        cancel_token: CancelToken | None,
+        *,
+        is_order_list: bool = False,
+    ) -> SubmitResult:
+
+        '''
+        Issue a compensating cancel when the caller withdrew mid-submit.
+
+        Args:
+            account_id (str): Account identifier for API key routing
+            symbol (str): Trading pair symbol
+            result (SubmitResult): Parsed venue acknowledgement
+            cancel_token (CancelToken | None): Caller cancellation signal
+            is_order_list (bool): Cancel via the order-list endpoint (OCO)
+
+        Returns:
+            SubmitResult: The original acknowledgement; the cancel outcome
+            reaches the caller through the execution report stream
+        '''
+
+        if (
+            cancel_token is None
+            or not cancel_token.cancelled
+            or result.status not in _RESTING_STATUSES
+        ):
+            return result
+
+        _log.warning(
+            'Cancel token fired during submit; cancelling resting order %s on %s',
+            result.venue_order_id, symbol,
+        )
+        try:
+            if is_order_list:
+                await self.cancel_order_list(
+                    account_id, symbol, venue_order_id=result.venue_order_id,
+                )
+            else:
+                await self.cancel_order(
+                    account_id, symbol, venue_order_id=result.venue_order_id,
+                )
+        except NotFoundError:
+            _log.info(
+                'Compensating cancel for %s found no resting order',
+                result.venue_order_id,
+            )
+        except VenueError as exc:
+            _log.warning(
+                'Compensating cancel for %s failed, order left for reconciliation: %s',
+                result.venue_order_id, exc,
+            )
+        return result
 
     def _build_quote_native_market_params(
         self,
@@ -1876,7 +2012,7 @@ class BinanceAdapter:
             raise VenueError(msg)
 
         try:
-            return SymbolFilters(
+            return SymbolFilters.intern(
                 symbol=symbol,
                 tick_size=Decimal(filters['PRICE_FILTER']['tickSize']),
                 lot_step=Decimal(filters['LOT_SIZE']['stepSize']),
@@ -2182,7 +2318,7 @@ class BinanceAdapter:
             ),
             symbol=data['s'],
             client_order_id=data['c'],
-            side=OrderSide(data['S']),
+            side=self._map_order_side(data['S']),
             order_type=order_type,
             original_qty=Decimal(data['q']),
             original_price=Decimal(data['p']),
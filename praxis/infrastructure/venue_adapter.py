@@ -8,11 +8,13 @@ normalize venue-specific data into internal domain types.
 
 from __future__ import annotations
 
+import weakref
 from collections.abc import Sequence
 from dataclasses import dataclass
 from datetime import datetime
 from decimal import Decimal
-from typing import Any, Protocol, runtime_checkable
+from enum import IntEnum
+from typing import Any, ClassVar, Protocol, runtime_checkable
 
 from praxis.core.domain.enums import ExecutionType, OrderSide, OrderStatus, OrderType
 from praxis.core.domain.health_snapshot import HealthSnapshot
@@ -24,8 +26,10 @@ __all__ = [
     'AuthenticationError',
     'BalanceEntry',
     'CancelResult',
+    'CancelToken',
     'CommandQuantization',
     'DuplicateClientOrderIdError',
+    'ErrorCode',
     'ExecutionReport',
     'ImmediateFill',
     'LocalOrderRejectedError',
@@ -35,6 +39,7 @@ __all__ = [
     'OrderRejectedError',
     'OrderSubmitTimeoutError',
     'RateLimitError',
+    'SubmitCancelledError',
     'SubmitResult',
     'SymbolFilters',
     'TransientError',
@@ -45,7 +50,7 @@ __all__ = [
 ]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ImmediateFill:
     '''
     Represent a fill returned inline with an order submission response.
@@ -67,7 +72,7 @@ class ImmediateFill:
     is_maker: bool
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SubmitResult:
     '''
     Represent the venue response to an order submission.
@@ -83,7 +88,7 @@ class SubmitResult:
     immediate_fills: tuple[ImmediateFill, ...]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CancelResult:
     '''
     Represent the venue response to an order cancellation.
@@ -97,7 +102,7 @@ class CancelResult:
     status: OrderStatus
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class VenueOrder:
     '''
     Represent an order as reported by the venue on query.
@@ -125,7 +130,7 @@ class VenueOrder:
     price: Decimal | None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class VenueTrade:
     '''
     Represent a historical trade record from the venue.
@@ -164,7 +169,7 @@ class VenueTrade:
             raise ValueError(msg)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BalanceEntry:
     '''
     Represent a single asset balance from the venue account.
@@ -180,7 +185,7 @@ class BalanceEntry:
     locked: Decimal
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, weakref_slot=True)
 class SymbolFilters:
     '''
     Represent venue-imposed trading filters for a symbol.
@@ -201,8 +206,56 @@ class SymbolFilters:
     lot_max: Decimal
     min_notional: Decimal
 
+    @classmethod
+    def intern(
+        cls,
+        *,
+        symbol: str,
+        tick_size: Decimal,
+        lot_step: Decimal,
+        lot_min: Decimal,
+        lot_max: Decimal,
+        min_notional: Decimal,
+    ) -> SymbolFilters:
+
+        '''
+        Return a shared instance for identical filter values.
+
+        Values are keyed by their string form so venue wire precision
+        (e.g. `0.01000000` vs `0.01`) is never silently swapped.
+
+        Args:
+            symbol (str): Trading pair symbol
+            tick_size (Decimal): Minimum price increment
+            lot_step (Decimal): Minimum quantity increment
+            lot_min (Decimal): Minimum order quantity
+            lot_max (Decimal): Maximum order quantity
+            min_notional (Decimal): Minimum order value (price * qty)
+
+        Returns:
+            SymbolFilters: Cached instance while any reference to it is alive
+        '''
+
+        key = (
+            symbol, str(tick_size), str(lot_step),
+            str(lot_min), str(lot_max), str(min_notional),
+        )
+        cached = _SYMBOL_FILTERS_INTERN.get(key)
+        if cached is None:
+            cached = cls(
+                symbol=symbol, tick_size=tick_size, lot_step=lot_step,
+                lot_min=lot_min, lot_max=lot_max, min_notional=min_notional,
+            )
+            _SYMBOL_FILTERS_INTERN[key] = cached
+        return cached
+
+
+_SYMBOL_FILTERS_INTERN: weakref.WeakValueDictionary[tuple[str, ...], SymbolFilters] = (
+    weakref.WeakValueDictionary()
+)
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CommandQuantization:
     '''
     Result of quantizing a strategy-supplied qty for command creation.
@@ -245,7 +298,7 @@ class CommandQuantization:
             raise ValueError(msg)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OrderBookLevel:
     '''
     Single price level in an order book snapshot.
@@ -259,7 +312,7 @@ class OrderBookLevel:
     qty: Decimal
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OrderBookSnapshot:
     '''
     Point-in-time order book snapshot from the venue.
@@ -275,7 +328,7 @@ class OrderBookSnapshot:
     last_update_id: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ExecutionReport:
     '''
     Venue-reported order execution event from WebSocket stream.
@@ -339,6 +392,38 @@ class ExecutionReport:
             raise ValueError(msg)
 
 
+class ErrorCode(IntEnum):
+    '''
+    Classification code carried by every `VenueError`.
+
+    Lets a retry handler dispatch on one integer compare instead of a
+    chain of `except` clauses walking the exception MRO.
+    '''
+
+    VENUE = 0
+    RATE_LIMIT = 1
+    AUTH = 2
+    TRANSIENT = 3
+    NOT_FOUND = 4
+    REJECTED = 5
+    CANCELLED = 6
+
+    @property
+    def is_retryable(self) -> bool:
+
+        '''
+        Report whether errors with this code may be retried.
+
+        Returns:
+            bool: True for rate-limit and transient failures
+        '''
+
+        return self in _RETRYABLE_ERROR_CODES
+
+
+_RETRYABLE_ERROR_CODES = frozenset({ErrorCode.RATE_LIMIT, ErrorCode.TRANSIENT})
+
+
 class VenueError(Exception):
     '''
     Base exception for all venue adapter failures.
@@ -347,6 +432,8 @@ class VenueError(Exception):
         message (str): Human-readable error description
     '''
 
+    code: ClassVar[ErrorCode] = ErrorCode.VENUE
+
     def __init__(self, message: str) -> None:
         '''
         Store the error message.
@@ -369,6 +456,8 @@ class OrderRejectedError(VenueError):
         reason (str): Venue-provided rejection reason
     '''
 
+    code: ClassVar[ErrorCode] = ErrorCode.REJECTED
+
     def __init__(self, message: str, venue_code: int, reason: str) -> None:
         '''
         Store the venue rejection details.
@@ -411,6 +500,8 @@ class RateLimitError(VenueError):
         status_code (int | None): HTTP status code that triggered the error
     '''
 
+    code: ClassVar[ErrorCode] = ErrorCode.RATE_LIMIT
+
     def __init__(
         self,
         message: str,
@@ -434,14 +525,20 @@ class RateLimitError(VenueError):
 class AuthenticationError(VenueError):
     '''Raised when the venue rejects API key or signature.'''
 
+    code: ClassVar[ErrorCode] = ErrorCode.AUTH
+
 
 class TransientError(VenueError):
     '''Raised when retries are exhausted on HTTP 5xx or timeout.'''
 
+    code: ClassVar[ErrorCode] = ErrorCode.TRANSIENT
+
 
 class NotFoundError(VenueError):
     '''Raised when the requested order or resource does not exist on the venue.'''
 
+    code: ClassVar[ErrorCode] = ErrorCode.NOT_FOUND
+
 
 class OrderSubmitTimeoutError(VenueError):
     '''Raised when a non-idempotent order POST fails at the transport layer.
@@ -481,7 +578,19 @@ class DuplicateClientOrderIdError(VenueError):
         self.args = (message, client_order_id)
 
 
-@dataclass(frozen=True)
+
+class SubmitCancelledError(VenueError):
+    '''Raised when a `CancelToken` fired before the order POST was sent.
+
+    The caller withdrew the submission itself, so the order never
+    reached the venue. Distinct from `LocalOrderRejectedError` so a
+    caller's own cancel is not recorded as a failed pre-flight filter
+    check.
+    '''
+
+    code: ClassVar[ErrorCode] = ErrorCode.CANCELLED
+
+@dataclass(frozen=True, slots=True)
 class ApiPermissions:
 
     '''
@@ -496,6 +605,49 @@ class ApiPermissions:
     enable_spot_and_margin_trading: bool
 
 
+class CancelToken:
+    '''
+    Caller-side signal that an in-flight order submission is no longer wanted.
+
+    A token that has already fired stops the POST from being sent. A POST
+    cannot be safely abandoned once sent, so the adapter lets the
+    submission complete and, if the token has fired by then and the order
+    is still resting, issues a compensating cancel by venue order ID.
+
+    The token is checked before the POST and again once the POST
+    returns; the adapter does not race the request against it, so a
+    token fired mid-flight takes effect only after the venue answers.
+    '''
+
+    def __init__(self) -> None:
+
+        '''
+        Create an unfired token.
+        '''
+
+        self._cancelled = False
+
+    @property
+    def cancelled(self) -> bool:
+
+        '''
+        Report whether `cancel` has been called.
+
+        Returns:
+            bool: True once the token has fired
+        '''
+
+        return self._cancelled
+
+    def cancel(self) -> None:
+
+        '''
+        Fire the token. Idempotent.
+        '''
+
+        self._cancelled = True
+
+
 @runtime_checkable
 class VenueAdapter(Protocol):
     '''
@@ -629,6 +781,7 @@ class VenueAdapter(Protocol):
         client_order_id: str | None = None,
         time_in_force: str | None = None,
         quote_qty: Decimal | None = None,
+        cancel_token: CancelToken | None = None,
     ) -> SubmitResult:
         '''
         Submit an order to the venue.
@@ -649,6 +802,11 @@ class VenueAdapter(Protocol):
                 for quote-native MARKET BUY. The venue determines the
                 executed base quantity from live liquidity. Mutually
                 exclusive with `qty`.
+            cancel_token (CancelToken | None): When already fired, the
+                adapter raises `SubmitCancelledError` without sending the
+                order; when fired before the venue acknowledges, the
+                adapter cancels the resting order once its venue order ID
+                is known.
 
         Returns:
             SubmitResult: Venue response with order ID, status, and immediate fills
@@ -29,6 +29,7 @@ from praxis.infrastructure.venue_adapter import (
     ApiPermissions,
     BalanceEntry,
     CancelResult,
+    CancelToken,
     CommandQuantization,
     ExecutionReport,
     ImmediateFill,
@@ -170,6 +171,7 @@ class ReplayVenueAdapter:
         client_order_id: str | None = None,
         time_in_force: str | None = None,
         quote_qty: Decimal | None = None,
+        cancel_token: CancelToken | None = None,
     ) -> SubmitResult:
         '''Fill a market order fully at the current bar price.'''
 
@@ -4,9 +4,17 @@ Run the test suite excluding testnet integration tests.
 
 from __future__ import annotations
 
-
 import sys
 
 import pytest
 
-sys.exit(pytest.main(['-v', 'tests/', '--ignore=tests/testnet']))
+sys.exit(pytest.main([
+    '-q',
+    '--tb=short',
+    '-p', 'no:cacheprovider',
+    '-o', 'console_output_style=count',
+    '-n', 'auto',
+    '--dist', 'loadfile',
+    'tests/',
+    '--ignore=tests/testnet',
+]))
@@ -0,0 +1,225 @@
+'''
+In-process stand-ins for the aiohttp session used by `BinanceAdapter` tests.
+'''
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any, NamedTuple, cast
+
+from praxis.infrastructure.binance_adapter import BinanceAdapter
+
+
+def _frozen(value: Any) -> Any:
+
+    '''
+    Recursively freeze a canned venue payload.
+
+    Dicts become read-only `MappingProxyType` views and lists become
+    tuples, so a test that mutates a shared response fails loudly
+    instead of leaking into later tests.
+
+    Args:
+        value (Any): JSON-shaped payload
+
+    Returns:
+        Any: Read-only equivalent of `value`
+    '''
+
+    if isinstance(value, dict):
+        return MappingProxyType({k: _frozen(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_frozen(v) for v in value)
+    return value
+
+
+def _thawed(value: Any) -> Any:
+
+    '''
+    Return a fresh mutable copy of a payload frozen by `_frozen`.
+
+    Args:
+        value (Any): Frozen or plain JSON-shaped payload
+
+    Returns:
+        Any: Payload rebuilt from plain dicts and lists, as `json()` parses it
+    '''
+
+    if isinstance(value, Mapping):
+        return {k: _thawed(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_thawed(v) for v in value]
+    return value
+
+
+class _FakeResponse:
+
+    '''
+    Minimal stand-in for `aiohttp.ClientResponse`.
+
+    Args:
+        status (int): HTTP status code
+        data (Any): JSON response body
+        headers (dict[str, str]): Response headers
+    '''
+
+    __slots__ = ('_data', 'headers', 'status')
+
+    def __init__(self, status: int, data: Any, headers: dict[str, str]) -> None:
+
+        self.status = status
+        self.headers = headers
+        self._data = data
+
+    async def json(self, **_kwargs: Any) -> Any:
+
+        '''
+        Return a freshly parsed copy of the canned JSON body.
+
+        Returns:
+            Any: Plain dict/list copy of the body passed at construction
+        '''
+
+        return _thawed(self._data)
+
+
+def _mock_response(
+    status: int,
+    data: Any = None,
+    headers: dict[str, str] | None = None,
+) -> _FakeResponse:
+
+    '''
+    Create a fake aiohttp response.
+
+    Args:
+        status (int): HTTP status code
+        data (Any): JSON response body
+        headers (dict[str, str] | None): Response headers
+
+    Returns:
+        _FakeResponse: Response with status, json(), and headers
+    '''
+
+    return _FakeResponse(status, data if data is not None else {}, headers or {})
+
+
+class _RequestCall(NamedTuple):
+
+    '''Positional and keyword arguments of one recorded `session.request` call.'''
+
+    args: tuple[Any, ...]
+    kwargs: dict[str, Any]
+
+
+class _FakeRequestContext:
+
+    '''
+    Async context manager yielding a canned response or raising on entry.
+
+    Args:
+        outcome (_FakeResponse | BaseException): Response returned on entry,
+            or exception raised on entry
+    '''
+
+    __slots__ = ('_outcome',)
+
+    def __init__(self, outcome: _FakeResponse | BaseException) -> None:
+
+        self._outcome = outcome
+
+    async def __aenter__(self) -> _FakeResponse:
+
+        if isinstance(self._outcome, BaseException):
+            raise self._outcome
+        return self._outcome
+
+    async def __aexit__(self, *_exc: object) -> bool:
+
+        return False
+
+
+class _FakeSession:
+
+    '''
+    Minimal stand-in for `aiohttp.ClientSession` recording each request.
+
+    Outcomes are consumed in order, one per request; the last one is
+    repeated once the others are used up. An exception outcome is raised
+    on entering the request context, where aiohttp surfaces transport
+    errors.
+
+    Args:
+        *outcomes (_FakeResponse | BaseException): Per-request responses
+    '''
+
+    __slots__ = ('_outcomes', 'closed', 'request_calls')
+
+    def __init__(self, *outcomes: _FakeResponse | BaseException) -> None:
+
+        self._outcomes = list(outcomes)
+        self.closed = False
+        self.request_calls: list[_RequestCall] = []
+
+    def request(self, *args: Any, **kwargs: Any) -> _FakeRequestContext:
+
+        '''
+        Record the call and return a context yielding the next outcome.
+
+        Returns:
+            _FakeRequestContext: Context manager for the response
+        '''
+
+        self.request_calls.append(_RequestCall(args, kwargs))
+        outcome = self._outcomes.pop(0) if len(self._outcomes) > 1 else self._outcomes[0]
+        return _FakeRequestContext(outcome)
+
+    def get(self, url: str, **kwargs: Any) -> _FakeRequestContext:
+
+        '''
+        Dispatch a GET through `request` so it is recorded the same way.
+
+        Returns:
+            _FakeRequestContext: Context manager for the response
+        '''
+
+        return self.request('GET', url, **kwargs)
+
+    async def close(self) -> None:
+
+        '''Mark the session closed, as `adapter.close()` expects.'''
+
+        self.closed = True
+
+
+def _patch_session(
+    adapter: BinanceAdapter,
+    *outcomes: _FakeResponse | BaseException,
+) -> None:
+
+    '''
+    Inject a fake session into the adapter.
+
+    Args:
+        adapter (BinanceAdapter): Adapter to patch
+        *outcomes (_FakeResponse | BaseException): Responses or transport
+            errors for successive session.request() calls
+    '''
+
+    adapter._session = _FakeSession(*outcomes)  # type: ignore[assignment]
+
+
+def _request_calls(adapter: BinanceAdapter) -> list[_RequestCall]:
+
+    '''
+    Return the requests recorded by the session injected via `_patch_session`.
+
+    Args:
+        adapter (BinanceAdapter): Adapter patched with `_patch_session`
+
+    Returns:
+        list[_RequestCall]: Recorded `session.request` calls in order
+    '''
+
+    return cast(_FakeSession, adapter._session).request_calls
@@ -4,24 +4,31 @@ Tests for praxis.infrastructure.binance_adapter.
 
 from __future__ import annotations
 
-import asyncio
+import hashlib
+import hmac
 import logging
 import time
+from collections.abc import AsyncGenerator, Mapping
 from datetime import datetime, UTC
 from decimal import Decimal
-from typing import Any, ClassVar
-from unittest.mock import AsyncMock, MagicMock, patch
+from types import MappingProxyType
+from typing import Any
+from urllib.parse import urlencode
+from unittest.mock import AsyncMock, patch
 
 import aiohttp
 import pytest
+import pytest_asyncio
+from aiohttp import web
 
 from praxis.core.domain.enums import ExecutionType, OrderSide, OrderStatus, OrderType
-from praxis.infrastructure.binance_adapter import BinanceAdapter
+from praxis.infrastructure.binance_adapter import _CONNECTOR_LIMIT, BinanceAdapter
 from praxis.infrastructure.secret_store import Credentials
 from praxis.infrastructure.venue_adapter import (
     AuthenticationError,
     BalanceEntry,
     CancelResult,
+    CancelToken,
     CommandQuantization,
     DuplicateClientOrderIdError,
     ExecutionReport,
@@ -29,13 +36,25 @@ from praxis.infrastructure.venue_adapter import (
     NotFoundError,
     OrderRejectedError,
     RateLimitError,
+    SubmitCancelledError,
     SymbolFilters,
     TransientError,
     VenueError,
     VenueOrder,
     VenueTrade,
 )
+from tests.support.fake_session import (
+    _FakeResponse,
+    _FakeSession,
+    _frozen,
+    _mock_response,
+    _patch_session,
+    _request_calls,
+    _thawed,
+)
 
+# Async tests share one event loop for the whole module.
+_module_loop = pytest.mark.asyncio(loop_scope='module')
 
 _BASE_URL = 'https://testnet.binance.vision'
 _WS_BASE_URL = 'wss://stream.testnet.binance.vision'
@@ -51,14 +70,53 @@ _BINANCE_INSUFFICIENT_BALANCE_CODE = -2010
 _BINANCE_INSUFFICIENT_BALANCE_MSG = 'Account has insufficient balance for requested action.'
 _BINANCE_API_KEY_INVALID_CODE = -2014
 _BINANCE_API_KEY_INVALID_MSG = 'API-key format invalid.'
-_SHA256_HEX_LENGTH = 64
+_FROZEN_TIME = 1700000000.0
+_FROZEN_SIGNED_PAYLOAD = 'symbol=BTCUSDT&timestamp=1700000000000'
+_FROZEN_SIGNATURE = hmac.new(
+    _API_SECRET.encode(), _FROZEN_SIGNED_PAYLOAD.encode(), hashlib.sha256,
+).hexdigest()
+_STUB_SIGNATURE = '0' * 64
+_QTY_ONE = Decimal('1.0')
+_PRICE_50K = Decimal('50000')
+_QTY_HALF = Decimal('0.5')
+_TICK_SIZE = Decimal('0.01')
+_LOT_STEP = Decimal('0.00001')
+_LOT_MAX = Decimal('9000.0')
+_MIN_NOTIONAL = Decimal('5.0')
+_QUOTE_QTY_100 = Decimal('100')
+_STOP_PRICE_48K = Decimal('48000')
+_REF_PRICE_80K = Decimal('80000')
+_REF_PRICE_81458 = Decimal('81458')
+_SNAPPED_QTY_20_USDT = Decimal('0.00024')
 _FALLBACK_VENUE_CODE = -1
+_ASSETS_BTC_USDT = frozenset({'BTC', 'USDT'})
+_ASSETS_BTC = frozenset({'BTC'})
+_ASSETS_DOGE = frozenset({'DOGE'})
+_ASSETS_ETH = frozenset({'ETH'})
+_ADAPTER_LOGGER = 'praxis.infrastructure.binance_adapter'
 _BINANCE_ORDER_NOT_EXIST_CODE = -2013
 _BINANCE_UNKNOWN_ORDER_CODE = -2011
 _BINANCE_ORDER_NOT_EXIST_MSG = 'Order does not exist.'
 _BINANCE_UNKNOWN_ORDER_MSG = 'Unknown order sent.'
+_STATUS_CASES: tuple[tuple[str, OrderStatus], ...] = (
+    ('NEW', OrderStatus.OPEN),
+    ('PARTIALLY_FILLED', OrderStatus.PARTIALLY_FILLED),
+    ('FILLED', OrderStatus.FILLED),
+    ('CANCELED', OrderStatus.CANCELED),
+    ('REJECTED', OrderStatus.REJECTED),
+    ('EXPIRED', OrderStatus.EXPIRED),
+    ('EXPIRED_IN_MATCH', OrderStatus.EXPIRED),
+)
+
 
-_BINANCE_FILLED_RESPONSE: dict[str, Any] = {
+_CANCEL_OK_RESPONSE: Mapping[str, Any] = _frozen({'orderId': 12345, 'status': 'CANCELED'})
+
+_NOT_FOUND_ERROR_BODY: Mapping[str, Any] = _frozen({
+    'code': _BINANCE_ORDER_NOT_EXIST_CODE,
+    'msg': _BINANCE_ORDER_NOT_EXIST_MSG,
+})
+
+_BINANCE_FILLED_RESPONSE: Mapping[str, Any] = _frozen({
     'orderId': 12345,
     'status': 'FILLED',
     'fills': [
@@ -70,21 +128,21 @@ _BINANCE_FILLED_RESPONSE: dict[str, Any] = {
             'commissionAsset': 'BTC',
         },
     ],
-}
+})
 
-_BINANCE_NEW_RESPONSE: dict[str, Any] = {
+_BINANCE_NEW_RESPONSE: Mapping[str, Any] = _frozen({
     'orderId': 12345,
     'status': 'NEW',
     'fills': [],
-}
+})
 
-_BINANCE_EXPIRED_RESPONSE: dict[str, Any] = {
+_BINANCE_EXPIRED_RESPONSE: Mapping[str, Any] = _frozen({
     'orderId': 12345,
     'status': 'EXPIRED',
     'fills': [],
-}
+})
 
-_BINANCE_LIMIT_ORDER_RESPONSE: dict[str, Any] = {
+_BINANCE_LIMIT_ORDER_RESPONSE: Mapping[str, Any] = _frozen({
     'orderId': 12345,
     'clientOrderId': 'my-client-id',
     'status': 'NEW',
@@ -95,9 +153,9 @@ _BINANCE_LIMIT_ORDER_RESPONSE: dict[str, Any] = {
     'origQty': '1.00000000',
     'executedQty': '0.00000000',
     'price': '50000.00000000',
-}
+})
 
-_BINANCE_MARKET_ORDER_RESPONSE: dict[str, Any] = {
+_BINANCE_MARKET_ORDER_RESPONSE: Mapping[str, Any] = _frozen({
     'orderId': 12345,
     'clientOrderId': 'my-client-id',
     'status': 'FILLED',
@@ -108,9 +166,9 @@ _BINANCE_MARKET_ORDER_RESPONSE: dict[str, Any] = {
     'origQty': '0.50000000',
     'executedQty': '0.50000000',
     'price': '0.00000000',
-}
+})
 
-_BINANCE_LIMIT_IOC_ORDER_RESPONSE: dict[str, Any] = {
+_BINANCE_LIMIT_IOC_ORDER_RESPONSE: Mapping[str, Any] = _frozen({
     'orderId': 12345,
     'clientOrderId': 'my-client-id',
     'status': 'EXPIRED',
@@ -121,9 +179,9 @@ _BINANCE_LIMIT_IOC_ORDER_RESPONSE: dict[str, Any] = {
     'origQty': '1.00000000',
     'executedQty': '0.30000000',
     'price': '50000.00000000',
-}
+})
 
-_BINANCE_TRADE_RESPONSE: dict[str, Any] = {
+_BINANCE_TRADE_RESPONSE: Mapping[str, Any] = _frozen({
     'id': 99,
     'orderId': 12345,
     'clientOrderId': 'my-client-id',
@@ -135,9 +193,9 @@ _BINANCE_TRADE_RESPONSE: dict[str, Any] = {
     'commissionAsset': 'BTC',
     'isMaker': True,
     'time': 1700000000000,
-}
+})
 
-_BINANCE_OCO_RESPONSE: dict[str, Any] = {
+_BINANCE_OCO_RESPONSE: Mapping[str, Any] = _frozen({
     'orderListId': 99999,
     'contingencyType': 'OCO',
     'listStatusType': 'EXEC_STARTED',
@@ -182,9 +240,9 @@ _BINANCE_OCO_RESPONSE: dict[str, Any] = {
             'fills': [],
         },
     ],
-}
+})
 
-_BINANCE_OCO_RESPONSE_WITH_FILLS: dict[str, Any] = {
+_BINANCE_OCO_RESPONSE_WITH_FILLS: Mapping[str, Any] = _frozen({
     'orderListId': 99999,
     'contingencyType': 'OCO',
     'listStatusType': 'ALL_DONE',
@@ -237,9 +295,9 @@ _BINANCE_OCO_RESPONSE_WITH_FILLS: dict[str, Any] = {
             'fills': [],
         },
     ],
-}
+})
 
-_BINANCE_EXCHANGE_INFO_RESPONSE: dict[str, Any] = {
+_BINANCE_EXCHANGE_INFO_RESPONSE: Mapping[str, Any] = _frozen({
     'rateLimits': [
         {'rateLimitType': 'REQUEST_WEIGHT', 'interval': 'MINUTE', 'intervalNum': 1, 'limit': 1200},
         {'rateLimitType': 'ORDERS', 'interval': 'SECOND', 'intervalNum': 10, 'limit': 100},
@@ -256,10 +314,10 @@ _BINANCE_EXCHANGE_INFO_RESPONSE: dict[str, Any] = {
             ],
         },
     ],
-}
+})
 
 
-_BINANCE_EXCHANGE_INFO_MISSING_FILTER: dict[str, Any] = {
+_BINANCE_EXCHANGE_INFO_MISSING_FILTER: Mapping[str, Any] = _frozen({
     'symbols': [
         {
             'symbol': 'BTCUSDT',
@@ -269,21 +327,37 @@ _BINANCE_EXCHANGE_INFO_MISSING_FILTER: dict[str, Any] = {
             ],
         },
     ],
-}
+})
+
+
+_BINANCE_ACCOUNT_RESPONSE: Mapping[str, Any] = _frozen({
+    'balances': [
+        {'asset': 'BTC', 'free': '1.50000000', 'locked': '0.25000000'},
+        {'asset': 'USDT', 'free': '10000.00', 'locked': '500.00'},
+        {'asset': 'ETH', 'free': '0.00000000', 'locked': '0.00000000'},
+        {'asset': 'BNB', 'free': '5.00000000', 'locked': '0.00000000'},
+    ],
+})
 
 
 _TEST_FILTERS = SymbolFilters(
     symbol='BTCUSDT',
-    tick_size=Decimal('0.01'),
-    lot_step=Decimal('0.00001'),
+    tick_size=_TICK_SIZE,
+    lot_step=_LOT_STEP,
     lot_min=Decimal('0.001'),
-    lot_max=Decimal('9000.0'),
-    min_notional=Decimal('5.0'),
+    lot_max=_LOT_MAX,
+    min_notional=_MIN_NOTIONAL,
 )
 
 
+_DEFAULT_CREDENTIALS: dict[str, Credentials] = {
+    _ACCOUNT_ID: Credentials(api_key=_API_KEY, api_secret=_API_SECRET),
+}
+
+
 def _make_adapter(
     credentials: dict[str, Credentials] | None = None,
+    base_url: str = _BASE_URL,
 ) -> BinanceAdapter:
 
     '''
@@ -291,59 +365,147 @@ def _make_adapter(
 
     Args:
         credentials (dict[str, Credentials] | None): Override credentials
+        base_url (str): REST base URL, e.g. a loopback fake server
 
     Returns:
         BinanceAdapter: Adapter configured for testing
     '''
 
-    creds = credentials or {
-        _ACCOUNT_ID: Credentials(api_key=_API_KEY, api_secret=_API_SECRET),
-    }
-    return BinanceAdapter(_BASE_URL, _WS_BASE_URL, _WS_API_URL, creds)
+    creds = credentials or _DEFAULT_CREDENTIALS
+    return BinanceAdapter(base_url, _WS_BASE_URL, _WS_API_URL, creds)
+
+
+_FAKE_ORDER_RESPONSES: Mapping[tuple[str, str], Mapping[str, Any]] = MappingProxyType({
+    ('MARKET', ''): _BINANCE_FILLED_RESPONSE,
+    ('LIMIT', 'GTC'): _BINANCE_NEW_RESPONSE,
+    ('LIMIT', 'IOC'): _BINANCE_EXPIRED_RESPONSE,
+})
 
 
-def _mock_response(
-    status: int,
-    data: Any = None,
-    headers: dict[str, str] | None = None,
-) -> AsyncMock:
+async def _fake_order_handler(request: web.Request) -> web.Response:
 
     '''
-    Create a mock aiohttp response.
+    Serve a canned order response keyed on the submitted type and time-in-force.
 
     Args:
-        status (int): HTTP status code
-        data (Any): JSON response body
-        headers (dict[str, str] | None): Response headers
+        request (web.Request): Incoming POST /api/v3/order request
+
+    Returns:
+        web.Response: JSON body from _FAKE_ORDER_RESPONSES
+    '''
+
+    key = (request.query['type'], request.query.get('timeInForce', ''))
+    return web.json_response(_thawed(_FAKE_ORDER_RESPONSES[key]))
+
+
+@pytest_asyncio.fixture(scope='module', loop_scope='module')
+async def fake_binance() -> AsyncGenerator[str, None]:
+
+    '''
+    Run one loopback aiohttp server per module that serves canned order responses.
+
+    Returns:
+        str: Base URL of the running server
+    '''
+
+    app = web.Application()
+    app.router.add_post('/api/v3/order', _fake_order_handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    host, port = runner.addresses[0][:2]
+    yield f'http://{host}:{port}'
+    await runner.cleanup()
+
+
+def _fire_during_post(
+    monkeypatch: pytest.MonkeyPatch,
+    adapter: BinanceAdapter,
+    token: CancelToken,
+) -> None:
+
+    '''
+    Fire the token once the adapter's POST has been acknowledged.
+
+    Args:
+        monkeypatch (pytest.MonkeyPatch): Fixture used to wrap `_post_order`
+        adapter (BinanceAdapter): Adapter whose submit is in flight
+        token (CancelToken): Token fired between POST and compensating cancel
+    '''
+
+    post_order = adapter._post_order
+
+    async def _post_then_fire(*args: Any) -> Any:
+        data = await post_order(*args)
+        token.cancel()
+        return data
+
+    monkeypatch.setattr(adapter, '_post_order', _post_then_fire)
+
+
+@pytest.fixture(scope='module')
+def adapter() -> BinanceAdapter:
+
+    '''
+    Share one adapter across the module's tests that never mutate adapter state.
+
+    Returns:
+        BinanceAdapter: Adapter configured for testing
+    '''
+
+    return _make_adapter()
+
+
+@pytest.fixture
+def sleeps(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+
+    '''
+    Replace the adapter's backoff sleep with a recorder that returns at once.
 
     Returns:
-        AsyncMock: Mock response with status, json(), and headers
+        list[float]: Delays the adapter asked to sleep for, in order
     '''
 
-    resp = AsyncMock()
-    resp.status = status
-    resp.json = AsyncMock(return_value=data if data is not None else {})
-    resp.headers = headers or {}
-    return resp
+    recorded: list[float] = []
 
+    async def _record(delay: float) -> None:
+        recorded.append(delay)
 
-def _patch_session(adapter: BinanceAdapter, response: AsyncMock) -> None:
+    monkeypatch.setattr('praxis.infrastructure.binance_adapter.asyncio.sleep', _record)
+    return recorded
+
+
+def _adapter_messages(caplog: pytest.LogCaptureFixture, level: int) -> list[str]:
 
     '''
-    Inject a mock session into the adapter.
+    Return the adapter's captured log messages at exactly `level`.
 
     Args:
-        adapter (BinanceAdapter): Adapter to patch
-        response (AsyncMock): Mock response for session.request()
+        caplog (pytest.LogCaptureFixture): Fixture holding captured records
+        level (int): Logging level to select
+
+    Returns:
+        list[str]: Rendered messages logged by the adapter module
+    '''
+
+    return [
+        r.getMessage() for r in caplog.records
+        if r.name == _ADAPTER_LOGGER and r.levelno == level
+    ]
+
+
+@pytest.fixture
+def fast_sign(monkeypatch: pytest.MonkeyPatch) -> None:
+
     '''
+    Swap `_sign_params` for a fixed-signature stub in tests that only check request flow.
+    '''
+
+    def _sign(_self: BinanceAdapter, params: dict[str, str], _api_secret: str) -> str:
+        return f'{urlencode(params)}&timestamp=0&signature={_STUB_SIGNATURE}'
 
-    session = MagicMock()
-    ctx = MagicMock()
-    ctx.__aenter__ = AsyncMock(return_value=response)
-    ctx.__aexit__ = AsyncMock(return_value=False)
-    session.request = MagicMock(return_value=ctx)
-    session.closed = False
-    adapter._session = session
+    monkeypatch.setattr(BinanceAdapter, '_sign_params', _sign)
 
 
 class TestCredentialManagement:
@@ -361,15 +523,13 @@ class TestCredentialManagement:
         with pytest.raises(AuthenticationError):
             adapter._get_credentials(_ACCOUNT_ID)
 
-    def test_unregister_unknown_raises_key_error(self) -> None:
+    def test_unregister_unknown_raises_key_error(self, adapter: BinanceAdapter) -> None:
 
-        adapter = BinanceAdapter(_BASE_URL, _WS_BASE_URL, _WS_API_URL)
         with pytest.raises(KeyError):
             adapter.unregister_account('nonexistent')
 
-    def test_get_credentials_unknown_raises_auth_error(self) -> None:
+    def test_get_credentials_unknown_raises_auth_error(self, adapter: BinanceAdapter) -> None:
 
-        adapter = BinanceAdapter(_BASE_URL, _WS_BASE_URL, _WS_API_URL)
         with pytest.raises(AuthenticationError, match='No credentials'):
             adapter._get_credentials('unknown')
 
@@ -379,11 +539,9 @@ class TestSigningAndAuth:
     def test_sign_params_returns_signed_query_string(self) -> None:
 
         adapter = _make_adapter()
-        query = adapter._sign_params({'symbol': 'BTCUSDT'}, _API_SECRET)
-        assert 'timestamp=' in query
-        assert '&signature=' in query
-        signature = query.split('signature=')[1]
-        assert len(signature) == _SHA256_HEX_LENGTH
+        with patch('praxis.infrastructure.binance_adapter.time.time', return_value=_FROZEN_TIME):
+            query = adapter._sign_params({'symbol': 'BTCUSDT'}, _API_SECRET)
+        assert query == f'{_FROZEN_SIGNED_PAYLOAD}&signature={_FROZEN_SIGNATURE}'
 
     def test_sign_params_preserves_original_params(self) -> None:
 
@@ -395,43 +553,65 @@ class TestSigningAndAuth:
         assert 'timestamp' not in original
         assert 'signature' not in original
 
+    def test_sign_params_signature_stable_across_calls(self) -> None:
+
+        adapter = _make_adapter()
+        with patch('praxis.infrastructure.binance_adapter.time.time', return_value=_FROZEN_TIME):
+            first = adapter._sign_params({'symbol': 'BTCUSDT'}, _API_SECRET)
+            second = adapter._sign_params({'symbol': 'BTCUSDT'}, _API_SECRET)
+        assert first == second
+        assert first.endswith(_FROZEN_SIGNATURE)
+
+    def test_sign_params_reuses_key_context(self) -> None:
+
+        adapter = _make_adapter()
+        adapter._sign_params({'symbol': 'BTCUSDT'}, _API_SECRET)
+        keyed = adapter._hmac_cache[_API_SECRET]
+        adapter._sign_params({'symbol': 'ETHUSDT'}, _API_SECRET)
+        assert adapter._hmac_cache[_API_SECRET] is keyed
+
+    def test_unregister_account_evicts_key_context(self) -> None:
+
+        adapter = _make_adapter()
+        adapter._sign_params({'symbol': 'BTCUSDT'}, _API_SECRET)
+        adapter.unregister_account(_ACCOUNT_ID)
+        assert _API_SECRET not in adapter._hmac_cache
+
+
+@_module_loop
 class TestSignedRequest:
 
-    @pytest.mark.asyncio
     async def test_url_contains_path_and_signed_params(self) -> None:
 
         adapter = _make_adapter()
         _patch_session(adapter, _mock_response(200, {'result': 'ok'}))
-        await adapter._signed_request('GET', '/api/v3/order', {'symbol': 'BTCUSDT'}, _ACCOUNT_ID)
-        call_args = adapter._session.request.call_args  # type: ignore[union-attr]
+        with patch('praxis.infrastructure.binance_adapter.time.time', return_value=_FROZEN_TIME):
+            await adapter._signed_request('GET', '/api/v3/order', {'symbol': 'BTCUSDT'}, _ACCOUNT_ID)
+        call_args = _request_calls(adapter)[-1]
         method = call_args[0][0]
         url = call_args[0][1]
         assert method == 'GET'
-        assert url.startswith(f"{_BASE_URL}/api/v3/order?")
-        assert 'symbol=BTCUSDT' in url
-        assert 'timestamp=' in url
-        assert 'signature=' in url
+        assert url == (
+            f'{_BASE_URL}/api/v3/order?{_FROZEN_SIGNED_PAYLOAD}&signature={_FROZEN_SIGNATURE}'
+        )
 
-    @pytest.mark.asyncio
     async def test_delete_method_dispatched(self) -> None:
 
         adapter = _make_adapter()
         _patch_session(adapter, _mock_response(200, {'orderId': 1, 'status': 'CANCELED'}))
         await adapter._signed_request('DELETE', '/api/v3/order', {'symbol': 'BTCUSDT'}, _ACCOUNT_ID)
-        call_args = adapter._session.request.call_args  # type: ignore[union-attr]
+        call_args = _request_calls(adapter)[-1]
         assert call_args[0][0] == 'DELETE'
 
-    @pytest.mark.asyncio
     async def test_api_key_header_sent(self) -> None:
 
         adapter = _make_adapter()
         _patch_session(adapter, _mock_response(200, {'result': 'ok'}))
         await adapter._signed_request('GET', '/api/v3/order', {}, _ACCOUNT_ID)
-        call_args = adapter._session.request.call_args  # type: ignore[union-attr]
+        call_args = _request_calls(adapter)[-1]
         headers = call_args.kwargs['headers']
         assert headers['X-MBX-APIKEY'] == _API_KEY
 
-    @pytest.mark.asyncio
     async def test_venue_error_not_wrapped(self) -> None:
 
         adapter = _make_adapter()
@@ -439,21 +619,14 @@ class TestSignedRequest:
         with pytest.raises(AuthenticationError):
             await adapter._signed_request('GET', '/api/v3/order', {}, _ACCOUNT_ID)
 
-    @pytest.mark.asyncio
+    @pytest.mark.usefixtures('sleeps')
     async def test_transport_error_wrapped_as_transient(self) -> None:
 
         adapter = _make_adapter()
-        session = MagicMock()
-        session.request = MagicMock(side_effect=aiohttp.ClientError())
-        session.closed = False
-        adapter._session = session
-        with (
-            patch('praxis.infrastructure.binance_adapter.asyncio.sleep', new_callable=AsyncMock),
-            pytest.raises(TransientError, match='Request failed'),
-        ):
+        _patch_session(adapter, aiohttp.ClientError())
+        with pytest.raises(TransientError, match='Request failed'):
             await adapter._signed_request('GET', '/api/v3/order', {}, _ACCOUNT_ID)
 
-    @pytest.mark.asyncio
     async def test_updates_weight_from_headers(self) -> None:
 
         adapter = _make_adapter()
@@ -464,7 +637,6 @@ class TestSignedRequest:
         await adapter._signed_request('GET', '/api/v3/order', {}, _ACCOUNT_ID)
         assert adapter._used_weight == 150
 
-    @pytest.mark.asyncio
     async def test_updates_order_count_from_headers(self) -> None:
 
         adapter = _make_adapter()
@@ -475,8 +647,9 @@ class TestSignedRequest:
         await adapter._signed_request('GET', '/api/v3/order', {}, _ACCOUNT_ID)
         assert adapter._order_count[_ACCOUNT_ID] == 7
 
-    @pytest.mark.asyncio
-    async def test_logs_warning_on_low_headroom(self) -> None:
+    async def test_logs_warning_on_low_headroom(
+        self, caplog: pytest.LogCaptureFixture,
+    ) -> None:
 
         adapter = _make_adapter()
         adapter._weight_limit = 1000
@@ -484,12 +657,12 @@ class TestSignedRequest:
             200, {'result': 'ok'},
             headers={'X-MBX-USED-WEIGHT-1M': '900'},
         ))
-        with patch('praxis.infrastructure.binance_adapter._log') as mock_log:
+        with caplog.at_level(logging.WARNING):
             await adapter._signed_request('GET', '/api/v3/order', {}, _ACCOUNT_ID)
-            mock_log.warning.assert_called_once()
-            assert 'headroom low' in mock_log.warning.call_args[0][0]
+        warnings = _adapter_messages(caplog, logging.WARNING)
+        assert len(warnings) == 1
+        assert 'headroom low' in warnings[0]
 
-    @pytest.mark.asyncio
     async def test_unparseable_weight_header_ignored(self) -> None:
 
         adapter = _make_adapter()
@@ -501,7 +674,6 @@ class TestSignedRequest:
         await adapter._signed_request('GET', '/api/v3/order', {}, _ACCOUNT_ID)
         assert adapter._used_weight == 50
 
-    @pytest.mark.asyncio
     async def test_missing_headers_preserve_state(self) -> None:
 
         adapter = _make_adapter()
@@ -512,328 +684,126 @@ class TestSignedRequest:
         assert adapter._used_weight == 100
         assert adapter._order_count[_ACCOUNT_ID] == 5
 
+
+@pytest.mark.usefixtures('fast_sign', 'sleeps')
+@_module_loop
 class TestRetry:
 
-    @pytest.mark.asyncio
-    async def test_succeeds_on_second_attempt(self) -> None:
+    async def test_succeeds_on_second_attempt(
+        self, sleeps: list[float], caplog: pytest.LogCaptureFixture,
+    ) -> None:
 
         adapter = _make_adapter()
-        fail_resp = _mock_response(500)
-        ok_resp = _mock_response(200, {'result': 'ok'})
-
-        fail_ctx = MagicMock()
-        fail_ctx.__aenter__ = AsyncMock(return_value=fail_resp)
-        fail_ctx.__aexit__ = AsyncMock(return_value=False)
-
-        ok_ctx = MagicMock()
-        ok_ctx.__aenter__ = AsyncMock(return_value=ok_resp)
-        ok_ctx.__aexit__ = AsyncMock(return_value=False)
+        _patch_session(adapter, _mock_response(500), _mock_response(200, {'result': 'ok'}))
 
-        session = MagicMock()
-        session.request = MagicMock(side_effect=[fail_ctx, ok_ctx])
-        session.closed = False
-        adapter._session = session
-
-        with patch('praxis.infrastructure.binance_adapter.asyncio.sleep', new_callable=AsyncMock) as mock_sleep:
+        with caplog.at_level(logging.WARNING):
             result = await adapter._signed_request('GET', '/api/v3/order', {}, _ACCOUNT_ID)
 
         assert result == {'result': 'ok'}
-        assert session.request.call_count == 2
-        mock_sleep.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_exhaustion_raises_transient_error(self) -> None:
+        assert len(_request_calls(adapter)) == 2
+        assert len(sleeps) == 1
+        assert 0 <= sleeps[0] <= 0.5
+        warnings = _adapter_messages(caplog, logging.WARNING)
+        assert len(warnings) == 1
+        assert 'attempt 1/3' in warnings[0]
+
+    async def test_exhaustion_raises_transient_error(
+        self, caplog: pytest.LogCaptureFixture,
+    ) -> None:
 
         adapter = _make_adapter()
-        fail_resp = _mock_response(500)
-
-        contexts = []
-        for _ in range(3):
-            ctx = MagicMock()
-            ctx.__aenter__ = AsyncMock(return_value=fail_resp)
-            ctx.__aexit__ = AsyncMock(return_value=False)
-            contexts.append(ctx)
-
-        session = MagicMock()
-        session.request = MagicMock(side_effect=contexts)
-        session.closed = False
-        adapter._session = session
+        _patch_session(adapter, _mock_response(500))
 
         with (
-            patch('praxis.infrastructure.binance_adapter.asyncio.sleep', new_callable=AsyncMock),
+            caplog.at_level(logging.WARNING),
             pytest.raises(TransientError, match='Venue server error'),
         ):
             await adapter._signed_request('GET', '/api/v3/order', {}, _ACCOUNT_ID)
 
-        assert session.request.call_count == 3
+        assert len(_request_calls(adapter)) == 3
+        assert len(_adapter_messages(caplog, logging.ERROR)) == 1
 
-    @pytest.mark.asyncio
     async def test_auth_error_not_retried(self) -> None:
 
         adapter = _make_adapter()
-        fail_resp = _mock_response(401)
-
-        ctx = MagicMock()
-        ctx.__aenter__ = AsyncMock(return_value=fail_resp)
-        ctx.__aexit__ = AsyncMock(return_value=False)
-
-        session = MagicMock()
-        session.request = MagicMock(return_value=ctx)
-        session.closed = False
-        adapter._session = session
+        _patch_session(adapter, _mock_response(401))
 
         with pytest.raises(AuthenticationError):
             await adapter._signed_request('GET', '/api/v3/order', {}, _ACCOUNT_ID)
 
-        assert session.request.call_count == 1
+        assert len(_request_calls(adapter)) == 1
 
-    @pytest.mark.asyncio
     async def test_order_rejected_not_retried(self) -> None:
 
         adapter = _make_adapter()
-        fail_resp = _mock_response(400, {'code': -1013, 'msg': 'Invalid quantity'})
-
-        ctx = MagicMock()
-        ctx.__aenter__ = AsyncMock(return_value=fail_resp)
-        ctx.__aexit__ = AsyncMock(return_value=False)
-
-        session = MagicMock()
-        session.request = MagicMock(return_value=ctx)
-        session.closed = False
-        adapter._session = session
+        _patch_session(adapter, _mock_response(400, {'code': -1013, 'msg': 'Invalid quantity'}))
 
         with pytest.raises(OrderRejectedError):
             await adapter._signed_request('POST', '/api/v3/order', {}, _ACCOUNT_ID)
 
-        assert session.request.call_count == 1
-
-    @pytest.mark.asyncio
-    async def test_retry_calls_asyncio_sleep(self) -> None:
-
-        adapter = _make_adapter()
-        fail_resp = _mock_response(500)
-        ok_resp = _mock_response(200, {'result': 'ok'})
-
-        fail_ctx = MagicMock()
-        fail_ctx.__aenter__ = AsyncMock(return_value=fail_resp)
-        fail_ctx.__aexit__ = AsyncMock(return_value=False)
-
-        ok_ctx = MagicMock()
-        ok_ctx.__aenter__ = AsyncMock(return_value=ok_resp)
-        ok_ctx.__aexit__ = AsyncMock(return_value=False)
-
-        session = MagicMock()
-        session.request = MagicMock(side_effect=[fail_ctx, ok_ctx])
-        session.closed = False
-        adapter._session = session
-
-        with patch('praxis.infrastructure.binance_adapter.asyncio.sleep', new_callable=AsyncMock) as mock_sleep:
-            await adapter._signed_request('GET', '/api/v3/order', {}, _ACCOUNT_ID)
-
-        mock_sleep.assert_called_once()
-        delay = mock_sleep.call_args[0][0]
-        assert 0 <= delay <= 0.5
-
-    @pytest.mark.asyncio
-    async def test_retry_logs_warning(self) -> None:
-
-        adapter = _make_adapter()
-        fail_resp = _mock_response(500)
-        ok_resp = _mock_response(200, {'result': 'ok'})
-
-        fail_ctx = MagicMock()
-        fail_ctx.__aenter__ = AsyncMock(return_value=fail_resp)
-        fail_ctx.__aexit__ = AsyncMock(return_value=False)
-
-        ok_ctx = MagicMock()
-        ok_ctx.__aenter__ = AsyncMock(return_value=ok_resp)
-        ok_ctx.__aexit__ = AsyncMock(return_value=False)
-
-        session = MagicMock()
-        session.request = MagicMock(side_effect=[fail_ctx, ok_ctx])
-        session.closed = False
-        adapter._session = session
-
-        with (
-            patch('praxis.infrastructure.binance_adapter.asyncio.sleep', new_callable=AsyncMock),
-            patch('praxis.infrastructure.binance_adapter._log') as mock_log,
-        ):
-            await adapter._signed_request('GET', '/api/v3/order', {}, _ACCOUNT_ID)
-
-        mock_log.warning.assert_called_once()
-        assert 'attempt 1/3' in mock_log.warning.call_args[0][0] % mock_log.warning.call_args[0][1:]
-
-    @pytest.mark.asyncio
-    async def test_exhaustion_logs_error(self) -> None:
-
-        adapter = _make_adapter()
-        fail_resp = _mock_response(500)
-
-        contexts = []
-        for _ in range(3):
-            ctx = MagicMock()
-            ctx.__aenter__ = AsyncMock(return_value=fail_resp)
-            ctx.__aexit__ = AsyncMock(return_value=False)
-            contexts.append(ctx)
-
-        session = MagicMock()
-        session.request = MagicMock(side_effect=contexts)
-        session.closed = False
-        adapter._session = session
-
-        with (
-            patch('praxis.infrastructure.binance_adapter.asyncio.sleep', new_callable=AsyncMock),
-            patch('praxis.infrastructure.binance_adapter._log') as mock_log,
-            pytest.raises(TransientError),
-        ):
-            await adapter._signed_request('GET', '/api/v3/order', {}, _ACCOUNT_ID)
-
-        mock_log.error.assert_called_once()
+        assert len(_request_calls(adapter)) == 1
 
-    @pytest.mark.asyncio
-    async def test_transport_error_retried(self) -> None:
+    async def test_transport_error_retried(self, sleeps: list[float]) -> None:
 
         adapter = _make_adapter()
-        ok_resp = _mock_response(200, {'result': 'ok'})
-
-        ok_ctx = MagicMock()
-        ok_ctx.__aenter__ = AsyncMock(return_value=ok_resp)
-        ok_ctx.__aexit__ = AsyncMock(return_value=False)
-
-        session = MagicMock()
-        session.request = MagicMock(side_effect=[aiohttp.ClientError('conn reset'), ok_ctx])
-        session.closed = False
-        adapter._session = session
+        _patch_session(
+            adapter, aiohttp.ClientError('conn reset'), _mock_response(200, {'result': 'ok'}),
+        )
 
-        with patch('praxis.infrastructure.binance_adapter.asyncio.sleep', new_callable=AsyncMock) as mock_sleep:
-            result = await adapter._signed_request('GET', '/api/v3/order', {}, _ACCOUNT_ID)
+        result = await adapter._signed_request('GET', '/api/v3/order', {}, _ACCOUNT_ID)
 
         assert result == {'result': 'ok'}
-        assert session.request.call_count == 2
-        mock_sleep.assert_called_once()
+        assert len(_request_calls(adapter)) == 2
+        assert len(sleeps) == 1
 
-    @pytest.mark.asyncio
-    async def test_rate_limit_retried_with_retry_after(self) -> None:
+    async def test_rate_limit_retried_with_retry_after(self, sleeps: list[float]) -> None:
 
         adapter = _make_adapter()
-        rate_resp = _mock_response(429, headers={'Retry-After': '3'})
-        ok_resp = _mock_response(200, {'result': 'ok'})
-
-        rate_ctx = MagicMock()
-        rate_ctx.__aenter__ = AsyncMock(return_value=rate_resp)
-        rate_ctx.__aexit__ = AsyncMock(return_value=False)
-
-        ok_ctx = MagicMock()
-        ok_ctx.__aenter__ = AsyncMock(return_value=ok_resp)
-        ok_ctx.__aexit__ = AsyncMock(return_value=False)
-
-        session = MagicMock()
-        session.request = MagicMock(side_effect=[rate_ctx, ok_ctx])
-        session.closed = False
-        adapter._session = session
+        _patch_session(
+            adapter,
+            _mock_response(429, headers={'Retry-After': '3'}),
+            _mock_response(200, {'result': 'ok'}),
+        )
 
-        with patch('praxis.infrastructure.binance_adapter.asyncio.sleep', new_callable=AsyncMock) as mock_sleep:
-            result = await adapter._signed_request('GET', '/api/v3/order', {}, _ACCOUNT_ID)
+        result = await adapter._signed_request('GET', '/api/v3/order', {}, _ACCOUNT_ID)
 
         assert result == {'result': 'ok'}
-        assert session.request.call_count == 2
-        mock_sleep.assert_called_once_with(3.0)
+        assert len(_request_calls(adapter)) == 2
+        assert sleeps == [3.0]
 
-    @pytest.mark.asyncio
     async def test_rate_limit_exhaustion_raises(self) -> None:
 
         adapter = _make_adapter()
-        rate_resp = _mock_response(429)
-
-        contexts = []
-        for _ in range(3):
-            ctx = MagicMock()
-            ctx.__aenter__ = AsyncMock(return_value=rate_resp)
-            ctx.__aexit__ = AsyncMock(return_value=False)
-            contexts.append(ctx)
-
-        session = MagicMock()
-        session.request = MagicMock(side_effect=contexts)
-        session.closed = False
-        adapter._session = session
+        _patch_session(adapter, _mock_response(429))
 
-        with (
-            patch('praxis.infrastructure.binance_adapter.asyncio.sleep', new_callable=AsyncMock),
-            pytest.raises(RateLimitError),
-        ):
+        with pytest.raises(RateLimitError):
             await adapter._signed_request('GET', '/api/v3/order', {}, _ACCOUNT_ID)
 
-        assert session.request.call_count == 3
+        assert len(_request_calls(adapter)) == 3
 
-    @pytest.mark.asyncio
-    async def test_rate_limit_retry_without_retry_after_uses_backoff(self) -> None:
+    async def test_rate_limit_retry_without_retry_after_uses_backoff(self, sleeps: list[float]) -> None:
 
         adapter = _make_adapter()
-        rate_resp = _mock_response(429)
-        ok_resp = _mock_response(200, {'result': 'ok'})
+        _patch_session(adapter, _mock_response(429), _mock_response(200, {'result': 'ok'}))
 
-        rate_ctx = MagicMock()
-        rate_ctx.__aenter__ = AsyncMock(return_value=rate_resp)
-        rate_ctx.__aexit__ = AsyncMock(return_value=False)
-
-        ok_ctx = MagicMock()
-        ok_ctx.__aenter__ = AsyncMock(return_value=ok_resp)
-        ok_ctx.__aexit__ = AsyncMock(return_value=False)
-
-        session = MagicMock()
-        session.request = MagicMock(side_effect=[rate_ctx, ok_ctx])
-        session.closed = False
-        adapter._session = session
-
-        with patch('praxis.infrastructure.binance_adapter.asyncio.sleep', new_callable=AsyncMock) as mock_sleep:
-            await adapter._signed_request('GET', '/api/v3/order', {}, _ACCOUNT_ID)
+        await adapter._signed_request('GET', '/api/v3/order', {}, _ACCOUNT_ID)
 
-        mock_sleep.assert_called_once()
-        delay = mock_sleep.call_args[0][0]
+        assert len(sleeps) == 1
+        delay = sleeps[0]
         assert 0 <= delay <= 0.5
 
-    @pytest.mark.asyncio
-    async def test_403_rate_limit_not_retried(self) -> None:
+    @pytest.mark.parametrize('status', [403, 418])
+    async def test_ban_status_rate_limit_not_retried(self, status: int) -> None:
 
         adapter = _make_adapter()
-        resp_403 = _mock_response(403)
-
-        ctx = MagicMock()
-        ctx.__aenter__ = AsyncMock(return_value=resp_403)
-        ctx.__aexit__ = AsyncMock(return_value=False)
-
-        session = MagicMock()
-        session.request = MagicMock(side_effect=[ctx])
-        session.closed = False
-        adapter._session = session
+        _patch_session(adapter, _mock_response(status))
 
         with pytest.raises(RateLimitError, match='Rate limited'):
             await adapter._signed_request('GET', '/api/v3/order', {}, _ACCOUNT_ID)
 
-        session.request.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_418_rate_limit_not_retried(self) -> None:
-
-        adapter = _make_adapter()
-        resp_418 = _mock_response(418)
+        assert len(_request_calls(adapter)) == 1
 
-        ctx = MagicMock()
-        ctx.__aenter__ = AsyncMock(return_value=resp_418)
-        ctx.__aexit__ = AsyncMock(return_value=False)
-
-        session = MagicMock()
-        session.request = MagicMock(side_effect=[ctx])
-        session.closed = False
-        adapter._session = session
-
-        with pytest.raises(RateLimitError, match='Rate limited'):
-            await adapter._signed_request('GET', '/api/v3/order', {}, _ACCOUNT_ID)
-
-        session.request.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_non_idempotent_429_reraised_immediately(self) -> None:
+    async def test_non_idempotent_429_reraised_immediately(self, sleeps: list[float]) -> None:
         '''Round-18 MAJOR-002: with `idempotent=False` (`max_attempts=1`)
         a HTTP 429 must re-raise as `RateLimitError` on the first
         attempt rather than fall through the loop and surface as a
@@ -844,39 +814,23 @@ class TestRetry:
         '''
 
         adapter = _make_adapter()
-        rate_resp = _mock_response(429, headers={'Retry-After': '1'})
-
-        ctx = MagicMock()
-        ctx.__aenter__ = AsyncMock(return_value=rate_resp)
-        ctx.__aexit__ = AsyncMock(return_value=False)
+        _patch_session(adapter, _mock_response(429, headers={'Retry-After': '1'}))
 
-        session = MagicMock()
-        session.request = MagicMock(side_effect=[ctx])
-        session.closed = False
-        adapter._session = session
-
-        with (
-            patch(
-                'praxis.infrastructure.binance_adapter.asyncio.sleep',
-                new_callable=AsyncMock,
-            ) as mock_sleep,
-            pytest.raises(RateLimitError),
-        ):
+        with pytest.raises(RateLimitError):
             await adapter._signed_request(
                 'POST', '/api/v3/order', {}, _ACCOUNT_ID, idempotent=False,
             )
 
-        session.request.assert_called_once()
-        mock_sleep.assert_not_called()
+        assert len(_request_calls(adapter)) == 1
+        assert sleeps == []
 
 
 class TestBuildOrderParams:
 
-    def test_market_order(self) -> None:
+    def test_market_order(self, adapter: BinanceAdapter) -> None:
 
-        adapter = _make_adapter()
         params = adapter._build_order_params(
-            'BTCUSDT', OrderSide.BUY, OrderType.MARKET, Decimal('0.5'),
+            'BTCUSDT', OrderSide.BUY, OrderType.MARKET, _QTY_HALF,
         )
         assert params['type'] == 'MARKET'
         assert params['symbol'] == 'BTCUSDT'
@@ -886,114 +840,102 @@ class TestBuildOrderParams:
         assert 'price' not in params
         assert 'timeInForce' not in params
 
-    def test_limit_order_defaults_gtc(self) -> None:
-
-        adapter = _make_adapter()
-        params = adapter._build_order_params(
-            'BTCUSDT', OrderSide.SELL, OrderType.LIMIT, Decimal('1.0'),
-            price=Decimal('50000'),
-        )
-        assert params['type'] == 'LIMIT'
-        assert params['price'] == '50000'
-        assert params['timeInForce'] == 'GTC'
-
-    def test_limit_order_custom_tif(self) -> None:
-
-        adapter = _make_adapter()
-        params = adapter._build_order_params(
-            'BTCUSDT', OrderSide.BUY, OrderType.LIMIT, Decimal('1.0'),
-            price=Decimal('50000'), time_in_force='FOK',
-        )
-        assert params['timeInForce'] == 'FOK'
-
-    def test_limit_ioc_order(self) -> None:
-
-        adapter = _make_adapter()
-        params = adapter._build_order_params(
-            'BTCUSDT', OrderSide.BUY, OrderType.LIMIT_IOC, Decimal('1.0'),
-            price=Decimal('50000'),
-        )
-        assert params['type'] == 'LIMIT'
-        assert params['price'] == '50000'
-        assert params['timeInForce'] == 'IOC'
-
-    def test_limit_ioc_forces_ioc(self) -> None:
-
-        adapter = _make_adapter()
-        params = adapter._build_order_params(
-            'BTCUSDT', OrderSide.BUY, OrderType.LIMIT_IOC, Decimal('1.0'),
-            price=Decimal('50000'), time_in_force='GTC',
-        )
-        assert params['timeInForce'] == 'IOC'
-
-    def test_limit_missing_price_raises(self) -> None:
-
-        adapter = _make_adapter()
-        with pytest.raises(ValueError, match='price is required for LIMIT'):
-            adapter._build_order_params(
-                'BTCUSDT', OrderSide.BUY, OrderType.LIMIT, Decimal('1.0'),
-            )
-
-    def test_limit_ioc_missing_price_raises(self) -> None:
-
-        adapter = _make_adapter()
-        with pytest.raises(ValueError, match='price is required for LIMIT_IOC'):
-            adapter._build_order_params(
-                'BTCUSDT', OrderSide.BUY, OrderType.LIMIT_IOC, Decimal('1.0'),
-            )
-
-    def test_unsupported_order_type_raises(self) -> None:
+    @pytest.mark.parametrize(
+        ('args', 'kwargs', 'expected'),
+        [
+            pytest.param(
+                (OrderSide.SELL, OrderType.LIMIT, _QTY_ONE), {'price': _PRICE_50K},
+                {'type': 'LIMIT', 'price': '50000', 'timeInForce': 'GTC'},
+                id='limit-defaults-gtc',
+            ),
+            pytest.param(
+                (OrderSide.BUY, OrderType.LIMIT, _QTY_ONE),
+                {'price': _PRICE_50K, 'time_in_force': 'FOK'},
+                {'timeInForce': 'FOK'},
+                id='limit-custom-tif',
+            ),
+            pytest.param(
+                (OrderSide.BUY, OrderType.LIMIT_IOC, _QTY_ONE), {'price': _PRICE_50K},
+                {'type': 'LIMIT', 'price': '50000', 'timeInForce': 'IOC'},
+                id='limit-ioc',
+            ),
+            pytest.param(
+                (OrderSide.BUY, OrderType.LIMIT_IOC, _QTY_ONE),
+                {'price': _PRICE_50K, 'time_in_force': 'GTC'},
+                {'timeInForce': 'IOC'},
+                id='limit-ioc-forces-ioc',
+            ),
+            pytest.param(
+                (OrderSide.BUY, OrderType.MARKET, _QTY_ONE),
+                {'client_order_id': 'new_order-cmd1-0'},
+                {'newClientOrderId': 'new_order-cmd1-0'},
+                id='client-order-id',
+            ),
+            pytest.param(
+                (OrderSide.BUY, OrderType.LIMIT, Decimal('0.00100')),
+                {'price': Decimal('50000.50')},
+                {'quantity': '0.00100', 'price': '50000.50'},
+                id='decimal-serialization',
+            ),
+            pytest.param(
+                (OrderSide.BUY, OrderType.LIMIT, Decimal('1E-7')),
+                {'price': Decimal('1E+4')},
+                {'quantity': '0.0000001', 'price': '10000'},
+                id='decimal-no-scientific-notation',
+            ),
+        ],
+    )
+    def test_params(
+        self,
+        adapter: BinanceAdapter,
+        args: tuple[OrderSide, OrderType, Decimal],
+        kwargs: dict[str, Any],
+        expected: dict[str, str],
+    ) -> None:
 
-        adapter = _make_adapter()
-        with pytest.raises(ValueError, match='Unsupported order type'):
-            adapter._build_order_params(
-                'BTCUSDT', OrderSide.BUY, OrderType.STOP, Decimal('1.0'),
-            )
+        params = adapter._build_order_params('BTCUSDT', *args, **kwargs)
+        assert expected.items() <= params.items()
 
-    def test_stop_price_raises(self) -> None:
+    @pytest.mark.parametrize(
+        ('order_type', 'kwargs', 'match'),
+        [
+            pytest.param(
+                OrderType.LIMIT, {}, 'price is required for LIMIT',
+                id='limit-missing-price',
+            ),
+            pytest.param(
+                OrderType.LIMIT_IOC, {}, 'price is required for LIMIT_IOC',
+                id='limit-ioc-missing-price',
+            ),
+            pytest.param(
+                OrderType.STOP, {}, 'Unsupported order type',
+                id='unsupported-order-type',
+            ),
+            pytest.param(
+                OrderType.MARKET, {'stop_price': Decimal('49000')},
+                'stop_price is not supported',
+                id='stop-price',
+            ),
+        ],
+    )
+    def test_invalid_params_raise(
+        self,
+        adapter: BinanceAdapter,
+        order_type: OrderType,
+        kwargs: dict[str, Any],
+        match: str,
+    ) -> None:
 
-        adapter = _make_adapter()
-        with pytest.raises(ValueError, match='stop_price is not supported'):
+        with pytest.raises(ValueError, match=match):
             adapter._build_order_params(
-                'BTCUSDT', OrderSide.BUY, OrderType.MARKET, Decimal('1.0'),
-                stop_price=Decimal('49000'),
+                'BTCUSDT', OrderSide.BUY, order_type, _QTY_ONE, **kwargs,
             )
 
-    def test_client_order_id_included(self) -> None:
-
-        adapter = _make_adapter()
-        params = adapter._build_order_params(
-            'BTCUSDT', OrderSide.BUY, OrderType.MARKET, Decimal('1.0'),
-            client_order_id='new_order-cmd1-0',
-        )
-        assert params['newClientOrderId'] == 'new_order-cmd1-0'
-
-    def test_decimal_serialization(self) -> None:
-
-        adapter = _make_adapter()
-        params = adapter._build_order_params(
-            'BTCUSDT', OrderSide.BUY, OrderType.LIMIT, Decimal('0.00100'),
-            price=Decimal('50000.50'),
-        )
-        assert params['quantity'] == '0.00100'
-        assert params['price'] == '50000.50'
-
-    def test_decimal_scientific_notation_avoided(self) -> None:
-
-        adapter = _make_adapter()
-        params = adapter._build_order_params(
-            'BTCUSDT', OrderSide.BUY, OrderType.LIMIT, Decimal('1E-7'),
-            price=Decimal('1E+4'),
-        )
-        assert params['quantity'] == '0.0000001'
-        assert params['price'] == '10000'
-
 
 class TestBuildQuoteNativeMarketParams:
 
-    def test_basic_quote_native_buy(self) -> None:
+    def test_basic_quote_native_buy(self, adapter: BinanceAdapter) -> None:
 
-        adapter = _make_adapter()
         params = adapter._build_quote_native_market_params(
             'BTCUSDT', OrderSide.BUY, Decimal('100'),
             client_order_id='quote_native-cmd1-0',
@@ -1007,9 +949,8 @@ class TestBuildQuoteNativeMarketParams:
         assert params['newClientOrderId'] == 'quote_native-cmd1-0'
         assert 'quantity' not in params
 
-    def test_quote_qty_decimal_scientific_notation_avoided(self) -> None:
+    def test_quote_qty_decimal_scientific_notation_avoided(self, adapter: BinanceAdapter) -> None:
 
-        adapter = _make_adapter()
         params = adapter._build_quote_native_market_params(
             'BTCUSDT', OrderSide.BUY, Decimal('1E+5'),
             client_order_id='quote_native-cmd2-0',
@@ -1017,9 +958,8 @@ class TestBuildQuoteNativeMarketParams:
 
         assert params['quoteOrderQty'] == '100000'
 
-    def test_quote_qty_decimal_fractional_preserved(self) -> None:
+    def test_quote_qty_decimal_fractional_preserved(self, adapter: BinanceAdapter) -> None:
 
-        adapter = _make_adapter()
         params = adapter._build_quote_native_market_params(
             'BTCUSDT', OrderSide.BUY, Decimal('99.95'),
             client_order_id='quote_native-cmd3-0',
@@ -1027,154 +967,136 @@ class TestBuildQuoteNativeMarketParams:
 
         assert params['quoteOrderQty'] == '99.95'
 
-    def test_submit_order_quote_qty_rejects_non_market(self) -> None:
+    @_module_loop
+    async def test_submit_order_quote_qty_rejects_non_market(self, adapter: BinanceAdapter) -> None:
 
-        adapter = _make_adapter()
         with pytest.raises(ValueError, match='quote_qty is only supported for MARKET'):
-            asyncio.run(
-                adapter.submit_order(
-                    _ACCOUNT_ID,
-                    'BTCUSDT',
-                    OrderSide.BUY,
-                    OrderType.LIMIT,
-                    None,
-                    quote_qty=Decimal('100'),
-                    client_order_id='x',
-                ),
+            await adapter.submit_order(
+                _ACCOUNT_ID,
+                'BTCUSDT',
+                OrderSide.BUY,
+                OrderType.LIMIT,
+                None,
+                quote_qty=_QUOTE_QTY_100,
+                client_order_id='x',
             )
 
-    def test_submit_order_quote_qty_rejects_sell(self) -> None:
+    @_module_loop
+    async def test_submit_order_quote_qty_rejects_sell(self, adapter: BinanceAdapter) -> None:
 
-        adapter = _make_adapter()
         with pytest.raises(ValueError, match='quote_qty is only supported for BUY'):
-            asyncio.run(
-                adapter.submit_order(
-                    _ACCOUNT_ID,
-                    'BTCUSDT',
-                    OrderSide.SELL,
-                    OrderType.MARKET,
-                    None,
-                    quote_qty=Decimal('100'),
-                    client_order_id='x',
-                ),
+            await adapter.submit_order(
+                _ACCOUNT_ID,
+                'BTCUSDT',
+                OrderSide.SELL,
+                OrderType.MARKET,
+                None,
+                quote_qty=_QUOTE_QTY_100,
+                client_order_id='x',
             )
 
-    def test_submit_order_rejects_both_qty_and_quote_qty(self) -> None:
+    @_module_loop
+    async def test_submit_order_rejects_both_qty_and_quote_qty(self, adapter: BinanceAdapter) -> None:
 
-        adapter = _make_adapter()
         with pytest.raises(ValueError, match='exactly one of qty or quote_qty'):
-            asyncio.run(
-                adapter.submit_order(
-                    _ACCOUNT_ID,
-                    'BTCUSDT',
-                    OrderSide.BUY,
-                    OrderType.MARKET,
-                    Decimal('0.001'),
-                    quote_qty=Decimal('100'),
-                    client_order_id='x',
-                ),
+            await adapter.submit_order(
+                _ACCOUNT_ID,
+                'BTCUSDT',
+                OrderSide.BUY,
+                OrderType.MARKET,
+                Decimal('0.001'),
+                quote_qty=_QUOTE_QTY_100,
+                client_order_id='x',
             )
 
-    def test_submit_order_rejects_neither_qty_nor_quote_qty(self) -> None:
+    @_module_loop
+    async def test_submit_order_rejects_neither_qty_nor_quote_qty(self, adapter: BinanceAdapter) -> None:
 
-        adapter = _make_adapter()
         with pytest.raises(ValueError, match='submit_order requires qty or quote_qty'):
-            asyncio.run(
-                adapter.submit_order(
-                    _ACCOUNT_ID,
-                    'BTCUSDT',
-                    OrderSide.BUY,
-                    OrderType.MARKET,
-                    None,
-                    client_order_id='x',
-                ),
+            await adapter.submit_order(
+                _ACCOUNT_ID,
+                'BTCUSDT',
+                OrderSide.BUY,
+                OrderType.MARKET,
+                None,
+                client_order_id='x',
             )
 
     @pytest.mark.parametrize(
         'bad',
         [Decimal('NaN'), Decimal('Infinity'), Decimal('-Infinity')],
     )
-    def test_submit_order_rejects_non_finite_quote_qty(self, bad: Decimal) -> None:
+    @_module_loop
+    async def test_submit_order_rejects_non_finite_quote_qty(self, adapter: BinanceAdapter, bad: Decimal) -> None:
 
-        adapter = _make_adapter()
         with pytest.raises(ValueError, match='quote_qty must be a finite positive Decimal'):
-            asyncio.run(
-                adapter.submit_order(
-                    _ACCOUNT_ID,
-                    'BTCUSDT',
-                    OrderSide.BUY,
-                    OrderType.MARKET,
-                    None,
-                    quote_qty=bad,
-                    client_order_id='x',
-                ),
+            await adapter.submit_order(
+                _ACCOUNT_ID,
+                'BTCUSDT',
+                OrderSide.BUY,
+                OrderType.MARKET,
+                None,
+                quote_qty=bad,
+                client_order_id='x',
             )
 
     @pytest.mark.parametrize('bad', [Decimal('0'), Decimal('-1')])
-    def test_submit_order_rejects_non_positive_quote_qty(self, bad: Decimal) -> None:
+    @_module_loop
+    async def test_submit_order_rejects_non_positive_quote_qty(self, adapter: BinanceAdapter, bad: Decimal) -> None:
 
-        adapter = _make_adapter()
         with pytest.raises(ValueError, match='quote_qty must be a finite positive Decimal'):
-            asyncio.run(
-                adapter.submit_order(
-                    _ACCOUNT_ID,
-                    'BTCUSDT',
-                    OrderSide.BUY,
-                    OrderType.MARKET,
-                    None,
-                    quote_qty=bad,
-                    client_order_id='x',
-                ),
+            await adapter.submit_order(
+                _ACCOUNT_ID,
+                'BTCUSDT',
+                OrderSide.BUY,
+                OrderType.MARKET,
+                None,
+                quote_qty=bad,
+                client_order_id='x',
             )
 
-    def test_submit_order_rejects_non_decimal_quote_qty(self) -> None:
+    @_module_loop
+    async def test_submit_order_rejects_non_decimal_quote_qty(self, adapter: BinanceAdapter) -> None:
 
-        adapter = _make_adapter()
         with pytest.raises(ValueError, match='quote_qty must be a finite positive Decimal'):
-            asyncio.run(
-                adapter.submit_order(
-                    _ACCOUNT_ID,
-                    'BTCUSDT',
-                    OrderSide.BUY,
-                    OrderType.MARKET,
-                    None,
-                    quote_qty=100,  # type: ignore[arg-type]
-                    client_order_id='x',
-                ),
+            await adapter.submit_order(
+                _ACCOUNT_ID,
+                'BTCUSDT',
+                OrderSide.BUY,
+                OrderType.MARKET,
+                None,
+                quote_qty=100,  # type: ignore[arg-type]
+                client_order_id='x',
             )
 
-    def test_submit_order_quote_qty_rejects_price(self) -> None:
+    @_module_loop
+    async def test_submit_order_quote_qty_rejects_price(self, adapter: BinanceAdapter) -> None:
 
-        adapter = _make_adapter()
         with pytest.raises(ValueError, match='price is not supported with quote_qty'):
-            asyncio.run(
-                adapter.submit_order(
-                    _ACCOUNT_ID,
-                    'BTCUSDT',
-                    OrderSide.BUY,
-                    OrderType.MARKET,
-                    None,
-                    price=Decimal('50000'),
-                    quote_qty=Decimal('100'),
-                    client_order_id='x',
-                ),
+            await adapter.submit_order(
+                _ACCOUNT_ID,
+                'BTCUSDT',
+                OrderSide.BUY,
+                OrderType.MARKET,
+                None,
+                price=_PRICE_50K,
+                quote_qty=_QUOTE_QTY_100,
+                client_order_id='x',
             )
 
-    def test_submit_order_quote_qty_rejects_time_in_force(self) -> None:
+    @_module_loop
+    async def test_submit_order_quote_qty_rejects_time_in_force(self, adapter: BinanceAdapter) -> None:
 
-        adapter = _make_adapter()
         with pytest.raises(ValueError, match='time_in_force is not supported with quote_qty'):
-            asyncio.run(
-                adapter.submit_order(
-                    _ACCOUNT_ID,
-                    'BTCUSDT',
-                    OrderSide.BUY,
-                    OrderType.MARKET,
-                    None,
-                    time_in_force='GTC',
-                    quote_qty=Decimal('100'),
-                    client_order_id='x',
-                ),
+            await adapter.submit_order(
+                _ACCOUNT_ID,
+                'BTCUSDT',
+                OrderSide.BUY,
+                OrderType.MARKET,
+                None,
+                time_in_force='GTC',
+                quote_qty=_QUOTE_QTY_100,
+                client_order_id='x',
             )
 
 
@@ -1182,248 +1104,231 @@ class TestMapOrderStatus:
 
     @pytest.mark.parametrize(
         ('binance_status', 'expected'),
-        [
-            ('NEW', OrderStatus.OPEN),
-            ('PARTIALLY_FILLED', OrderStatus.PARTIALLY_FILLED),
-            ('FILLED', OrderStatus.FILLED),
-            ('CANCELED', OrderStatus.CANCELED),
-            ('REJECTED', OrderStatus.REJECTED),
-            ('EXPIRED', OrderStatus.EXPIRED),
-            ('EXPIRED_IN_MATCH', OrderStatus.EXPIRED),
-        ],
+        _STATUS_CASES,
     )
     def test_known_statuses(
-        self, binance_status: str, expected: OrderStatus,
+        self, adapter: BinanceAdapter, binance_status: str, expected: OrderStatus,
     ) -> None:
 
-        adapter = _make_adapter()
         assert adapter._map_order_status(binance_status) == expected
 
-    def test_unknown_status_raises(self) -> None:
+    def test_unknown_status_raises(self, adapter: BinanceAdapter) -> None:
 
-        adapter = _make_adapter()
         with pytest.raises(ValueError, match='Unknown Binance order status'):
             adapter._map_order_status('IMAGINARY')
 
+
+class TestMapOrderSide:
+
+    @pytest.mark.parametrize(
+        ('binance_side', 'expected'),
+        [('BUY', OrderSide.BUY), ('SELL', OrderSide.SELL)],
+    )
+    def test_known_sides(self, adapter: BinanceAdapter, binance_side: str, expected: OrderSide) -> None:
+
+        assert adapter._map_order_side(binance_side) is expected
+
+    def test_unknown_side_raises(self, adapter: BinanceAdapter) -> None:
+
+        with pytest.raises(ValueError, match='Unknown Binance order side'):
+            adapter._map_order_side('HOLD')
+
+
 class TestMapOrderType:
 
-    def test_market(self) -> None:
+    def test_market(self, adapter: BinanceAdapter) -> None:
 
-        adapter = _make_adapter()
         assert adapter._map_order_type('MARKET', 'GTC') == OrderType.MARKET
 
-    def test_limit_gtc(self) -> None:
+    def test_limit_gtc(self, adapter: BinanceAdapter) -> None:
 
-        adapter = _make_adapter()
         assert adapter._map_order_type('LIMIT', 'GTC') == OrderType.LIMIT
 
-    def test_limit_ioc(self) -> None:
+    def test_limit_ioc(self, adapter: BinanceAdapter) -> None:
 
-        adapter = _make_adapter()
         assert adapter._map_order_type('LIMIT', 'IOC') == OrderType.LIMIT_IOC
 
-    def test_limit_fok(self) -> None:
+    def test_limit_fok(self, adapter: BinanceAdapter) -> None:
 
-        adapter = _make_adapter()
         assert adapter._map_order_type('LIMIT', 'FOK') == OrderType.LIMIT_IOC
 
-    def test_limit_maker(self) -> None:
+    def test_limit_maker(self, adapter: BinanceAdapter) -> None:
 
-        adapter = _make_adapter()
         assert adapter._map_order_type('LIMIT_MAKER', 'GTC') == OrderType.LIMIT
 
-    def test_stop_loss(self) -> None:
+    def test_stop_loss(self, adapter: BinanceAdapter) -> None:
 
-        adapter = _make_adapter()
         assert adapter._map_order_type('STOP_LOSS', 'GTC') == OrderType.STOP
 
-    def test_stop_loss_limit(self) -> None:
+    def test_stop_loss_limit(self, adapter: BinanceAdapter) -> None:
 
-        adapter = _make_adapter()
         assert adapter._map_order_type('STOP_LOSS_LIMIT', 'GTC') == OrderType.STOP_LIMIT
 
-    def test_take_profit(self) -> None:
+    def test_take_profit(self, adapter: BinanceAdapter) -> None:
 
-        adapter = _make_adapter()
         assert adapter._map_order_type('TAKE_PROFIT', 'GTC') == OrderType.TAKE_PROFIT
 
-    def test_take_profit_limit(self) -> None:
+    def test_take_profit_limit(self, adapter: BinanceAdapter) -> None:
 
-        adapter = _make_adapter()
         assert adapter._map_order_type('TAKE_PROFIT_LIMIT', 'GTC') == OrderType.TP_LIMIT
 
-    def test_oco(self) -> None:
+    def test_oco(self, adapter: BinanceAdapter) -> None:
 
-        adapter = _make_adapter()
         assert adapter._map_order_type('OCO', '') == OrderType.OCO
 
-    def test_unknown_type_raises(self) -> None:
+    def test_unknown_type_raises(self, adapter: BinanceAdapter) -> None:
 
-        adapter = _make_adapter()
         with pytest.raises(ValueError, match='Unknown Binance order type'):
             adapter._map_order_type('TRAILING_STOP', 'GTC')
 
 
 class TestParseSubmitResponse:
 
-    def test_filled_with_fills(self) -> None:
+    @pytest.mark.parametrize(
+        ('payload', 'status', 'fill_count'),
+        [
+            (_BINANCE_FILLED_RESPONSE, OrderStatus.FILLED, 1),
+            (_BINANCE_NEW_RESPONSE, OrderStatus.OPEN, 0),
+            (_BINANCE_EXPIRED_RESPONSE, OrderStatus.EXPIRED, 0),
+        ],
+    )
+    def test_status_and_fill_count(
+        self,
+        adapter: BinanceAdapter,
+        payload: Mapping[str, Any],
+        status: OrderStatus,
+        fill_count: int,
+    ) -> None:
 
-        adapter = _make_adapter()
-        result = adapter._parse_submit_response(_BINANCE_FILLED_RESPONSE)
+        result = adapter._parse_submit_response(payload)
         assert result.venue_order_id == _VENUE_ORDER_ID
-        assert result.status == OrderStatus.FILLED
-        assert len(result.immediate_fills) == 1
+        assert result.status == status
+        assert len(result.immediate_fills) == fill_count
+
+    def test_fill_fields(self, adapter: BinanceAdapter) -> None:
+
+        result = adapter._parse_submit_response(_BINANCE_FILLED_RESPONSE)
         fill = result.immediate_fills[0]
         assert fill.venue_trade_id == _VENUE_TRADE_ID
-        assert fill.qty == Decimal('0.5')
+        assert fill.qty == _QTY_HALF
         assert fill.price == Decimal('50000.00')
         assert fill.fee == Decimal('0.001')
         assert fill.fee_asset == 'BTC'
         assert fill.is_maker is False
 
-    def test_new_no_fills(self) -> None:
-
-        adapter = _make_adapter()
-        result = adapter._parse_submit_response(_BINANCE_NEW_RESPONSE)
-        assert result.venue_order_id == _VENUE_ORDER_ID
-        assert result.status == OrderStatus.OPEN
-        assert result.immediate_fills == ()
-
-    def test_expired_no_fills(self) -> None:
-
-        adapter = _make_adapter()
-        result = adapter._parse_submit_response(_BINANCE_EXPIRED_RESPONSE)
-        assert result.status == OrderStatus.EXPIRED
-        assert result.immediate_fills == ()
 
 class TestParseVenueOrder:
 
-    def test_limit_order(self) -> None:
+    @pytest.mark.parametrize(
+        ('payload', 'expected'),
+        [
+            pytest.param(
+                _BINANCE_LIMIT_ORDER_RESPONSE,
+                {
+                    'status': OrderStatus.OPEN,
+                    'side': OrderSide.BUY,
+                    'order_type': OrderType.LIMIT,
+                    'qty': _QTY_ONE,
+                    'filled_qty': Decimal('0.0'),
+                    'price': Decimal('50000.0'),
+                },
+                id='limit',
+            ),
+            pytest.param(
+                _BINANCE_MARKET_ORDER_RESPONSE,
+                {
+                    'status': OrderStatus.FILLED,
+                    'side': OrderSide.SELL,
+                    'order_type': OrderType.MARKET,
+                    'qty': _QTY_HALF,
+                    'filled_qty': _QTY_HALF,
+                    'price': None,
+                },
+                id='market-price-none',
+            ),
+            pytest.param(
+                _BINANCE_LIMIT_IOC_ORDER_RESPONSE,
+                {
+                    'status': OrderStatus.EXPIRED,
+                    'side': OrderSide.BUY,
+                    'order_type': OrderType.LIMIT_IOC,
+                    'qty': _QTY_ONE,
+                    'filled_qty': Decimal('0.3'),
+                    'price': Decimal('50000.0'),
+                },
+                id='limit-ioc',
+            ),
+        ],
+    )
+    def test_field_mapping(
+        self,
+        adapter: BinanceAdapter,
+        payload: Mapping[str, Any],
+        expected: dict[str, Any],
+    ) -> None:
 
-        adapter = _make_adapter()
-        result = adapter._parse_venue_order(_BINANCE_LIMIT_ORDER_RESPONSE)
+        result = adapter._parse_venue_order(payload)
         assert isinstance(result, VenueOrder)
         assert result.venue_order_id == _VENUE_ORDER_ID
         assert result.client_order_id == 'my-client-id'
-        assert result.status == OrderStatus.OPEN
         assert result.symbol == 'BTCUSDT'
-        assert result.side == OrderSide.BUY
-        assert result.order_type == OrderType.LIMIT
-        assert result.qty == Decimal('1.0')
-        assert result.filled_qty == Decimal('0.0')
-        assert result.price == Decimal('50000.0')
+        assert {field: getattr(result, field) for field in expected} == expected
 
-    def test_market_order_price_is_none(self) -> None:
+    def test_parsed_order_is_slotted(self, adapter: BinanceAdapter) -> None:
 
-        adapter = _make_adapter()
-        result = adapter._parse_venue_order(_BINANCE_MARKET_ORDER_RESPONSE)
-        assert result.order_type == OrderType.MARKET
-        assert result.price is None
-        assert result.side == OrderSide.SELL
-        assert result.status == OrderStatus.FILLED
-        assert result.filled_qty == Decimal('0.5')
-
-    def test_limit_ioc_order(self) -> None:
-
-        adapter = _make_adapter()
-        result = adapter._parse_venue_order(_BINANCE_LIMIT_IOC_ORDER_RESPONSE)
-        assert result.order_type == OrderType.LIMIT_IOC
-        assert result.status == OrderStatus.EXPIRED
-        assert result.filled_qty == Decimal('0.3')
-        assert result.price == Decimal('50000.0')
+        result = adapter._parse_venue_order(_BINANCE_LIMIT_ORDER_RESPONSE)
+        assert not hasattr(result, '__dict__')
 
 
+@_module_loop
 class TestRaiseOnError:
 
-    @pytest.mark.asyncio
-    async def test_success_does_not_raise(self) -> None:
-
-        adapter = _make_adapter()
-        await adapter._raise_on_error(_mock_response(200))
-
-    @pytest.mark.asyncio
-    async def test_401_raises_auth_error(self) -> None:
-
-        adapter = _make_adapter()
-        with pytest.raises(AuthenticationError, match='Authentication failed'):
-            await adapter._raise_on_error(_mock_response(401))
-
-    @pytest.mark.asyncio
-    async def test_403_raises_rate_limit_error(self) -> None:
-
-        adapter = _make_adapter()
-        with pytest.raises(RateLimitError, match='Rate limited'):
-            await adapter._raise_on_error(_mock_response(403))
-
-    @pytest.mark.asyncio
-    async def test_418_raises_rate_limit_error(self) -> None:
-
-        adapter = _make_adapter()
-        with pytest.raises(RateLimitError, match='Rate limited'):
-            await adapter._raise_on_error(_mock_response(418))
-
-    @pytest.mark.asyncio
-    async def test_429_raises_rate_limit_error(self) -> None:
-
-        adapter = _make_adapter()
-        with pytest.raises(RateLimitError, match='Rate limited'):
-            await adapter._raise_on_error(_mock_response(429))
-
-    @pytest.mark.asyncio
-    async def test_429_parses_retry_after_header(self) -> None:
-
-        adapter = _make_adapter()
-        resp = _mock_response(429, headers={'Retry-After': '45'})
-        with pytest.raises(RateLimitError) as exc_info:
-            await adapter._raise_on_error(resp)
-        assert exc_info.value.retry_after == 45.0
-
-    @pytest.mark.asyncio
-    async def test_429_without_retry_after_sets_none(self) -> None:
-
-        adapter = _make_adapter()
-        with pytest.raises(RateLimitError) as exc_info:
-            await adapter._raise_on_error(_mock_response(429))
-        assert exc_info.value.retry_after is None
-
-    @pytest.mark.asyncio
-    async def test_429_sets_status_code(self) -> None:
+    async def test_success_does_not_raise(self, adapter: BinanceAdapter) -> None:
 
-        adapter = _make_adapter()
-        with pytest.raises(RateLimitError) as exc_info:
-            await adapter._raise_on_error(_mock_response(429))
-        assert exc_info.value.status_code == 429
+        await adapter._raise_on_error(_mock_response(200))
 
-    @pytest.mark.asyncio
-    async def test_non_finite_retry_after_treated_as_none(self) -> None:
+    @pytest.mark.parametrize(
+        ('status', 'exc_type', 'match'),
+        [
+            (401, AuthenticationError, 'Authentication failed'),
+            (403, RateLimitError, 'Rate limited'),
+            (418, RateLimitError, 'Rate limited'),
+            (429, RateLimitError, 'Rate limited'),
+            (500, TransientError, 'Venue server error'),
+        ],
+    )
+    async def test_status_raises(
+        self, adapter: BinanceAdapter, status: int, exc_type: type[VenueError], match: str,
+    ) -> None:
 
-        adapter = _make_adapter()
-        for val in ['NaN', 'inf', '-inf']:
-            resp = _mock_response(429, headers={'Retry-After': val})
-            with pytest.raises(RateLimitError) as exc_info:
-                await adapter._raise_on_error(resp)
-            assert exc_info.value.retry_after is None, f"Expected None for Retry-After={val!r}"
+        with pytest.raises(exc_type, match=match):
+            await adapter._raise_on_error(_mock_response(status))
 
-    @pytest.mark.asyncio
-    async def test_negative_retry_after_treated_as_none(self) -> None:
+    @pytest.mark.parametrize(
+        ('headers', 'retry_after'),
+        [
+            pytest.param({'Retry-After': '45'}, 45.0, id='parsed'),
+            pytest.param(None, None, id='missing'),
+            pytest.param({'Retry-After': 'NaN'}, None, id='nan'),
+            pytest.param({'Retry-After': 'inf'}, None, id='inf'),
+            pytest.param({'Retry-After': '-inf'}, None, id='negative-inf'),
+            pytest.param({'Retry-After': '-5'}, None, id='negative'),
+        ],
+    )
+    async def test_429_retry_after(
+        self,
+        adapter: BinanceAdapter,
+        headers: dict[str, str] | None,
+        retry_after: float | None,
+    ) -> None:
 
-        adapter = _make_adapter()
-        resp = _mock_response(429, headers={'Retry-After': '-5'})
         with pytest.raises(RateLimitError) as exc_info:
-            await adapter._raise_on_error(resp)
-        assert exc_info.value.retry_after is None
-
-    @pytest.mark.asyncio
-    async def test_500_raises_transient_error(self) -> None:
-
-        adapter = _make_adapter()
-        with pytest.raises(TransientError, match='Venue server error'):
-            await adapter._raise_on_error(_mock_response(500))
+            await adapter._raise_on_error(_mock_response(429, headers=headers))
+        assert exc_info.value.retry_after == retry_after
+        assert exc_info.value.status_code == 429
 
-    @pytest.mark.asyncio
-    async def test_400_with_json_raises_order_rejected(self) -> None:
+    async def test_400_with_json_raises_order_rejected(self, adapter: BinanceAdapter) -> None:
 
-        adapter = _make_adapter()
         response = _mock_response(400, {
             'code': _BINANCE_REJECTION_CODE,
             'msg': _BINANCE_REJECTION_MSG,
@@ -1433,292 +1338,385 @@ class TestRaiseOnError:
         assert exc_info.value.venue_code == _BINANCE_REJECTION_CODE
         assert exc_info.value.reason == _BINANCE_REJECTION_MSG
 
-    @pytest.mark.asyncio
-    async def test_400_with_bad_json_falls_back(self) -> None:
+    async def test_400_with_bad_json_falls_back(self, adapter: BinanceAdapter) -> None:
 
-        adapter = _make_adapter()
         with pytest.raises(OrderRejectedError) as exc_info:
             await adapter._raise_on_error(_mock_response(400))
         assert exc_info.value.venue_code == _FALLBACK_VENUE_CODE
 
-    @pytest.mark.asyncio
-    async def test_400_order_not_exist_raises_not_found(self) -> None:
+    @pytest.mark.parametrize(
+        ('code', 'msg'),
+        [
+            (_BINANCE_ORDER_NOT_EXIST_CODE, _BINANCE_ORDER_NOT_EXIST_MSG),
+            (_BINANCE_UNKNOWN_ORDER_CODE, _BINANCE_UNKNOWN_ORDER_MSG),
+        ],
+    )
+    async def test_400_not_found_codes_raise_not_found(
+        self, adapter: BinanceAdapter, code: int, msg: str,
+    ) -> None:
 
-        adapter = _make_adapter()
-        response = _mock_response(400, {
-            'code': _BINANCE_ORDER_NOT_EXIST_CODE,
-            'msg': _BINANCE_ORDER_NOT_EXIST_MSG,
-        })
+        response = _mock_response(400, {'code': code, 'msg': msg})
         with pytest.raises(NotFoundError, match='Not found'):
             await adapter._raise_on_error(response)
 
-    @pytest.mark.asyncio
-    async def test_400_unknown_order_raises_not_found(self) -> None:
-
-        adapter = _make_adapter()
-        response = _mock_response(400, {
-            'code': _BINANCE_UNKNOWN_ORDER_CODE,
-            'msg': _BINANCE_UNKNOWN_ORDER_MSG,
-        })
-        with pytest.raises(NotFoundError, match='Not found'):
-            await adapter._raise_on_error(response)
 
+@_module_loop
 class TestSessionLifecycle:
 
-    @pytest.mark.asyncio
     async def test_context_manager_creates_and_closes_session(self) -> None:
 
         async with BinanceAdapter(_BASE_URL, _WS_BASE_URL, _WS_API_URL) as adapter:
             assert adapter._session is not None
         assert adapter._session is None
 
-    @pytest.mark.asyncio
     async def test_close_cleans_up_session(self) -> None:
 
         adapter = BinanceAdapter(_BASE_URL, _WS_BASE_URL, _WS_API_URL)
-        mock_session = AsyncMock()
-        mock_session.closed = False
-        adapter._session = mock_session
+        session = aiohttp.ClientSession()
+        adapter._session = session
+        await adapter.close()
+        assert adapter._session is None
+        assert session.closed
+
+    async def test_close_after_patched_session(self) -> None:
+
+        adapter = _make_adapter()
+        _patch_session(adapter, _mock_response(200))
+        session = adapter._session
         await adapter.close()
         assert adapter._session is None
-        mock_session.close.assert_awaited_once()
+        assert session is not None and session.closed
 
-    @pytest.mark.asyncio
     async def test_ensure_session_creates_if_none(self) -> None:
 
+        adapter = BinanceAdapter(_BASE_URL, _WS_BASE_URL, _WS_API_URL)
+        with patch(
+            'praxis.infrastructure.binance_adapter.aiohttp.ClientSession',
+            side_effect=lambda **_kwargs: _FakeSession(_mock_response(200)),
+        ) as session_factory:
+            session = await adapter._ensure_session()
+            assert await adapter._ensure_session() is session
+            await session.close()
+            reopened = await adapter._ensure_session()
+        assert isinstance(session, _FakeSession)
+        assert reopened is not session
+        assert session_factory.call_count == 2
+
+    async def test_ensure_session_uses_pooled_connector(self) -> None:
+
         adapter = BinanceAdapter(_BASE_URL, _WS_BASE_URL, _WS_API_URL)
         session = await adapter._ensure_session()
-        assert session is not None
+        connector = session.connector
+        assert isinstance(connector, aiohttp.TCPConnector)
+        assert connector.limit == _CONNECTOR_LIMIT
+        assert connector.limit_per_host == 0
         await session.close()
 
 
+@_module_loop
 class TestSubmitOrder:
 
-    @pytest.mark.asyncio
-    async def test_market_buy_filled(self) -> None:
+    @pytest_asyncio.fixture(loop_scope='module')
+    async def served_adapter(self, fake_binance: str) -> AsyncGenerator[BinanceAdapter, None]:
 
-        adapter = _make_adapter()
-        _patch_session(adapter, _mock_response(200, _BINANCE_FILLED_RESPONSE))
-        result = await adapter.submit_order(
-            _ACCOUNT_ID, 'BTCUSDT', OrderSide.BUY, OrderType.MARKET,
-            Decimal('0.5'),
+        '''
+        Yield an adapter wired to the loopback fake venue, closed on teardown.
+
+        Returns:
+            BinanceAdapter: Adapter whose REST base URL is the fake server
+        '''
+
+        adapter = _make_adapter(base_url=fake_binance)
+        yield adapter
+        await adapter.close()
+
+    @pytest.mark.parametrize(
+        ('order', 'status', 'fill_count'),
+        [
+            pytest.param(
+                (OrderSide.BUY, OrderType.MARKET, _QTY_HALF, None),
+                OrderStatus.FILLED, 1,
+                id='market-buy-filled',
+            ),
+            pytest.param(
+                (OrderSide.SELL, OrderType.LIMIT, _QTY_ONE, _PRICE_50K),
+                OrderStatus.OPEN, 0,
+                id='limit-sell-new',
+            ),
+            pytest.param(
+                (OrderSide.BUY, OrderType.LIMIT_IOC, _QTY_ONE, _PRICE_50K),
+                OrderStatus.EXPIRED, 0,
+                id='limit-ioc-expired',
+            ),
+        ],
+    )
+    async def test_venue_response_mapped(
+        self,
+        served_adapter: BinanceAdapter,
+        order: tuple[OrderSide, OrderType, Decimal, Decimal | None],
+        status: OrderStatus,
+        fill_count: int,
+    ) -> None:
+
+        side, order_type, qty, price = order
+        result = await served_adapter.submit_order(
+            _ACCOUNT_ID, 'BTCUSDT', side, order_type, qty, price=price,
         )
         assert result.venue_order_id == _VENUE_ORDER_ID
-        assert result.status == OrderStatus.FILLED
-        assert len(result.immediate_fills) == 1
+        assert result.status == status
+        assert len(result.immediate_fills) == fill_count
+
+    @pytest.mark.parametrize(
+        ('outcome', 'error', 'match'),
+        [
+            pytest.param(
+                aiohttp.ClientError(), TransientError, 'Request failed',
+                id='network-error',
+            ),
+            pytest.param(_mock_response(429), RateLimitError, None, id='http-error'),
+            pytest.param(
+                _mock_response(400, {
+                    'code': _BINANCE_REJECTION_CODE,
+                    'msg': _BINANCE_REJECTION_MSG,
+                }),
+                OrderRejectedError,
+                None,
+                id='domain-error-not-wrapped',
+            ),
+        ],
+    )
+    @pytest.mark.usefixtures('sleeps')
+    async def test_failure_raises(
+        self,
+        outcome: _FakeResponse | BaseException,
+        error: type[VenueError],
+        match: str | None,
+    ) -> None:
 
-    @pytest.mark.asyncio
-    async def test_limit_sell_new(self) -> None:
+        adapter = _make_adapter()
+        _patch_session(adapter, outcome)
+        with pytest.raises(error, match=match):
+            await adapter.submit_order(
+                _ACCOUNT_ID, 'BTCUSDT', OrderSide.BUY, OrderType.MARKET,
+                _QTY_ONE,
+            )
+
+    async def test_fired_cancel_token_cancels_resting_order(
+        self, monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
 
         adapter = _make_adapter()
         _patch_session(adapter, _mock_response(200, _BINANCE_NEW_RESPONSE))
+        token = CancelToken()
+        _fire_during_post(monkeypatch, adapter, token)
         result = await adapter.submit_order(
             _ACCOUNT_ID, 'BTCUSDT', OrderSide.SELL, OrderType.LIMIT,
-            Decimal('1.0'), price=Decimal('50000'),
+            _QTY_ONE, price=_PRICE_50K, cancel_token=token,
         )
-        assert result.venue_order_id == _VENUE_ORDER_ID
         assert result.status == OrderStatus.OPEN
-        assert result.immediate_fills == ()
+        calls = _request_calls(adapter)
+        assert [c[0][0] for c in calls] == ['POST', 'DELETE']
+        assert f'orderId={_VENUE_ORDER_ID}' in calls[1][0][1]
 
-    @pytest.mark.asyncio
-    async def test_limit_ioc_expired(self) -> None:
+    async def test_fired_cancel_token_cancels_resting_order_list(
+        self, monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
 
         adapter = _make_adapter()
-        _patch_session(adapter, _mock_response(200, _BINANCE_EXPIRED_RESPONSE))
+        _patch_session(adapter, _mock_response(200, _BINANCE_OCO_RESPONSE))
+        token = CancelToken()
+        _fire_during_post(monkeypatch, adapter, token)
         result = await adapter.submit_order(
-            _ACCOUNT_ID, 'BTCUSDT', OrderSide.BUY, OrderType.LIMIT_IOC,
-            Decimal('1.0'), price=Decimal('50000'),
+            _ACCOUNT_ID, 'BTCUSDT', OrderSide.SELL, OrderType.OCO,
+            Decimal('0.01'),
+            price=_PRICE_50K, stop_price=_STOP_PRICE_48K,
+            stop_limit_price=Decimal('47500'),
+            cancel_token=token,
         )
-        assert result.status == OrderStatus.EXPIRED
-
-    @pytest.mark.asyncio
-    async def test_unregistered_account_raises_auth_error(self) -> None:
+        assert result.venue_order_id == '99999'
+        calls = _request_calls(adapter)
+        assert [c[0][0] for c in calls] == ['POST', 'DELETE']
+        assert '/api/v3/orderList?' in calls[1][0][1]
+        assert 'orderListId=99999' in calls[1][0][1]
+
+    @pytest.mark.usefixtures('sleeps')
+    async def test_failed_compensating_cancel_returns_result(
+        self, monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture,
+    ) -> None:
 
-        adapter = BinanceAdapter(_BASE_URL, _WS_BASE_URL, _WS_API_URL)
-        with pytest.raises(AuthenticationError, match='No credentials'):
-            await adapter.submit_order(
-                'unknown', 'BTCUSDT', OrderSide.BUY, OrderType.MARKET,
-                Decimal('1.0'),
+        adapter = _make_adapter()
+        _patch_session(
+            adapter,
+            _mock_response(200, _BINANCE_NEW_RESPONSE),
+            _mock_response(500, {'code': -1000, 'msg': 'error'}),
+        )
+        token = CancelToken()
+        _fire_during_post(monkeypatch, adapter, token)
+        with caplog.at_level(logging.WARNING):
+            result = await adapter.submit_order(
+                _ACCOUNT_ID, 'BTCUSDT', OrderSide.SELL, OrderType.LIMIT,
+                _QTY_ONE, price=_PRICE_50K, cancel_token=token,
             )
+        assert result.venue_order_id == _VENUE_ORDER_ID
+        assert [c[0][0] for c in _request_calls(adapter)] == [
+            'POST', 'DELETE', 'DELETE', 'DELETE',
+        ]
+        assert any(
+            'Compensating cancel' in r.getMessage() and 'failed' in r.getMessage()
+            for r in caplog.records
+        )
 
-    @pytest.mark.asyncio
-    async def test_network_error_raises_transient(self) -> None:
+    async def test_cancel_token_fired_before_submit_skips_post(self) -> None:
 
         adapter = _make_adapter()
-        session = MagicMock()
-        session.request = MagicMock(side_effect=aiohttp.ClientError())
-        session.closed = False
-        adapter._session = session
-        with (
-            patch('praxis.infrastructure.binance_adapter.asyncio.sleep', new_callable=AsyncMock),
-            pytest.raises(TransientError, match='Request failed'),
-        ):
+        _patch_session(adapter, _mock_response(200, _BINANCE_NEW_RESPONSE))
+        token = CancelToken()
+        token.cancel()
+        with pytest.raises(SubmitCancelledError, match='cancel token fired'):
             await adapter.submit_order(
-                _ACCOUNT_ID, 'BTCUSDT', OrderSide.BUY, OrderType.MARKET,
-                Decimal('1.0'),
+                _ACCOUNT_ID, 'BTCUSDT', OrderSide.SELL, OrderType.LIMIT,
+                _QTY_ONE, price=_PRICE_50K, cancel_token=token,
             )
+        assert _request_calls(adapter) == []
 
-    @pytest.mark.asyncio
-    async def test_http_error_propagates(self) -> None:
+    async def test_unfired_cancel_token_leaves_order_resting(self) -> None:
 
         adapter = _make_adapter()
-        _patch_session(adapter, _mock_response(429))
-        with pytest.raises(RateLimitError):
-            await adapter.submit_order(
-                _ACCOUNT_ID, 'BTCUSDT', OrderSide.BUY, OrderType.MARKET,
-                Decimal('1.0'),
-            )
+        _patch_session(adapter, _mock_response(200, _BINANCE_NEW_RESPONSE))
+        await adapter.submit_order(
+            _ACCOUNT_ID, 'BTCUSDT', OrderSide.SELL, OrderType.LIMIT,
+            _QTY_ONE, price=_PRICE_50K, cancel_token=CancelToken(),
+        )
+        assert len(_request_calls(adapter)) == 1
 
-    @pytest.mark.asyncio
-    async def test_domain_errors_not_wrapped_as_transient(self) -> None:
+    async def test_fired_cancel_token_skips_terminal_order(
+        self, monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
 
         adapter = _make_adapter()
-        _patch_session(adapter, _mock_response(400, {
-            'code': _BINANCE_REJECTION_CODE,
-            'msg': _BINANCE_REJECTION_MSG,
-        }))
-        with pytest.raises(OrderRejectedError):
+        _patch_session(adapter, _mock_response(200, _BINANCE_FILLED_RESPONSE))
+        token = CancelToken()
+        _fire_during_post(monkeypatch, adapter, token)
+        await adapter.submit_order(
+            _ACCOUNT_ID, 'BTCUSDT', OrderSide.BUY, OrderType.MARKET,
+            _QTY_ONE, cancel_token=token,
+        )
+        assert len(_request_calls(adapter)) == 1
+
+    async def test_unregistered_account_raises_auth_error(self) -> None:
+
+        adapter = BinanceAdapter(_BASE_URL, _WS_BASE_URL, _WS_API_URL)
+        with pytest.raises(AuthenticationError, match='No credentials'):
             await adapter.submit_order(
-                _ACCOUNT_ID, 'BTCUSDT', OrderSide.BUY, OrderType.MARKET,
-                Decimal('1.0'),
+                'unknown', 'BTCUSDT', OrderSide.BUY, OrderType.MARKET,
+                _QTY_ONE,
             )
 
 
+@_module_loop
 class TestCancelOrder:
 
-    @pytest.mark.asyncio
-    async def test_cancel_with_venue_order_id(self) -> None:
+    @pytest.mark.parametrize(
+        'identifiers',
+        [
+            {'venue_order_id': _VENUE_ORDER_ID},
+            {'client_order_id': 'my-client-id'},
+            {'venue_order_id': _VENUE_ORDER_ID, 'client_order_id': 'my-client-id'},
+        ],
+    )
+    async def test_cancel_with_identifiers(self, identifiers: dict[str, str]) -> None:
 
         adapter = _make_adapter()
-        response_data = {'orderId': 12345, 'status': 'CANCELED'}
-        _patch_session(adapter, _mock_response(200, response_data))
-        result = await adapter.cancel_order(
-            _ACCOUNT_ID, 'BTCUSDT', venue_order_id=_VENUE_ORDER_ID,
-        )
+        _patch_session(adapter, _mock_response(200, _CANCEL_OK_RESPONSE))
+        result = await adapter.cancel_order(_ACCOUNT_ID, 'BTCUSDT', **identifiers)
         assert isinstance(result, CancelResult)
         assert result.venue_order_id == _VENUE_ORDER_ID
         assert result.status == OrderStatus.CANCELED
 
-    @pytest.mark.asyncio
-    async def test_cancel_with_client_order_id(self) -> None:
-
-        adapter = _make_adapter()
-        response_data = {'orderId': 12345, 'status': 'CANCELED'}
-        _patch_session(adapter, _mock_response(200, response_data))
-        result = await adapter.cancel_order(
-            _ACCOUNT_ID, 'BTCUSDT', client_order_id='my-client-id',
-        )
-        assert result.venue_order_id == _VENUE_ORDER_ID
-        assert result.status == OrderStatus.CANCELED
-
-    @pytest.mark.asyncio
-    async def test_cancel_with_both_identifiers(self) -> None:
-
-        adapter = _make_adapter()
-        response_data = {'orderId': 12345, 'status': 'CANCELED'}
-        _patch_session(adapter, _mock_response(200, response_data))
-        result = await adapter.cancel_order(
-            _ACCOUNT_ID, 'BTCUSDT',
-            venue_order_id=_VENUE_ORDER_ID,
-            client_order_id='my-client-id',
-        )
-        assert result.venue_order_id == _VENUE_ORDER_ID
-
-    @pytest.mark.asyncio
     async def test_cancel_with_neither_identifier_raises(self) -> None:
 
         adapter = _make_adapter()
         with pytest.raises(ValueError, match='At least one'):
             await adapter.cancel_order(_ACCOUNT_ID, 'BTCUSDT')
 
-    @pytest.mark.asyncio
-    async def test_cancel_not_found_raises(self) -> None:
-
-        adapter = _make_adapter()
-        _patch_session(adapter, _mock_response(400, {
-            'code': _BINANCE_ORDER_NOT_EXIST_CODE,
-            'msg': _BINANCE_ORDER_NOT_EXIST_MSG,
-        }))
-        with pytest.raises(NotFoundError):
-            await adapter.cancel_order(
-                _ACCOUNT_ID, 'BTCUSDT', venue_order_id=_VENUE_ORDER_ID,
-            )
-
 
+@_module_loop
 class TestQueryOrder:
 
-    @pytest.mark.asyncio
-    async def test_query_limit_order(self) -> None:
+    @pytest.mark.parametrize(
+        ('payload', 'identifiers', 'expected'),
+        [
+            pytest.param(
+                _BINANCE_LIMIT_ORDER_RESPONSE,
+                {'venue_order_id': _VENUE_ORDER_ID},
+                {
+                    'client_order_id': 'my-client-id',
+                    'status': OrderStatus.OPEN,
+                    'symbol': 'BTCUSDT',
+                    'side': OrderSide.BUY,
+                    'order_type': OrderType.LIMIT,
+                    'price': Decimal('50000.0'),
+                },
+                id='limit',
+            ),
+            pytest.param(
+                _BINANCE_MARKET_ORDER_RESPONSE,
+                {'venue_order_id': _VENUE_ORDER_ID},
+                {'order_type': OrderType.MARKET, 'price': None},
+                id='market-price-none',
+            ),
+            pytest.param(
+                _BINANCE_LIMIT_IOC_ORDER_RESPONSE,
+                {'venue_order_id': _VENUE_ORDER_ID},
+                {'order_type': OrderType.LIMIT_IOC},
+                id='limit-ioc',
+            ),
+            pytest.param(
+                _BINANCE_LIMIT_ORDER_RESPONSE,
+                {'client_order_id': 'my-client-id'},
+                {'client_order_id': 'my-client-id'},
+                id='by-client-order-id',
+            ),
+        ],
+    )
+    async def test_query_order_variants(
+        self,
+        payload: Mapping[str, Any],
+        identifiers: dict[str, str],
+        expected: dict[str, Any],
+    ) -> None:
 
         adapter = _make_adapter()
-        _patch_session(adapter, _mock_response(200, _BINANCE_LIMIT_ORDER_RESPONSE))
-        result = await adapter.query_order(
-            _ACCOUNT_ID, 'BTCUSDT', venue_order_id=_VENUE_ORDER_ID,
-        )
+        _patch_session(adapter, _mock_response(200, payload))
+        result = await adapter.query_order(_ACCOUNT_ID, 'BTCUSDT', **identifiers)
         assert isinstance(result, VenueOrder)
         assert result.venue_order_id == _VENUE_ORDER_ID
-        assert result.client_order_id == 'my-client-id'
-        assert result.status == OrderStatus.OPEN
-        assert result.symbol == 'BTCUSDT'
-        assert result.side == OrderSide.BUY
-        assert result.order_type == OrderType.LIMIT
-        assert result.price == Decimal('50000.0')
-
-    @pytest.mark.asyncio
-    async def test_query_market_order_price_none(self) -> None:
-
-        adapter = _make_adapter()
-        _patch_session(adapter, _mock_response(200, _BINANCE_MARKET_ORDER_RESPONSE))
-        result = await adapter.query_order(
-            _ACCOUNT_ID, 'BTCUSDT', venue_order_id=_VENUE_ORDER_ID,
-        )
-        assert result.order_type == OrderType.MARKET
-        assert result.price is None
-
-    @pytest.mark.asyncio
-    async def test_query_limit_ioc_order(self) -> None:
-
-        adapter = _make_adapter()
-        _patch_session(adapter, _mock_response(200, _BINANCE_LIMIT_IOC_ORDER_RESPONSE))
-        result = await adapter.query_order(
-            _ACCOUNT_ID, 'BTCUSDT', venue_order_id=_VENUE_ORDER_ID,
-        )
-        assert result.order_type == OrderType.LIMIT_IOC
-
-    @pytest.mark.asyncio
-    async def test_query_with_client_order_id(self) -> None:
-
-        adapter = _make_adapter()
-        _patch_session(adapter, _mock_response(200, _BINANCE_LIMIT_ORDER_RESPONSE))
-        result = await adapter.query_order(
-            _ACCOUNT_ID, 'BTCUSDT', client_order_id='my-client-id',
-        )
-        assert result.venue_order_id == _VENUE_ORDER_ID
+        assert {field: getattr(result, field) for field in expected} == expected
 
-    @pytest.mark.asyncio
     async def test_query_with_neither_identifier_raises(self) -> None:
 
         adapter = _make_adapter()
         with pytest.raises(ValueError, match='At least one'):
             await adapter.query_order(_ACCOUNT_ID, 'BTCUSDT')
 
-    @pytest.mark.asyncio
-    async def test_query_not_found_raises(self) -> None:
+
+@_module_loop
+class TestOrderNotFound:
+
+    @pytest.mark.parametrize('method', ['cancel_order', 'query_order'])
+    async def test_unknown_order_raises_not_found(self, method: str) -> None:
 
         adapter = _make_adapter()
-        _patch_session(adapter, _mock_response(400, {
-            'code': _BINANCE_ORDER_NOT_EXIST_CODE,
-            'msg': _BINANCE_ORDER_NOT_EXIST_MSG,
-        }))
+        _patch_session(adapter, _mock_response(400, _NOT_FOUND_ERROR_BODY))
         with pytest.raises(NotFoundError):
-            await adapter.query_order(
+            await getattr(adapter, method)(
                 _ACCOUNT_ID, 'BTCUSDT', venue_order_id=_VENUE_ORDER_ID,
             )
 
 
+@_module_loop
 class TestQueryOpenOrders:
 
-    @pytest.mark.asyncio
     async def test_returns_list_of_venue_orders(self) -> None:
 
         adapter = _make_adapter()
@@ -1730,7 +1728,6 @@ class TestQueryOpenOrders:
         assert result[0].order_type == OrderType.LIMIT
         assert result[1].order_type == OrderType.MARKET
 
-    @pytest.mark.asyncio
     async def test_empty_response_returns_empty_list(self) -> None:
 
         adapter = _make_adapter()
@@ -1739,80 +1736,62 @@ class TestQueryOpenOrders:
         assert result == []
 
 
+@_module_loop
 class TestQueryBalance:
 
-    _ACCOUNT_RESPONSE: ClassVar[dict[str, Any]] = {
-        'balances': [
-            {'asset': 'BTC', 'free': '1.50000000', 'locked': '0.25000000'},
-            {'asset': 'USDT', 'free': '10000.00', 'locked': '500.00'},
-            {'asset': 'ETH', 'free': '0.00000000', 'locked': '0.00000000'},
-            {'asset': 'BNB', 'free': '5.00000000', 'locked': '0.00000000'},
-        ],
-    }
+    @pytest.fixture
+    def balance_adapter(self) -> BinanceAdapter:
+
+        '''
+        Adapter whose session serves the shared account response.
 
-    @pytest.mark.asyncio
-    async def test_returns_only_requested_assets(self) -> None:
+        Returns:
+            BinanceAdapter: Fresh adapter patched with the account response
+        '''
 
         adapter = _make_adapter()
-        _patch_session(adapter, _mock_response(200, self._ACCOUNT_RESPONSE))
-        result = await adapter.query_balance(
-            _ACCOUNT_ID, frozenset({'BTC', 'USDT'}),
-        )
+        _patch_session(adapter, _mock_response(200, _BINANCE_ACCOUNT_RESPONSE))
+        return adapter
+
+    async def test_returns_only_requested_assets(self, balance_adapter: BinanceAdapter) -> None:
+
+        result = await balance_adapter.query_balance(_ACCOUNT_ID, _ASSETS_BTC_USDT)
         assert len(result) == 2
         assets = {e.asset for e in result}
-        assert assets == {'BTC', 'USDT'}
+        assert assets == _ASSETS_BTC_USDT
 
-    @pytest.mark.asyncio
-    async def test_balance_values_are_decimal(self) -> None:
+    async def test_balance_values_are_decimal(self, balance_adapter: BinanceAdapter) -> None:
 
-        adapter = _make_adapter()
-        _patch_session(adapter, _mock_response(200, self._ACCOUNT_RESPONSE))
-        result = await adapter.query_balance(
-            _ACCOUNT_ID, frozenset({'BTC'}),
-        )
+        result = await balance_adapter.query_balance(_ACCOUNT_ID, _ASSETS_BTC)
         assert len(result) == 1
         assert isinstance(result[0], BalanceEntry)
         assert result[0].free == Decimal('1.5')
         assert result[0].locked == Decimal('0.25')
 
-    @pytest.mark.asyncio
-    async def test_asset_not_in_response_omitted(self) -> None:
+    async def test_asset_not_in_response_omitted(self, balance_adapter: BinanceAdapter) -> None:
 
-        adapter = _make_adapter()
-        _patch_session(adapter, _mock_response(200, self._ACCOUNT_RESPONSE))
-        result = await adapter.query_balance(
-            _ACCOUNT_ID, frozenset({'DOGE'}),
-        )
+        result = await balance_adapter.query_balance(_ACCOUNT_ID, _ASSETS_DOGE)
         assert result == []
 
-    @pytest.mark.asyncio
-    async def test_filters_exclude_unrequested(self) -> None:
+    async def test_filters_exclude_unrequested(self, balance_adapter: BinanceAdapter) -> None:
 
-        adapter = _make_adapter()
-        _patch_session(adapter, _mock_response(200, self._ACCOUNT_RESPONSE))
-        result = await adapter.query_balance(
-            _ACCOUNT_ID, frozenset({'ETH'}),
-        )
+        result = await balance_adapter.query_balance(_ACCOUNT_ID, _ASSETS_ETH)
         assert len(result) == 1
         assert result[0].asset == 'ETH'
 
-    @pytest.mark.asyncio
     async def test_empty_assets_skips_api_call(self) -> None:
 
         adapter = _make_adapter()
-        session = MagicMock()
-        session.closed = False
-        adapter._session = session
+        _patch_session(adapter, _mock_response(200))
         result = await adapter.query_balance(_ACCOUNT_ID, frozenset())
         assert result == []
-        session.request.assert_not_called()
+        assert _request_calls(adapter) == []
 
 
 class TestParseVenueTrade:
 
-    def test_field_mapping(self) -> None:
+    def test_field_mapping(self, adapter: BinanceAdapter) -> None:
 
-        adapter = _make_adapter()
         result = adapter._parse_venue_trade(_BINANCE_TRADE_RESPONSE)
         assert isinstance(result, VenueTrade)
         assert result.venue_trade_id == _VENUE_TRADE_ID
@@ -1822,40 +1801,36 @@ class TestParseVenueTrade:
         assert result.side == OrderSide.BUY
         assert result.fee_asset == 'BTC'
 
-    def test_decimal_precision_preserved(self) -> None:
+    def test_decimal_precision_preserved(self, adapter: BinanceAdapter) -> None:
 
-        adapter = _make_adapter()
         result = adapter._parse_venue_trade(_BINANCE_TRADE_RESPONSE)
         assert str(result.qty) == '0.50000000'
         assert str(result.price) == '50000.12345678'
         assert str(result.fee) == '0.00050000'
 
-    def test_timestamp_is_utc(self) -> None:
+    def test_timestamp_is_utc(self, adapter: BinanceAdapter) -> None:
 
-        adapter = _make_adapter()
         result = adapter._parse_venue_trade(_BINANCE_TRADE_RESPONSE)
         assert result.timestamp.tzinfo == UTC
         expected = datetime.fromtimestamp(1700000000, tz=UTC)
         assert result.timestamp == expected
 
-    def test_is_maker_true(self) -> None:
+    def test_is_maker_true(self, adapter: BinanceAdapter) -> None:
 
-        adapter = _make_adapter()
         result = adapter._parse_venue_trade(_BINANCE_TRADE_RESPONSE)
         assert result.is_maker is True
 
-    def test_is_maker_false(self) -> None:
+    def test_is_maker_false(self, adapter: BinanceAdapter) -> None:
 
-        adapter = _make_adapter()
         data = dict(_BINANCE_TRADE_RESPONSE)
         data['isMaker'] = False
         result = adapter._parse_venue_trade(data)
         assert result.is_maker is False
 
 
+@_module_loop
 class TestQueryTrades:
 
-    @pytest.mark.asyncio
     async def test_returns_list_of_venue_trades(self) -> None:
 
         adapter = _make_adapter()
@@ -1865,7 +1840,6 @@ class TestQueryTrades:
         assert isinstance(result[0], VenueTrade)
         assert result[0].venue_trade_id == _VENUE_TRADE_ID
 
-    @pytest.mark.asyncio
     async def test_empty_response_returns_empty_list(self) -> None:
 
         adapter = _make_adapter()
@@ -1873,18 +1847,16 @@ class TestQueryTrades:
         result = await adapter.query_trades(_ACCOUNT_ID, 'BTCUSDT')
         assert result == []
 
-    @pytest.mark.asyncio
     async def test_start_time_converted_to_ms(self) -> None:
 
         adapter = _make_adapter()
         _patch_session(adapter, _mock_response(200, []))
         start = datetime.fromtimestamp(1700000000, tz=UTC)
         await adapter.query_trades(_ACCOUNT_ID, 'BTCUSDT', start_time=start)
-        call_args = adapter._session.request.call_args  # type: ignore[union-attr]
+        call_args = _request_calls(adapter)[-1]
         url = call_args[0][1]
         assert 'startTime=1700000000000' in url
 
-    @pytest.mark.asyncio
     async def test_naive_start_time_raises(self) -> None:
 
         adapter = _make_adapter()
@@ -1892,27 +1864,24 @@ class TestQueryTrades:
         with pytest.raises(ValueError, match='timezone-aware'):
             await adapter.query_trades(_ACCOUNT_ID, 'BTCUSDT', start_time=naive)
 
-    @pytest.mark.asyncio
     async def test_from_id_and_limit_in_url(self) -> None:
 
         adapter = _make_adapter()
         _patch_session(adapter, _mock_response(200, []))
         await adapter.query_trades(_ACCOUNT_ID, 'BTCUSDT', from_id=100, limit=500)
-        url = adapter._session.request.call_args[0][1]  # type: ignore[union-attr]
+        url = _request_calls(adapter)[-1][0][1]
         assert 'fromId=100' in url
         assert 'limit=500' in url
 
-    @pytest.mark.asyncio
     async def test_end_time_converted_to_ms(self) -> None:
 
         adapter = _make_adapter()
         _patch_session(adapter, _mock_response(200, []))
         end = datetime.fromtimestamp(1700000000, tz=UTC)
         await adapter.query_trades(_ACCOUNT_ID, 'BTCUSDT', end_time=end)
-        url = adapter._session.request.call_args[0][1]  # type: ignore[union-attr]
+        url = _request_calls(adapter)[-1][0][1]
         assert 'endTime=1700000000000' in url
 
-    @pytest.mark.asyncio
     async def test_from_id_with_time_window_raises(self) -> None:
 
         adapter = _make_adapter()
@@ -1920,7 +1889,6 @@ class TestQueryTrades:
         with pytest.raises(ValueError, match='cannot be combined'):
             await adapter.query_trades(_ACCOUNT_ID, 'BTCUSDT', from_id=1, start_time=start)
 
-    @pytest.mark.asyncio
     async def test_naive_end_time_raises(self) -> None:
 
         adapter = _make_adapter()
@@ -1929,22 +1897,21 @@ class TestQueryTrades:
             await adapter.query_trades(_ACCOUNT_ID, 'BTCUSDT', end_time=naive)
 
 
+@_module_loop
 class TestGetExchangeInfo:
 
-    @pytest.mark.asyncio
     async def test_parses_filters_correctly(self) -> None:
 
         adapter = _make_adapter()
         _patch_session(adapter, _mock_response(200, _BINANCE_EXCHANGE_INFO_RESPONSE))
         result = await adapter.get_exchange_info('BTCUSDT')
         assert result.symbol == 'BTCUSDT'
-        assert result.tick_size == Decimal('0.01')
-        assert result.lot_step == Decimal('0.00001')
-        assert result.lot_min == Decimal('0.00001')
-        assert result.lot_max == Decimal('9000.0')
-        assert result.min_notional == Decimal('5.0')
+        assert result.tick_size == _TICK_SIZE
+        assert result.lot_step == _LOT_STEP
+        assert result.lot_min == _LOT_STEP
+        assert result.lot_max == _LOT_MAX
+        assert result.min_notional == _MIN_NOTIONAL
 
-    @pytest.mark.asyncio
     async def test_missing_filter_raises_venue_error(self) -> None:
 
         adapter = _make_adapter()
@@ -1952,7 +1919,6 @@ class TestGetExchangeInfo:
         with pytest.raises(VenueError, match='Missing required filters'):
             await adapter.get_exchange_info('BTCUSDT')
 
-    @pytest.mark.asyncio
     async def test_empty_symbols_raises_venue_error(self) -> None:
 
         adapter = _make_adapter()
@@ -1960,7 +1926,6 @@ class TestGetExchangeInfo:
         with pytest.raises(VenueError, match="missing or empty 'symbols'"):
             await adapter.get_exchange_info('BTCUSDT')
 
-    @pytest.mark.asyncio
     async def test_missing_inner_field_raises_venue_error(self) -> None:
 
         adapter = _make_adapter()
@@ -1980,7 +1945,6 @@ class TestGetExchangeInfo:
         with pytest.raises(VenueError, match='Malformed exchangeInfo payload'):
             await adapter.get_exchange_info('BTCUSDT')
 
-    @pytest.mark.asyncio
     async def test_parses_rate_limits_from_response(self) -> None:
 
         adapter = _make_adapter()
@@ -1993,7 +1957,6 @@ class TestGetExchangeInfo:
         assert adapter._order_count_limit == 100
         assert adapter._used_weight == 42
 
-    @pytest.mark.asyncio
     async def test_missing_rate_limits_keeps_defaults(self) -> None:
 
         adapter = _make_adapter()
@@ -2089,16 +2052,16 @@ class TestHeadroom:
         assert adapter.order_count_headroom(_ACCOUNT_ID) == 0.0
 
 
+@_module_loop
 class TestLoadFilters:
 
-    @pytest.mark.asyncio
     async def test_caches_multiple_symbols(self) -> None:
 
         adapter = _make_adapter()
         filters_btc = SymbolFilters(
-            symbol='BTCUSDT', tick_size=Decimal('0.01'),
-            lot_step=Decimal('0.00001'), lot_min=Decimal('0.00001'),
-            lot_max=Decimal('9000.0'), min_notional=Decimal('5.0'),
+            symbol='BTCUSDT', tick_size=_TICK_SIZE,
+            lot_step=_LOT_STEP, lot_min=_LOT_STEP,
+            lot_max=_LOT_MAX, min_notional=_MIN_NOTIONAL,
         )
         filters_eth = SymbolFilters(
             symbol='ETHUSDT', tick_size=Decimal('0.1'),
@@ -2110,21 +2073,19 @@ class TestLoadFilters:
         assert adapter._filters['BTCUSDT'] == filters_btc
         assert adapter._filters['ETHUSDT'] == filters_eth
 
-    @pytest.mark.asyncio
     async def test_bare_string_raises_type_error(self) -> None:
 
         adapter = _make_adapter()
         with pytest.raises(TypeError, match='not a single string'):
             await adapter.load_filters('BTCUSDT')
 
-    @pytest.mark.asyncio
     async def test_skips_already_cached_symbols(self) -> None:
 
         adapter = _make_adapter()
         filters_btc = SymbolFilters(
-            symbol='BTCUSDT', tick_size=Decimal('0.01'),
-            lot_step=Decimal('0.00001'), lot_min=Decimal('0.00001'),
-            lot_max=Decimal('9000.0'), min_notional=Decimal('5.0'),
+            symbol='BTCUSDT', tick_size=_TICK_SIZE,
+            lot_step=_LOT_STEP, lot_min=_LOT_STEP,
+            lot_max=_LOT_MAX, min_notional=_MIN_NOTIONAL,
         )
         adapter._filters['BTCUSDT'] = filters_btc
         adapter.get_exchange_info = AsyncMock()  # type: ignore[method-assign]
@@ -2134,14 +2095,13 @@ class TestLoadFilters:
         adapter.get_exchange_info.assert_not_called()
         assert adapter._filters['BTCUSDT'] is filters_btc
 
-    @pytest.mark.asyncio
     async def test_only_fetches_uncached_symbols_in_mixed_set(self) -> None:
 
         adapter = _make_adapter()
         filters_btc = SymbolFilters(
-            symbol='BTCUSDT', tick_size=Decimal('0.01'),
-            lot_step=Decimal('0.00001'), lot_min=Decimal('0.00001'),
-            lot_max=Decimal('9000.0'), min_notional=Decimal('5.0'),
+            symbol='BTCUSDT', tick_size=_TICK_SIZE,
+            lot_step=_LOT_STEP, lot_min=_LOT_STEP,
+            lot_max=_LOT_MAX, min_notional=_MIN_NOTIONAL,
         )
         filters_eth = SymbolFilters(
             symbol='ETHUSDT', tick_size=Decimal('0.1'),
@@ -2164,20 +2124,20 @@ class TestValidateOrder:
 
         adapter = _make_adapter()
         adapter._filters['BTCUSDT'] = _TEST_FILTERS
-        adapter._validate_order('BTCUSDT', OrderType.LIMIT, Decimal('1.0'), Decimal('50000.00'))
+        adapter._validate_order('BTCUSDT', OrderType.LIMIT, _QTY_ONE, Decimal('50000.00'))
 
     def test_valid_market_order_passes(self) -> None:
 
         adapter = _make_adapter()
         adapter._filters['BTCUSDT'] = _TEST_FILTERS
-        adapter._validate_order('BTCUSDT', OrderType.MARKET, Decimal('1.0'), None)
+        adapter._validate_order('BTCUSDT', OrderType.MARKET, _QTY_ONE, None)
 
     def test_price_not_multiple_of_tick_size_raises(self) -> None:
 
         adapter = _make_adapter()
         adapter._filters['BTCUSDT'] = _TEST_FILTERS
         with pytest.raises(LocalOrderRejectedError, match='not a multiple of tick size'):
-            adapter._validate_order('BTCUSDT', OrderType.LIMIT, Decimal('1.0'), Decimal('50000.005'))
+            adapter._validate_order('BTCUSDT', OrderType.LIMIT, _QTY_ONE, Decimal('50000.005'))
 
     def test_qty_not_multiple_of_lot_step_raises(self) -> None:
 
@@ -2217,10 +2177,10 @@ class TestValidateOrder:
 
         adapter = _make_adapter()
         with caplog.at_level(logging.WARNING):
-            adapter._validate_order('UNKNOWN', OrderType.LIMIT, Decimal('1.0'), Decimal('50000'))
+            adapter._validate_order('UNKNOWN', OrderType.LIMIT, _QTY_ONE, _PRICE_50K)
         assert 'No cached filters for UNKNOWN' in caplog.text
 
-    @pytest.mark.asyncio
+    @_module_loop
     async def test_submit_order_validates_before_request(self) -> None:
 
         adapter = _make_adapter()
@@ -2229,9 +2189,9 @@ class TestValidateOrder:
         with pytest.raises(LocalOrderRejectedError, match='not a multiple of tick size'):
             await adapter.submit_order(
                 _ACCOUNT_ID, 'BTCUSDT', OrderSide.BUY, OrderType.LIMIT,
-                Decimal('1.0'), price=Decimal('50000.005'),
+                _QTY_ONE, price=Decimal('50000.005'),
             )
-        adapter._session.request.assert_not_called()  # type: ignore[union-attr]
+        assert _request_calls(adapter) == []
 
 
 class TestSnapQtyToLotStep:
@@ -2240,11 +2200,11 @@ class TestSnapQtyToLotStep:
 
         adapter = _make_adapter()
         adapter._filters['BTCUSDT'] = _TEST_FILTERS
-        raw = Decimal('20') / Decimal('81458')
+        raw = Decimal('20') / _REF_PRICE_81458
 
         snapped = adapter._snap_qty_to_lot_step('BTCUSDT', raw)
 
-        assert snapped == Decimal('0.00024')
+        assert snapped == _SNAPPED_QTY_20_USDT
         assert snapped % _TEST_FILTERS.lot_step == 0
 
     def test_snap_rounds_down_never_exceeds_input(self) -> None:
@@ -2284,15 +2244,15 @@ class TestSnapQtyToLotStep:
             tick_size=Decimal('0.01000000'),
             lot_step=Decimal('0.00001000'),
             lot_min=Decimal('0.00001000'),
-            lot_max=Decimal('9000.0'),
-            min_notional=Decimal('5.0'),
+            lot_max=_LOT_MAX,
+            min_notional=_MIN_NOTIONAL,
         )
-        raw = Decimal('20') / Decimal('81458')
+        raw = Decimal('20') / _REF_PRICE_81458
 
         snapped = adapter._snap_qty_to_lot_step('BTCUSDT', raw)
 
-        assert snapped == Decimal('0.00024')
-        assert snapped % Decimal('0.00001') == 0
+        assert snapped == _SNAPPED_QTY_20_USDT
+        assert snapped % _LOT_STEP == 0
         assert snapped % adapter._filters['BTCUSDT'].lot_step == 0
 
     def test_snap_floors_to_integer_multiple_for_non_power_of_ten_step(self) -> None:
@@ -2300,28 +2260,28 @@ class TestSnapQtyToLotStep:
         adapter = _make_adapter()
         adapter._filters['XYZUSDT'] = SymbolFilters(
             symbol='XYZUSDT',
-            tick_size=Decimal('0.01'),
+            tick_size=_TICK_SIZE,
             lot_step=Decimal('5'),
             lot_min=Decimal('5'),
             lot_max=Decimal('1000'),
-            min_notional=Decimal('5.0'),
+            min_notional=_MIN_NOTIONAL,
         )
 
         snapped = adapter._snap_qty_to_lot_step('XYZUSDT', Decimal('13'))
 
         assert snapped == Decimal('10')
 
-    @pytest.mark.asyncio
+    @_module_loop
     async def test_submit_order_snaps_qty_so_post_request_quantity_is_grid_aligned(self) -> None:
 
         adapter = _make_adapter()
         adapter._filters['BTCUSDT'] = SymbolFilters(
             symbol='BTCUSDT',
-            tick_size=Decimal('0.01'),
-            lot_step=Decimal('0.00001'),
-            lot_min=Decimal('0.00001'),
-            lot_max=Decimal('9000.0'),
-            min_notional=Decimal('5.0'),
+            tick_size=_TICK_SIZE,
+            lot_step=_LOT_STEP,
+            lot_min=_LOT_STEP,
+            lot_max=_LOT_MAX,
+            min_notional=_MIN_NOTIONAL,
         )
         _patch_session(adapter, _mock_response(200, _BINANCE_FILLED_RESPONSE))
 
@@ -2330,14 +2290,14 @@ class TestSnapQtyToLotStep:
             Decimal('0.0002455253013823074467823909254'),
         )
 
-        call_args = adapter._session.request.call_args  # type: ignore[union-attr]
+        call_args = _request_calls(adapter)[-1]
         url = call_args[0][1]
         assert 'quantity=0.00024&' in url or url.endswith('quantity=0.00024')
 
 
+@_module_loop
 class TestQueryOrderBook:
 
-    @pytest.mark.asyncio
     async def test_parses_bids_and_asks(self) -> None:
 
         adapter = _make_adapter()
@@ -2357,7 +2317,6 @@ class TestQueryOrderBook:
         assert result.asks[0].price == Decimal('50001.00')
         assert result.asks[1].qty == Decimal('1.2')
 
-    @pytest.mark.asyncio
     async def test_empty_book(self) -> None:
 
         adapter = _make_adapter()
@@ -2368,21 +2327,19 @@ class TestQueryOrderBook:
         assert result.asks == ()
         assert result.last_update_id == 100
 
-    @pytest.mark.asyncio
     async def test_custom_limit_passed_as_param(self) -> None:
 
         adapter = _make_adapter()
         payload = {'lastUpdateId': 1, 'bids': [], 'asks': []}
         _patch_session(adapter, _mock_response(200, payload))
         await adapter.query_order_book('ETHUSDT', limit=50)
-        call_args = adapter._session.request.call_args  # type: ignore[union-attr]
+        call_args = _request_calls(adapter)[-1]
         url = call_args[0][1]
         params = call_args[1].get('params', {})
         assert 'depth' in url
         assert params.get('limit') == '50'
         assert params.get('symbol') == 'ETHUSDT'
 
-    @pytest.mark.asyncio
     async def test_updates_weight_from_headers(self) -> None:
 
         adapter = _make_adapter()
@@ -2394,7 +2351,6 @@ class TestQueryOrderBook:
         await adapter.query_order_book('BTCUSDT')
         assert adapter._used_weight == 55
 
-    @pytest.mark.asyncio
     async def test_malformed_payload_raises_venue_error(self) -> None:
 
         adapter = _make_adapter()
@@ -2402,7 +2358,6 @@ class TestQueryOrderBook:
         with pytest.raises(VenueError, match='Malformed depth payload'):
             await adapter.query_order_book('BTCUSDT')
 
-    @pytest.mark.asyncio
     async def test_malformed_level_raises_venue_error(self) -> None:
 
         adapter = _make_adapter()
@@ -2415,21 +2370,13 @@ class TestQueryOrderBook:
         with pytest.raises(VenueError, match='Malformed depth payload'):
             await adapter.query_order_book('BTCUSDT')
 
-    @pytest.mark.asyncio
     async def test_network_error_raises_transient(self) -> None:
 
         adapter = _make_adapter()
-        session = MagicMock()
-        ctx = MagicMock()
-        ctx.__aenter__ = AsyncMock(side_effect=aiohttp.ClientError('timeout'))
-        ctx.__aexit__ = AsyncMock(return_value=False)
-        session.request = MagicMock(return_value=ctx)
-        session.closed = False
-        adapter._session = session
+        _patch_session(adapter, aiohttp.ClientError('timeout'))
         with pytest.raises(TransientError, match='Request failed'):
             await adapter.query_order_book('BTCUSDT')
 
-    @pytest.mark.asyncio
     async def test_http_error_propagates(self) -> None:
 
         adapter = _make_adapter()
@@ -2437,7 +2384,6 @@ class TestQueryOrderBook:
         with pytest.raises(TransientError, match='Venue server error'):
             await adapter.query_order_book('BTCUSDT')
 
-    @pytest.mark.asyncio
     async def test_invalid_symbol_raises_venue_error(self) -> None:
 
         adapter = _make_adapter()
@@ -2446,7 +2392,6 @@ class TestQueryOrderBook:
         with pytest.raises(VenueError, match='depth query failed'):
             await adapter.query_order_book('INVALID')
 
-    @pytest.mark.asyncio
     async def test_snapshot_is_immutable(self) -> None:
 
         adapter = _make_adapter()
@@ -2461,7 +2406,7 @@ class TestQueryOrderBook:
             result.last_update_id = 999  # type: ignore[misc]
 
 
-_BINANCE_EXECUTION_REPORT_TRADE: dict[str, Any] = {
+_BINANCE_EXECUTION_REPORT_TRADE: Mapping[str, Any] = _frozen({
     'e': 'executionReport',
     'E': 1700000000000,
     's': 'BTCUSDT',
@@ -2483,14 +2428,13 @@ _BINANCE_EXECUTION_REPORT_TRADE: dict[str, Any] = {
     'T': 1700000001000,
     't': 99,
     'm': True,
-}
+})
 
 
 class TestParseExecutionReport:
 
-    def test_trade_fill(self) -> None:
+    def test_trade_fill(self, adapter: BinanceAdapter) -> None:
 
-        adapter = _make_adapter()
         result = adapter.parse_execution_report(_BINANCE_EXECUTION_REPORT_TRADE)
         assert isinstance(result, ExecutionReport)
         assert result.symbol == 'BTCUSDT'
@@ -2511,25 +2455,22 @@ class TestParseExecutionReport:
         assert result.venue_trade_id == '99'
         assert result.is_maker is True
 
-    def test_event_time_is_utc(self) -> None:
+    def test_event_time_is_utc(self, adapter: BinanceAdapter) -> None:
 
-        adapter = _make_adapter()
         result = adapter.parse_execution_report(_BINANCE_EXECUTION_REPORT_TRADE)
         assert result.event_time.tzinfo == UTC
         expected = datetime.fromtimestamp(1700000000, tz=UTC)
         assert result.event_time == expected
 
-    def test_transaction_time_is_utc(self) -> None:
+    def test_transaction_time_is_utc(self, adapter: BinanceAdapter) -> None:
 
-        adapter = _make_adapter()
         result = adapter.parse_execution_report(_BINANCE_EXECUTION_REPORT_TRADE)
         assert result.transaction_time.tzinfo == UTC
         expected = datetime.fromtimestamp(1700000001, tz=UTC)
         assert result.transaction_time == expected
 
-    def test_new_order_no_fill(self) -> None:
+    def test_new_order_no_fill(self, adapter: BinanceAdapter) -> None:
 
-        adapter = _make_adapter()
         data = dict(_BINANCE_EXECUTION_REPORT_TRADE)
         data['x'] = 'NEW'
         data['X'] = 'NEW'
@@ -2550,9 +2491,8 @@ class TestParseExecutionReport:
         assert result.venue_trade_id is None
         assert result.is_maker is False
 
-    def test_canceled_order(self) -> None:
+    def test_canceled_order(self, adapter: BinanceAdapter) -> None:
 
-        adapter = _make_adapter()
         data = dict(_BINANCE_EXECUTION_REPORT_TRADE)
         data['x'] = 'CANCELED'
         data['X'] = 'CANCELED'
@@ -2560,9 +2500,8 @@ class TestParseExecutionReport:
         assert result.execution_type == ExecutionType.CANCELED
         assert result.order_status == OrderStatus.CANCELED
 
-    def test_replaced_order(self) -> None:
+    def test_replaced_order(self, adapter: BinanceAdapter) -> None:
 
-        adapter = _make_adapter()
         data = dict(_BINANCE_EXECUTION_REPORT_TRADE)
         data['x'] = 'REPLACED'
         data['X'] = 'CANCELED'
@@ -2570,9 +2509,8 @@ class TestParseExecutionReport:
         assert result.execution_type == ExecutionType.REPLACED
         assert result.order_status == OrderStatus.CANCELED
 
-    def test_rejected_order(self) -> None:
+    def test_rejected_order(self, adapter: BinanceAdapter) -> None:
 
-        adapter = _make_adapter()
         data = dict(_BINANCE_EXECUTION_REPORT_TRADE)
         data['x'] = 'REJECTED'
         data['X'] = 'REJECTED'
@@ -2582,9 +2520,8 @@ class TestParseExecutionReport:
         assert result.order_status == OrderStatus.REJECTED
         assert result.reject_reason == 'INSUFFICIENT_BALANCE'
 
-    def test_expired_ioc(self) -> None:
+    def test_expired_ioc(self, adapter: BinanceAdapter) -> None:
 
-        adapter = _make_adapter()
         data = dict(_BINANCE_EXECUTION_REPORT_TRADE)
         data['x'] = 'EXPIRED'
         data['X'] = 'EXPIRED'
@@ -2595,9 +2532,8 @@ class TestParseExecutionReport:
         assert result.order_status == OrderStatus.EXPIRED
         assert result.order_type == OrderType.LIMIT_IOC
 
-    def test_trade_prevention(self) -> None:
+    def test_trade_prevention(self, adapter: BinanceAdapter) -> None:
 
-        adapter = _make_adapter()
         data = dict(_BINANCE_EXECUTION_REPORT_TRADE)
         data['x'] = 'TRADE_PREVENTION'
         data['X'] = 'EXPIRED'
@@ -2605,9 +2541,8 @@ class TestParseExecutionReport:
         assert result.execution_type == ExecutionType.TRADE_PREVENTION
         assert result.order_status == OrderStatus.EXPIRED
 
-    def test_market_order(self) -> None:
+    def test_market_order(self, adapter: BinanceAdapter) -> None:
 
-        adapter = _make_adapter()
         data = dict(_BINANCE_EXECUTION_REPORT_TRADE)
         data['o'] = 'MARKET'
         data['f'] = ''
@@ -2616,41 +2551,36 @@ class TestParseExecutionReport:
         assert result.order_type == OrderType.MARKET
         assert result.original_price == Decimal('0')
 
-    def test_unknown_execution_type_raises(self) -> None:
+    def test_unknown_execution_type_raises(self, adapter: BinanceAdapter) -> None:
 
-        adapter = _make_adapter()
         data = dict(_BINANCE_EXECUTION_REPORT_TRADE)
         data['x'] = 'UNKNOWN_TYPE'
         with pytest.raises(ValueError, match='Unknown Binance execution type'):
             adapter.parse_execution_report(data)
 
-    def test_unknown_order_status_raises(self) -> None:
+    def test_unknown_order_status_raises(self, adapter: BinanceAdapter) -> None:
 
-        adapter = _make_adapter()
         data = dict(_BINANCE_EXECUTION_REPORT_TRADE)
         data['X'] = 'UNKNOWN_STATUS'
         with pytest.raises(ValueError, match='Unknown Binance order status'):
             adapter.parse_execution_report(data)
 
-    def test_unknown_order_type_raises(self) -> None:
+    def test_unknown_order_type_raises(self, adapter: BinanceAdapter) -> None:
 
-        adapter = _make_adapter()
         data = dict(_BINANCE_EXECUTION_REPORT_TRADE)
         data['o'] = 'UNKNOWN_ORDER_TYPE'
         with pytest.raises(ValueError, match='Unknown Binance order type'):
             adapter.parse_execution_report(data)
 
-    def test_is_maker_false(self) -> None:
+    def test_is_maker_false(self, adapter: BinanceAdapter) -> None:
 
-        adapter = _make_adapter()
         data = dict(_BINANCE_EXECUTION_REPORT_TRADE)
         data['m'] = False
         result = adapter.parse_execution_report(data)
         assert result.is_maker is False
 
-    def test_decimal_precision_preserved(self) -> None:
+    def test_decimal_precision_preserved(self, adapter: BinanceAdapter) -> None:
 
-        adapter = _make_adapter()
         result = adapter.parse_execution_report(_BINANCE_EXECUTION_REPORT_TRADE)
         assert str(result.original_qty) == '1.00000000'
         assert str(result.original_price) == '50000.00000000'
@@ -2661,12 +2591,11 @@ class TestParseExecutionReport:
 
 class TestBuildOcoParams:
 
-    def test_required_params(self) -> None:
+    def test_required_params(self, adapter: BinanceAdapter) -> None:
 
-        adapter = _make_adapter()
         params = adapter._build_oco_params(
             'BTCUSDT', OrderSide.SELL, Decimal('0.01'),
-            price=Decimal('50000'), stop_price=Decimal('48000'),
+            price=_PRICE_50K, stop_price=_STOP_PRICE_48K,
         )
         assert params['symbol'] == 'BTCUSDT'
         assert params['side'] == 'SELL'
@@ -2677,34 +2606,31 @@ class TestBuildOcoParams:
         assert 'stopLimitPrice' not in params
         assert 'stopLimitTimeInForce' not in params
 
-    def test_stop_limit_price_included(self) -> None:
+    def test_stop_limit_price_included(self, adapter: BinanceAdapter) -> None:
 
-        adapter = _make_adapter()
         params = adapter._build_oco_params(
             'BTCUSDT', OrderSide.SELL, Decimal('0.01'),
-            price=Decimal('50000'), stop_price=Decimal('48000'),
+            price=_PRICE_50K, stop_price=_STOP_PRICE_48K,
             stop_limit_price=Decimal('47500'),
         )
         assert params['stopLimitPrice'] == '47500'
         assert params['stopLimitTimeInForce'] == 'GTC'
 
-    def test_time_in_force_passed_through(self) -> None:
+    def test_time_in_force_passed_through(self, adapter: BinanceAdapter) -> None:
 
-        adapter = _make_adapter()
         params = adapter._build_oco_params(
             'BTCUSDT', OrderSide.SELL, Decimal('0.01'),
-            price=Decimal('50000'), stop_price=Decimal('48000'),
+            price=_PRICE_50K, stop_price=_STOP_PRICE_48K,
             stop_limit_price=Decimal('47500'),
             time_in_force='IOC',
         )
         assert params['stopLimitTimeInForce'] == 'IOC'
 
-    def test_client_order_id_as_list_client_order_id(self) -> None:
+    def test_client_order_id_as_list_client_order_id(self, adapter: BinanceAdapter) -> None:
 
-        adapter = _make_adapter()
         params = adapter._build_oco_params(
             'BTCUSDT', OrderSide.BUY, Decimal('1'),
-            price=Decimal('50000'), stop_price=Decimal('48000'),
+            price=_PRICE_50K, stop_price=_STOP_PRICE_48K,
             client_order_id='ss-cmd1-0',
         )
         assert params['listClientOrderId'] == 'ss-cmd1-0'
@@ -2712,17 +2638,15 @@ class TestBuildOcoParams:
 
 class TestParseOcoResponse:
 
-    def test_executing_maps_to_open(self) -> None:
+    def test_executing_maps_to_open(self, adapter: BinanceAdapter) -> None:
 
-        adapter = _make_adapter()
         result = adapter._parse_oco_response(_BINANCE_OCO_RESPONSE)
         assert result.venue_order_id == '99999'
         assert result.status == OrderStatus.OPEN
         assert result.immediate_fills == ()
 
-    def test_all_done_with_fills(self) -> None:
+    def test_all_done_with_fills(self, adapter: BinanceAdapter) -> None:
 
-        adapter = _make_adapter()
         result = adapter._parse_oco_response(_BINANCE_OCO_RESPONSE_WITH_FILLS)
         assert result.venue_order_id == '99999'
         assert result.status == OrderStatus.FILLED
@@ -2734,9 +2658,8 @@ class TestParseOcoResponse:
         assert fill.fee == Decimal('0.00001')
         assert fill.fee_asset == 'BTC'
 
-    def test_all_done_canceled_no_fills(self) -> None:
+    def test_all_done_canceled_no_fills(self, adapter: BinanceAdapter) -> None:
 
-        adapter = _make_adapter()
         canceled_response: dict[str, Any] = {
             'orderListId': 99999,
             'contingencyType': 'OCO',
@@ -2755,9 +2678,8 @@ class TestParseOcoResponse:
         assert result.status == OrderStatus.CANCELED
         assert result.immediate_fills == ()
 
-    def test_all_done_partially_filled(self) -> None:
+    def test_all_done_partially_filled(self, adapter: BinanceAdapter) -> None:
 
-        adapter = _make_adapter()
         partial_response: dict[str, Any] = {
             'orderListId': 99999,
             'contingencyType': 'OCO',
@@ -2784,9 +2706,8 @@ class TestParseOcoResponse:
         assert result.status == OrderStatus.PARTIALLY_FILLED
         assert len(result.immediate_fills) == 1
 
-    def test_all_done_expired_legs(self) -> None:
+    def test_all_done_expired_legs(self, adapter: BinanceAdapter) -> None:
 
-        adapter = _make_adapter()
         expired_response: dict[str, Any] = {
             'orderListId': 99999,
             'contingencyType': 'OCO',
@@ -2805,9 +2726,8 @@ class TestParseOcoResponse:
         assert result.status == OrderStatus.EXPIRED
         assert result.immediate_fills == ()
 
-    def test_is_maker_read_from_payload(self) -> None:
+    def test_is_maker_read_from_payload(self, adapter: BinanceAdapter) -> None:
 
-        adapter = _make_adapter()
         response_with_maker: dict[str, Any] = {
             **_BINANCE_OCO_RESPONSE_WITH_FILLS,
             'orderReports': [
@@ -2838,9 +2758,9 @@ class TestParseOcoResponse:
             adapter._parse_oco_response(bad)
 
 
+@_module_loop
 class TestSubmitOcoOrder:
 
-    @pytest.mark.asyncio
     async def test_oco_dispatches_to_oco_endpoint(self) -> None:
 
         adapter = _make_adapter()
@@ -2848,50 +2768,47 @@ class TestSubmitOcoOrder:
         result = await adapter.submit_order(
             _ACCOUNT_ID, 'BTCUSDT', OrderSide.SELL, OrderType.OCO,
             Decimal('0.01'),
-            price=Decimal('50000'), stop_price=Decimal('48000'),
+            price=_PRICE_50K, stop_price=_STOP_PRICE_48K,
             stop_limit_price=Decimal('47500'),
         )
         assert result.venue_order_id == '99999'
         assert result.status == OrderStatus.OPEN
 
-        call_args = adapter._session.request.call_args  # type: ignore[union-attr]
+        call_args = _request_calls(adapter)[-1]
         assert '/api/v3/order/oco?' in call_args.args[1]
 
-    @pytest.mark.asyncio
     async def test_oco_missing_price_raises(self) -> None:
 
         adapter = _make_adapter()
         with pytest.raises(ValueError, match='price and stop_price are required'):
             await adapter.submit_order(
                 _ACCOUNT_ID, 'BTCUSDT', OrderSide.SELL, OrderType.OCO,
-                Decimal('0.01'), stop_price=Decimal('48000'),
+                Decimal('0.01'), stop_price=_STOP_PRICE_48K,
             )
 
-    @pytest.mark.asyncio
     async def test_oco_missing_stop_price_raises(self) -> None:
 
         adapter = _make_adapter()
         with pytest.raises(ValueError, match='price and stop_price are required'):
             await adapter.submit_order(
                 _ACCOUNT_ID, 'BTCUSDT', OrderSide.SELL, OrderType.OCO,
-                Decimal('0.01'), price=Decimal('50000'),
+                Decimal('0.01'), price=_PRICE_50K,
             )
 
-    @pytest.mark.asyncio
     async def test_stop_limit_price_rejected_for_non_oco(self) -> None:
 
         adapter = _make_adapter()
         with pytest.raises(ValueError, match='stop_limit_price is only supported for OCO'):
             await adapter.submit_order(
                 _ACCOUNT_ID, 'BTCUSDT', OrderSide.BUY, OrderType.LIMIT,
-                Decimal('0.01'), price=Decimal('50000'),
+                Decimal('0.01'), price=_PRICE_50K,
                 stop_limit_price=Decimal('49000'),
             )
 
 
+@_module_loop
 class TestCancelOrderList:
 
-    @pytest.mark.asyncio
     async def test_cancel_with_list_client_order_id(self) -> None:
 
         adapter = _make_adapter()
@@ -2914,10 +2831,9 @@ class TestCancelOrderList:
         assert result.venue_order_id == '99999'
         assert result.status == OrderStatus.CANCELED
 
-        call_args = adapter._session.request.call_args  # type: ignore[union-attr]
+        call_args = _request_calls(adapter)[-1]
         assert '/api/v3/orderList?' in call_args.args[1]
 
-    @pytest.mark.asyncio
     async def test_cancel_with_order_list_id(self) -> None:
 
         adapter = _make_adapter()
@@ -2940,7 +2856,6 @@ class TestCancelOrderList:
         assert result.venue_order_id == '99999'
         assert result.status == OrderStatus.CANCELED
 
-    @pytest.mark.asyncio
     async def test_cancel_with_neither_raises(self) -> None:
 
         adapter = _make_adapter()
@@ -3035,7 +2950,7 @@ class TestHealthSignals:
         assert adapter.rate_limit_utilization == 0.0
         assert adapter.weight_headroom == 1.0
 
-    @pytest.mark.asyncio
+    @_module_loop
     async def test_successful_signed_request_records_success(self) -> None:
 
         adapter = _make_adapter()
@@ -3047,7 +2962,7 @@ class TestHealthSignals:
         assert snapshot.consecutive_failures == 0
         assert snapshot.failure_rate == 0.0
 
-    @pytest.mark.asyncio
+    @_module_loop
     async def test_non_retryable_rate_limit_records_failure(self) -> None:
 
         adapter = _make_adapter()
@@ -3092,7 +3007,7 @@ class TestHealthSignals:
         assert snap_b.consecutive_failures == 0
         assert snap_b.failure_rate == 0.0
 
-    @pytest.mark.asyncio
+    @_module_loop
     async def test_not_found_error_records_failure_without_binsim_url(
         self,
         monkeypatch: pytest.MonkeyPatch,
@@ -3111,10 +3026,7 @@ class TestHealthSignals:
 
         monkeypatch.delenv('BINSIM_URL', raising=False)
         adapter = _make_adapter()
-        _patch_session(adapter, _mock_response(400, {
-            'code': _BINANCE_ORDER_NOT_EXIST_CODE,
-            'msg': _BINANCE_ORDER_NOT_EXIST_MSG,
-        }))
+        _patch_session(adapter, _mock_response(400, _NOT_FOUND_ERROR_BODY))
 
         with pytest.raises(NotFoundError):
             await adapter._signed_request('GET', '/api/v3/order', {}, _ACCOUNT_ID)
@@ -3123,7 +3035,7 @@ class TestHealthSignals:
         assert snapshot.consecutive_failures == 1
         assert snapshot.failure_rate == 1.0
 
-    @pytest.mark.asyncio
+    @_module_loop
     async def test_not_found_error_skipped_with_binsim_url(
         self,
         monkeypatch: pytest.MonkeyPatch,
@@ -3144,10 +3056,7 @@ class TestHealthSignals:
 
         monkeypatch.setenv('BINSIM_URL', 'http://binsim:8081')
         adapter = _make_adapter()
-        _patch_session(adapter, _mock_response(400, {
-            'code': _BINANCE_ORDER_NOT_EXIST_CODE,
-            'msg': _BINANCE_ORDER_NOT_EXIST_MSG,
-        }))
+        _patch_session(adapter, _mock_response(400, _NOT_FOUND_ERROR_BODY))
 
         with pytest.raises(NotFoundError):
             await adapter._signed_request('GET', '/api/v3/order', {}, _ACCOUNT_ID)
@@ -3156,7 +3065,7 @@ class TestHealthSignals:
         assert snapshot.consecutive_failures == 0
         assert snapshot.failure_rate == 0.0
 
-    @pytest.mark.asyncio
+    @_module_loop
     async def test_not_found_error_still_records_with_blank_binsim_url(
         self,
         monkeypatch: pytest.MonkeyPatch,
@@ -3171,10 +3080,7 @@ class TestHealthSignals:
 
         monkeypatch.setenv('BINSIM_URL', '   ')
         adapter = _make_adapter()
-        _patch_session(adapter, _mock_response(400, {
-            'code': _BINANCE_ORDER_NOT_EXIST_CODE,
-            'msg': _BINANCE_ORDER_NOT_EXIST_MSG,
-        }))
+        _patch_session(adapter, _mock_response(400, _NOT_FOUND_ERROR_BODY))
 
         with pytest.raises(NotFoundError):
             await adapter._signed_request('GET', '/api/v3/order', {}, _ACCOUNT_ID)
@@ -3183,7 +3089,7 @@ class TestHealthSignals:
         assert snapshot.consecutive_failures == 1
         assert snapshot.failure_rate == 1.0
 
-    @pytest.mark.asyncio
+    @_module_loop
     async def test_order_rejected_error_records_as_success_and_resets_consecutive_failures(
         self,
     ) -> None:
@@ -3231,7 +3137,7 @@ class TestHealthSignals:
         assert snapshot.consecutive_failures == 0
         assert snapshot.failure_rate == 0.5
 
-    @pytest.mark.asyncio
+    @_module_loop
     async def test_min_notional_rejection_records_as_success_and_resets_consecutive_failures(
         self,
     ) -> None:
@@ -3265,7 +3171,7 @@ class TestHealthSignals:
         assert snapshot.consecutive_failures == 0
         assert snapshot.failure_rate == 0.5
 
-    @pytest.mark.asyncio
+    @_module_loop
     async def test_authentication_error_still_records_health_failure(
         self,
     ) -> None:
@@ -3292,7 +3198,7 @@ class TestHealthSignals:
         assert snapshot.consecutive_failures == 1
         assert snapshot.failure_rate == 1.0
 
-    @pytest.mark.asyncio
+    @_module_loop
     async def test_submit_order_with_client_order_id_records_success_on_2010(
         self,
     ) -> None:
@@ -3327,7 +3233,7 @@ class TestHealthSignals:
         with pytest.raises(DuplicateClientOrderIdError):
             await adapter.submit_order(
                 _ACCOUNT_ID, 'BTCUSDT', OrderSide.BUY, OrderType.MARKET,
-                Decimal('1.0'),
+                _QTY_ONE,
                 client_order_id='cid-end-to-end',
             )
 
@@ -3335,58 +3241,36 @@ class TestHealthSignals:
         assert snapshot.consecutive_failures == 0
         assert snapshot.failure_rate == 0.5
 
-    @pytest.mark.asyncio
+    @_module_loop
     async def test_sync_clock_drift_populates_drift_ms(self) -> None:
 
         adapter = BinanceAdapter(_BASE_URL, _WS_BASE_URL, _WS_API_URL)
         target_drift_ms = 12345.0
 
-        response = AsyncMock()
-        response.status = 200
-        response.json = AsyncMock(
-            return_value={'serverTime': time.time() * 1000.0 + target_drift_ms},
-        )
-        ctx = MagicMock()
-        ctx.__aenter__ = AsyncMock(return_value=response)
-        ctx.__aexit__ = AsyncMock(return_value=False)
-        session = MagicMock()
-        session.get = MagicMock(return_value=ctx)
-        session.closed = False
-        adapter._session = session
+        _patch_session(adapter, _mock_response(
+            200, {'serverTime': time.time() * 1000.0 + target_drift_ms},
+        ))
 
         await adapter.sync_clock_drift()
 
         assert adapter.clock_drift_ms == pytest.approx(target_drift_ms, rel=0.05)
 
-    @pytest.mark.asyncio
+    @_module_loop
     async def test_sync_clock_drift_silent_on_non_ok_status(self) -> None:
 
         adapter = BinanceAdapter(_BASE_URL, _WS_BASE_URL, _WS_API_URL)
 
-        response = AsyncMock()
-        response.status = 503
-        response.json = AsyncMock(return_value={})
-        ctx = MagicMock()
-        ctx.__aenter__ = AsyncMock(return_value=response)
-        ctx.__aexit__ = AsyncMock(return_value=False)
-        session = MagicMock()
-        session.get = MagicMock(return_value=ctx)
-        session.closed = False
-        adapter._session = session
+        _patch_session(adapter, _mock_response(503))
 
         await adapter.sync_clock_drift()
 
         assert adapter.clock_drift_ms == 0.0
 
-    @pytest.mark.asyncio
+    @_module_loop
     async def test_sync_clock_drift_silent_on_transport_error(self) -> None:
 
         adapter = BinanceAdapter(_BASE_URL, _WS_BASE_URL, _WS_API_URL)
-
-        session = MagicMock()
-        session.get = MagicMock(side_effect=aiohttp.ClientError('boom'))
-        session.closed = False
-        adapter._session = session
+        _patch_session(adapter, aiohttp.ClientError('boom'))
 
         await adapter.sync_clock_drift()
 
@@ -3401,7 +3285,7 @@ class TestQuantizeForCommand:
         raw = Decimal('0.0002455253013823074467823909254')
 
         result = adapter.quantize_for_command(
-            'UNKNOWN', raw, OrderType.MARKET, reference_price=Decimal('80000'),
+            'UNKNOWN', raw, OrderType.MARKET, reference_price=_REF_PRICE_80K,
         )
 
         assert result.snapped_qty == raw
@@ -3412,23 +3296,23 @@ class TestQuantizeForCommand:
         adapter = _make_adapter()
         adapter._filters['BTCUSDT'] = SymbolFilters(
             symbol='BTCUSDT',
-            tick_size=Decimal('0.01'),
-            lot_step=Decimal('0.00001'),
-            lot_min=Decimal('0.00001'),
-            lot_max=Decimal('9000.0'),
-            min_notional=Decimal('5.0'),
+            tick_size=_TICK_SIZE,
+            lot_step=_LOT_STEP,
+            lot_min=_LOT_STEP,
+            lot_max=_LOT_MAX,
+            min_notional=_MIN_NOTIONAL,
         )
-        raw = Decimal('20') / Decimal('81458')
+        raw = Decimal('20') / _REF_PRICE_81458
 
         result = adapter.quantize_for_command(
-            'BTCUSDT', raw, OrderType.MARKET, reference_price=Decimal('81458'),
+            'BTCUSDT', raw, OrderType.MARKET, reference_price=_REF_PRICE_81458,
         )
 
         assert result.rejection_reason is None
         assert result.snapped_qty is not None
-        assert result.snapped_qty == Decimal('0.00024')
-        assert result.snapped_qty % Decimal('0.00001') == 0
-        assert result.snapped_qty * Decimal('81458') >= Decimal('5.0')
+        assert result.snapped_qty == _SNAPPED_QTY_20_USDT
+        assert result.snapped_qty % _LOT_STEP == 0
+        assert result.snapped_qty * _REF_PRICE_81458 >= Decimal('5.0')
 
     def test_preserves_already_aligned_qty(self) -> None:
 
@@ -3437,7 +3321,7 @@ class TestQuantizeForCommand:
 
         result = adapter.quantize_for_command(
             'BTCUSDT', Decimal('1.50000'), OrderType.MARKET,
-            reference_price=Decimal('80000'),
+            reference_price=_REF_PRICE_80K,
         )
 
         assert result.rejection_reason is None
@@ -3450,7 +3334,7 @@ class TestQuantizeForCommand:
 
         result = adapter.quantize_for_command(
             'BTCUSDT', Decimal('0.0005'), OrderType.MARKET,
-            reference_price=Decimal('80000'),
+            reference_price=_REF_PRICE_80K,
         )
 
         assert result.snapped_qty is None
@@ -3463,7 +3347,7 @@ class TestQuantizeForCommand:
         adapter = _make_adapter()
         adapter._filters['XYZUSDT'] = SymbolFilters(
             symbol='XYZUSDT',
-            tick_size=Decimal('0.01'),
+            tick_size=_TICK_SIZE,
             lot_step=Decimal('5'),
             lot_min=Decimal('1'),
             lot_max=Decimal('1000'),
@@ -3486,16 +3370,16 @@ class TestQuantizeForCommand:
         adapter = _make_adapter()
         adapter._filters['BTCUSDT'] = SymbolFilters(
             symbol='BTCUSDT',
-            tick_size=Decimal('0.01'),
-            lot_step=Decimal('0.00001'),
-            lot_min=Decimal('0.00001'),
-            lot_max=Decimal('9000.0'),
-            min_notional=Decimal('5.0'),
+            tick_size=_TICK_SIZE,
+            lot_step=_LOT_STEP,
+            lot_min=_LOT_STEP,
+            lot_max=_LOT_MAX,
+            min_notional=_MIN_NOTIONAL,
         )
         raw = Decimal('0.00002')
 
         result = adapter.quantize_for_command(
-            'BTCUSDT', raw, OrderType.MARKET, reference_price=Decimal('80000'),
+            'BTCUSDT', raw, OrderType.MARKET, reference_price=_REF_PRICE_80K,
         )
 
         assert result.snapped_qty is None
@@ -3507,11 +3391,11 @@ class TestQuantizeForCommand:
         adapter = _make_adapter()
         adapter._filters['BTCUSDT'] = SymbolFilters(
             symbol='BTCUSDT',
-            tick_size=Decimal('0.01'),
-            lot_step=Decimal('0.00001'),
-            lot_min=Decimal('0.00001'),
-            lot_max=Decimal('9000.0'),
-            min_notional=Decimal('5.0'),
+            tick_size=_TICK_SIZE,
+            lot_step=_LOT_STEP,
+            lot_min=_LOT_STEP,
+            lot_max=_LOT_MAX,
+            min_notional=_MIN_NOTIONAL,
         )
 
         result = adapter.quantize_for_command(
@@ -3527,8 +3411,8 @@ class TestQuantizeForCommand:
         adapter._filters['BTCUSDT'] = _TEST_FILTERS
 
         result = adapter.quantize_for_command(
-            'BTCUSDT', Decimal('1.0'), OrderType.MARKET,
-            reference_price=Decimal('80000'),
+            'BTCUSDT', _QTY_ONE, OrderType.MARKET,
+            reference_price=_REF_PRICE_80K,
         )
 
         assert isinstance(result, CommandQuantization)
@@ -3538,16 +3422,16 @@ class TestQuantizeForCommand:
         adapter = _make_adapter()
         adapter._filters['BTCUSDT'] = SymbolFilters(
             symbol='BTCUSDT',
-            tick_size=Decimal('0.01'),
-            lot_step=Decimal('0.00001'),
-            lot_min=Decimal('0.00001'),
-            lot_max=Decimal('9000.0'),
-            min_notional=Decimal('5.0'),
+            tick_size=_TICK_SIZE,
+            lot_step=_LOT_STEP,
+            lot_min=_LOT_STEP,
+            lot_max=_LOT_MAX,
+            min_notional=_MIN_NOTIONAL,
         )
-        raw = Decimal('20') / Decimal('81458')
+        raw = Decimal('20') / _REF_PRICE_81458
 
         intake = adapter.quantize_for_command(
-            'BTCUSDT', raw, OrderType.MARKET, reference_price=Decimal('81458'),
+            'BTCUSDT', raw, OrderType.MARKET, reference_price=_REF_PRICE_81458,
         )
 
         assert intake.snapped_qty is not None
@@ -3563,7 +3447,7 @@ class TestQuantizeForCommand:
 
         result = adapter.quantize_for_command(
             'BTCUSDT', Decimal('NaN'), OrderType.MARKET,
-            reference_price=Decimal('80000'),
+            reference_price=_REF_PRICE_80K,
         )
 
         assert result.snapped_qty is None
@@ -3577,7 +3461,7 @@ class TestQuantizeForCommand:
 
         result = adapter.quantize_for_command(
             'BTCUSDT', Decimal('Infinity'), OrderType.MARKET,
-            reference_price=Decimal('80000'),
+            reference_price=_REF_PRICE_80K,
         )
 
         assert result.snapped_qty is None
@@ -3590,7 +3474,7 @@ class TestQuantizeForCommand:
         adapter._filters['BTCUSDT'] = _TEST_FILTERS
 
         result = adapter.quantize_for_command(
-            'BTCUSDT', Decimal('1.0'), OrderType.MARKET,
+            'BTCUSDT', _QTY_ONE, OrderType.MARKET,
             reference_price=Decimal('NaN'),
         )
 
@@ -3615,9 +3499,9 @@ class TestCommandQuantizationInvariant:
 
     def test_accepts_snapped_qty_only(self) -> None:
 
-        result = CommandQuantization(snapped_qty=Decimal('0.00024'), rejection_reason=None)
+        result = CommandQuantization(snapped_qty=_SNAPPED_QTY_20_USDT, rejection_reason=None)
 
-        assert result.snapped_qty == Decimal('0.00024')
+        assert result.snapped_qty == _SNAPPED_QTY_20_USDT
         assert result.rejection_reason is None
 
     def test_accepts_rejection_reason_only(self) -> None:
@@ -3641,9 +3525,9 @@ class TestCommandQuantizationInvariant:
             )
 
 
+@_module_loop
 class TestQueryApiPermissions:
 
-    @pytest.mark.asyncio
     async def test_parses_trade_only_key(self) -> None:
         adapter = _make_adapter()
         _patch_session(
@@ -3659,7 +3543,6 @@ class TestQueryApiPermissions:
         assert perms.enable_withdrawals is False
         assert perms.enable_spot_and_margin_trading is True
 
-    @pytest.mark.asyncio
     async def test_missing_flag_fails_closed(self) -> None:
         adapter = _make_adapter()
         _patch_session(adapter, _mock_response(200, {'enableWithdrawals': False}))
@@ -3667,7 +3550,6 @@ class TestQueryApiPermissions:
         with pytest.raises(VenueError, match='enableSpotAndMarginTrading'):
             await adapter.query_api_permissions(_ACCOUNT_ID)
 
-    @pytest.mark.asyncio
     async def test_non_bool_flag_fails_closed(self) -> None:
         adapter = _make_adapter()
         _patch_session(
@@ -10,7 +10,6 @@ transport retries and translates rescue-trigger conditions into
 from __future__ import annotations
 
 from decimal import Decimal
-from unittest.mock import AsyncMock, MagicMock
 
 import aiohttp
 import pytest
@@ -23,6 +22,7 @@ from praxis.infrastructure.venue_adapter import (
     OrderRejectedError,
     OrderSubmitTimeoutError,
 )
+from tests.support.fake_session import _mock_response, _patch_session, _request_calls
 
 _BASE_URL = 'https://stub'
 _WS_BASE_URL = 'wss://stub'
@@ -40,17 +40,6 @@ def _make_adapter() -> BinanceAdapter:
     )
 
 
-def _patch_session_with_side_effect(
-    adapter: BinanceAdapter,
-    side_effect: object,
-) -> MagicMock:
-    session = MagicMock()
-    session.request = MagicMock(side_effect=side_effect)
-    session.closed = False
-    adapter._session = session
-    return session
-
-
 class TestPostOrderRescuePolicy:
 
     @pytest.mark.asyncio
@@ -62,9 +51,7 @@ class TestPostOrderRescuePolicy:
         a duplicate.'''
 
         adapter = _make_adapter()
-        session = _patch_session_with_side_effect(
-            adapter, TimeoutError('connection timed out'),
-        )
+        _patch_session(adapter, TimeoutError('connection timed out'))
 
         with pytest.raises(OrderSubmitTimeoutError) as exc_info:
             await adapter.submit_order(
@@ -74,7 +61,7 @@ class TestPostOrderRescuePolicy:
             )
 
         assert exc_info.value.client_order_id == _CLIENT_ORDER_ID
-        assert session.request.call_count == 1
+        assert len(_request_calls(adapter)) == 1
 
     @pytest.mark.asyncio
     async def test_client_error_with_client_order_id_raises_submit_timeout_no_retry(
@@ -84,9 +71,7 @@ class TestPostOrderRescuePolicy:
         without retry.'''
 
         adapter = _make_adapter()
-        session = _patch_session_with_side_effect(
-            adapter, aiohttp.ClientError('connection reset'),
-        )
+        _patch_session(adapter, aiohttp.ClientError('connection reset'))
 
         with pytest.raises(OrderSubmitTimeoutError) as exc_info:
             await adapter.submit_order(
@@ -96,7 +81,7 @@ class TestPostOrderRescuePolicy:
             )
 
         assert exc_info.value.client_order_id == _CLIENT_ORDER_ID
-        assert session.request.call_count == 1
+        assert len(_request_calls(adapter)) == 1
 
     @pytest.mark.asyncio
     async def test_duplicate_client_order_id_code_raises_distinct_error(
@@ -106,16 +91,9 @@ class TestPostOrderRescuePolicy:
         DuplicateClientOrderIdError, not OrderRejectedError.'''
 
         adapter = _make_adapter()
-        resp = AsyncMock()
-        resp.status = 400
-        resp.json = AsyncMock(
-            return_value={'code': -2010, 'msg': 'Order already exists'},
+        _patch_session(
+            adapter, _mock_response(400, {'code': -2010, 'msg': 'Order already exists'}),
         )
-        resp.headers = {}
-        ctx = MagicMock()
-        ctx.__aenter__ = AsyncMock(return_value=resp)
-        ctx.__aexit__ = AsyncMock(return_value=False)
-        session = _patch_session_with_side_effect(adapter, [ctx])
 
         with pytest.raises(DuplicateClientOrderIdError) as exc_info:
             await adapter.submit_order(
@@ -125,7 +103,7 @@ class TestPostOrderRescuePolicy:
             )
 
         assert exc_info.value.client_order_id == _CLIENT_ORDER_ID
-        assert session.request.call_count == 1
+        assert len(_request_calls(adapter)) == 1
 
     @pytest.mark.asyncio
     async def test_other_venue_rejects_still_raise_order_rejected_error(
@@ -135,16 +113,9 @@ class TestPostOrderRescuePolicy:
         propagates as OrderRejectedError — only `-2010` triggers the rescue path.'''
 
         adapter = _make_adapter()
-        resp = AsyncMock()
-        resp.status = 400
-        resp.json = AsyncMock(
-            return_value={'code': -1013, 'msg': 'Filter failure'},
+        _patch_session(
+            adapter, _mock_response(400, {'code': -1013, 'msg': 'Filter failure'}),
         )
-        resp.headers = {}
-        ctx = MagicMock()
-        ctx.__aenter__ = AsyncMock(return_value=resp)
-        ctx.__aexit__ = AsyncMock(return_value=False)
-        _patch_session_with_side_effect(adapter, [ctx])
 
         with pytest.raises(OrderRejectedError) as exc_info:
             await adapter.submit_order(
@@ -160,20 +131,13 @@ class TestPostOrderRescuePolicy:
         '''Happy path: a successful POST returns a SubmitResult.'''
 
         adapter = _make_adapter()
-        resp = AsyncMock()
-        resp.status = 200
-        resp.json = AsyncMock(return_value={
+        _patch_session(adapter, _mock_response(200, {
             'orderId': 12345,
             'status': 'FILLED',
             'executedQty': '0.5',
             'cummulativeQuoteQty': '25000',
             'fills': [],
-        })
-        resp.headers = {}
-        ctx = MagicMock()
-        ctx.__aenter__ = AsyncMock(return_value=resp)
-        ctx.__aexit__ = AsyncMock(return_value=False)
-        session = _patch_session_with_side_effect(adapter, [ctx])
+        }))
 
         result = await adapter.submit_order(
             _ACCOUNT_ID, 'BTCUSDT', OrderSide.BUY, OrderType.MARKET,
@@ -182,4 +146,4 @@ class TestPostOrderRescuePolicy:
         )
 
         assert result.venue_order_id == '12345'
-        assert session.request.call_count == 1
+        assert len(_request_calls(adapter)) == 1
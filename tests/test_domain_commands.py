@@ -22,10 +22,18 @@ from praxis.core.domain import (
 )
 
 _TS = datetime(2026, 1, 1, tzinfo=UTC)
+_NAIVE_TS = datetime(2026, 1, 1)
+_QTY_ONE = Decimal('1.0')
+_PRICE_50K = Decimal('50000.00')
+_PRICE_49K = Decimal('49000.00')
+_PRICE_48500 = Decimal('48500.00')
+_QUOTE_QTY_100 = Decimal('100')
+_NON_POSITIVE = (Decimal('0'), Decimal('-1'))
+_NON_FINITE = (Decimal('NaN'), Decimal('Infinity'), Decimal('-Infinity'))
 
 
 def _command(
-    qty: Decimal = Decimal('1.0'),
+    qty: Decimal = _QTY_ONE,
     timeout: int = 60,
     reference_price: Decimal | None = None,
     execution_params: SingleShotParams | None = None,
@@ -40,7 +48,7 @@ def _command(
         qty=qty,
         order_type=OrderType.LIMIT,
         execution_mode=ExecutionMode.SINGLE_SHOT,
-        execution_params=execution_params or SingleShotParams(price=Decimal('50000.00')),
+        execution_params=execution_params or SingleShotParams(price=_PRICE_50K),
         timeout=timeout,
         reference_price=reference_price,
         maker_preference=MakerPreference.NO_PREFERENCE,
@@ -59,6 +67,12 @@ def _abort() -> TradeAbort:
     )
 
 
+@pytest.fixture(scope='module')
+def baseline_command() -> TradeCommand:
+
+    return _command()
+
+
 def test_execution_mode_members() -> None:
 
     expected = {
@@ -103,8 +117,8 @@ def test_enum_values_are_strings() -> None:
 
 def test_single_shot_params_creation() -> None:
 
-    params = SingleShotParams(price=Decimal('50000.00'))
-    assert params.price == Decimal('50000.00')
+    params = SingleShotParams(price=_PRICE_50K)
+    assert params.price == _PRICE_50K
     assert params.stop_price is None
     assert params.stop_limit_price is None
 
@@ -112,36 +126,36 @@ def test_single_shot_params_creation() -> None:
 def test_single_shot_params_all_fields() -> None:
 
     params = SingleShotParams(
-        price=Decimal('50000.00'),
-        stop_price=Decimal('49000.00'),
-        stop_limit_price=Decimal('48500.00'),
+        price=_PRICE_50K,
+        stop_price=_PRICE_49K,
+        stop_limit_price=_PRICE_48500,
     )
-    assert params.stop_price == Decimal('49000.00')
-    assert params.stop_limit_price == Decimal('48500.00')
+    assert params.stop_price == _PRICE_49K
+    assert params.stop_limit_price == _PRICE_48500
 
 
 def test_single_shot_params_frozen() -> None:
 
-    params = SingleShotParams(price=Decimal('50000.00'))
+    params = SingleShotParams(price=_PRICE_50K)
     with pytest.raises(AttributeError):
         params.price = Decimal('999')  # type: ignore[misc]
 
 
-@pytest.mark.parametrize('bad', [Decimal('0'), Decimal('-1')])
+@pytest.mark.parametrize('bad', _NON_POSITIVE)
 def test_single_shot_params_rejects_non_positive_price(bad: Decimal) -> None:
 
     with pytest.raises(ValueError, match='positive'):
         SingleShotParams(price=bad)
 
 
-@pytest.mark.parametrize('bad', [Decimal('0'), Decimal('-1')])
+@pytest.mark.parametrize('bad', _NON_POSITIVE)
 def test_single_shot_params_rejects_non_positive_stop_price(bad: Decimal) -> None:
 
     with pytest.raises(ValueError, match='positive'):
         SingleShotParams(stop_price=bad)
 
 
-@pytest.mark.parametrize('bad', [Decimal('0'), Decimal('-1')])
+@pytest.mark.parametrize('bad', _NON_POSITIVE)
 def test_single_shot_params_rejects_non_positive_stop_limit_price(bad: Decimal) -> None:
 
     with pytest.raises(ValueError, match='positive'):
@@ -156,9 +170,9 @@ def test_single_shot_params_none_prices_valid() -> None:
     assert params.stop_limit_price is None
 
 
-def test_trade_command_creation() -> None:
+def test_trade_command_creation(baseline_command: TradeCommand) -> None:
 
-    cmd = _command()
+    cmd = baseline_command
     assert cmd.command_id == 'cmd-001'
     assert cmd.symbol == 'BTCUSDT'
     assert cmd.execution_mode == ExecutionMode.SINGLE_SHOT
@@ -166,21 +180,20 @@ def test_trade_command_creation() -> None:
     assert cmd.stp_mode == STPMode.NONE
 
 
-def test_trade_command_frozen() -> None:
+def test_trade_command_frozen(baseline_command: TradeCommand) -> None:
 
-    cmd = _command()
     with pytest.raises(AttributeError):
-        cmd.qty = Decimal('999')  # type: ignore[misc]
+        baseline_command.qty = Decimal('999')  # type: ignore[misc]
 
 
-@pytest.mark.parametrize('bad', [Decimal('0'), Decimal('-1')])
+@pytest.mark.parametrize('bad', _NON_POSITIVE)
 def test_trade_command_rejects_non_positive_qty(bad: Decimal) -> None:
 
     with pytest.raises(ValueError, match='positive'):
         _command(qty=bad)
 
 
-@pytest.mark.parametrize('bad', [Decimal('NaN'), Decimal('Infinity'), Decimal('-Infinity')])
+@pytest.mark.parametrize('bad', _NON_FINITE)
 def test_trade_command_rejects_non_finite_qty(bad: Decimal) -> None:
 
     with pytest.raises(ValueError, match='finite positive Decimal'):
@@ -207,17 +220,16 @@ def test_trade_command_rejects_non_positive_timeout(bad: int) -> None:
         _command(timeout=bad)
 
 
-@pytest.mark.parametrize('bad', [Decimal('0'), Decimal('-1')])
+@pytest.mark.parametrize('bad', _NON_POSITIVE)
 def test_trade_command_rejects_non_positive_reference_price(bad: Decimal) -> None:
 
     with pytest.raises(ValueError, match='positive'):
         _command(reference_price=bad)
 
 
-def test_trade_command_none_reference_price_valid() -> None:
+def test_trade_command_none_reference_price_valid(baseline_command: TradeCommand) -> None:
 
-    cmd = _command(reference_price=None)
-    assert cmd.reference_price is None
+    assert baseline_command.reference_price is None
 
 
 def test_trade_command_quote_native_succeeds() -> None:
@@ -229,7 +241,7 @@ def test_trade_command_quote_native_succeeds() -> None:
         symbol='BTCUSDT',
         side=OrderSide.BUY,
         qty=None,
-        quote_qty=Decimal('100'),
+        quote_qty=_QUOTE_QTY_100,
         order_type=OrderType.MARKET,
         execution_mode=ExecutionMode.SINGLE_SHOT,
         execution_params=SingleShotParams(),
@@ -241,7 +253,7 @@ def test_trade_command_quote_native_succeeds() -> None:
     )
 
     assert cmd.qty is None
-    assert cmd.quote_qty == Decimal('100')
+    assert cmd.quote_qty == _QUOTE_QTY_100
     assert cmd.is_quote_native is True
 
 
@@ -260,8 +272,8 @@ def test_trade_command_rejects_both_qty_and_quote_qty() -> None:
             account_id='acc-1',
             symbol='BTCUSDT',
             side=OrderSide.BUY,
-            qty=Decimal('1.0'),
-            quote_qty=Decimal('100'),
+            qty=_QTY_ONE,
+            quote_qty=_QUOTE_QTY_100,
             order_type=OrderType.MARKET,
             execution_mode=ExecutionMode.SINGLE_SHOT,
             execution_params=SingleShotParams(),
@@ -295,7 +307,7 @@ def test_trade_command_rejects_neither_qty_nor_quote_qty() -> None:
         )
 
 
-@pytest.mark.parametrize('bad', [Decimal('0'), Decimal('-1')])
+@pytest.mark.parametrize('bad', _NON_POSITIVE)
 def test_trade_command_rejects_non_positive_quote_qty(bad: Decimal) -> None:
 
     with pytest.raises(ValueError, match='quote_qty must be a finite positive Decimal'):
@@ -318,7 +330,7 @@ def test_trade_command_rejects_non_positive_quote_qty(bad: Decimal) -> None:
         )
 
 
-@pytest.mark.parametrize('bad', [Decimal('NaN'), Decimal('Infinity'), Decimal('-Infinity')])
+@pytest.mark.parametrize('bad', _NON_FINITE)
 def test_trade_command_rejects_non_finite_quote_qty(bad: Decimal) -> None:
 
     with pytest.raises(ValueError, match='quote_qty must be a finite positive Decimal'):
@@ -341,30 +353,9 @@ def test_trade_command_rejects_non_finite_quote_qty(bad: Decimal) -> None:
         )
 
 
-def test_trade_command_rejects_naive_created_at() -> None:
-
-    with pytest.raises(ValueError, match='timezone-aware'):
-        TradeCommand(
-            command_id='cmd-001',
-            trade_id='trade-001',
-            account_id='acc-1',
-            symbol='BTCUSDT',
-            side=OrderSide.BUY,
-            qty=Decimal('1.0'),
-            order_type=OrderType.LIMIT,
-            execution_mode=ExecutionMode.SINGLE_SHOT,
-            execution_params=SingleShotParams(price=Decimal('50000.00')),
-            timeout=60,
-            reference_price=None,
-            maker_preference=MakerPreference.NO_PREFERENCE,
-            stp_mode=STPMode.NONE,
-            created_at=datetime(2026, 1, 1),
-        )
-
-
 def test_trade_command_financial_values_are_decimal() -> None:
 
-    cmd = _command(reference_price=Decimal('49000.00'))
+    cmd = _command(reference_price=_PRICE_49K)
     assert isinstance(cmd.qty, Decimal)
     assert isinstance(cmd.reference_price, Decimal)
 
@@ -384,15 +375,39 @@ def test_trade_abort_frozen() -> None:
         abort.reason = 'changed'  # type: ignore[misc]
 
 
-def test_trade_abort_rejects_naive_created_at() -> None:
+@pytest.mark.parametrize(
+    ('cls', 'kwargs'),
+    [
+        pytest.param(
+            TradeCommand,
+            {
+                'command_id': 'cmd-001',
+                'trade_id': 'trade-001',
+                'account_id': 'acc-1',
+                'symbol': 'BTCUSDT',
+                'side': OrderSide.BUY,
+                'qty': _QTY_ONE,
+                'order_type': OrderType.LIMIT,
+                'execution_mode': ExecutionMode.SINGLE_SHOT,
+                'execution_params': SingleShotParams(price=_PRICE_50K),
+                'timeout': 60,
+                'reference_price': None,
+                'maker_preference': MakerPreference.NO_PREFERENCE,
+                'stp_mode': STPMode.NONE,
+            },
+            id='trade-command',
+        ),
+        pytest.param(
+            TradeAbort,
+            {'command_id': 'cmd-001', 'account_id': 'acc-1', 'reason': 'test'},
+            id='trade-abort',
+        ),
+    ],
+)
+def test_rejects_naive_created_at(cls: type[Any], kwargs: dict[str, Any]) -> None:
 
     with pytest.raises(ValueError, match='timezone-aware'):
-        TradeAbort(
-            command_id='cmd-001',
-            account_id='acc-1',
-            reason='test',
-            created_at=datetime(2026, 1, 1),
-        )
+        cls(**kwargs, created_at=_NAIVE_TS)
 
 
 @pytest.mark.parametrize('field', ['command_id', 'trade_id', 'account_id', 'symbol'])
@@ -404,10 +419,10 @@ def test_trade_command_rejects_empty_string(field: str) -> None:
         'account_id': 'acc-1',
         'symbol': 'BTCUSDT',
         'side': OrderSide.BUY,
-        'qty': Decimal('1.0'),
+        'qty': _QTY_ONE,
         'order_type': OrderType.LIMIT,
         'execution_mode': ExecutionMode.SINGLE_SHOT,
-        'execution_params': SingleShotParams(price=Decimal('50000.00')),
+        'execution_params': SingleShotParams(price=_PRICE_50K),
         'timeout': 60,
         'reference_price': None,
         'maker_preference': MakerPreference.NO_PREFERENCE,
@@ -442,7 +457,7 @@ def test_trade_command_single_shot_requires_single_shot_params() -> None:
             account_id='acc-1',
             symbol='BTCUSDT',
             side=OrderSide.BUY,
-            qty=Decimal('1.0'),
+            qty=_QTY_ONE,
             order_type=OrderType.LIMIT,
             execution_mode=ExecutionMode.SINGLE_SHOT,
             execution_params='not_a_params_object',  # type: ignore[arg-type]
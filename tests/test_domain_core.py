@@ -4,8 +4,10 @@ Tests for praxis.core.domain dataclasses and enums.
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from datetime import datetime, UTC
 from decimal import Decimal
+from types import MappingProxyType
 from typing import Any
 
 import pytest
@@ -23,66 +25,104 @@ from praxis.core.domain.events import OrderSubmitIntent
 from praxis.core.domain.trade_outcome import TradeOutcome
 
 _TS = datetime(2026, 1, 1, tzinfo=UTC)
+_NAIVE_TS = datetime(2026, 1, 1)
+_ZERO = Decimal('0')
+_NEG_ONE = Decimal('-1')
+_QTY_ONE = Decimal('1.0')
+_QTY_HALF = Decimal('0.5')
+_PRICE_50K = Decimal('50000.00')
+_FEE = Decimal('0.001')
+_QUOTE_QTY_100 = Decimal('100')
+_NON_POSITIVE = (_ZERO, _NEG_ONE)
+_NON_FINITE = (Decimal('NaN'), Decimal('Infinity'), Decimal('-Infinity'))
+
+_FILL_KWARGS: Mapping[str, Any] = MappingProxyType({
+    'venue_trade_id': 'vt-001',
+    'venue_order_id': 'vo-001',
+    'client_order_id': 'new_order-cmd1-0',
+    'account_id': 'acc-1',
+    'trade_id': 'trade-1',
+    'command_id': 'cmd-1',
+    'symbol': 'BTCUSDT',
+    'side': OrderSide.BUY,
+    'qty': _QTY_HALF,
+    'price': _PRICE_50K,
+    'fee': _FEE,
+    'fee_asset': 'BTC',
+    'is_maker': True,
+    'timestamp': _TS,
+})
+
+_ORDER_KWARGS: Mapping[str, Any] = MappingProxyType({
+    'client_order_id': 'new_order-cmd1-0',
+    'venue_order_id': None,
+    'account_id': 'acc-1',
+    'command_id': 'cmd-1',
+    'symbol': 'BTCUSDT',
+    'side': OrderSide.BUY,
+    'order_type': OrderType.LIMIT,
+    'qty': _QTY_ONE,
+    'filled_qty': _ZERO,
+    'cumulative_notional': _ZERO,
+    'price': _PRICE_50K,
+    'stop_price': None,
+    'status': OrderStatus.SUBMITTING,
+    'created_at': _TS,
+    'updated_at': _TS,
+})
+
+_POSITION_KWARGS: Mapping[str, Any] = MappingProxyType({
+    'account_id': 'acc-1',
+    'trade_id': 'trade-1',
+    'symbol': 'BTCUSDT',
+    'side': OrderSide.BUY,
+    'qty': _QTY_ONE,
+    'avg_entry_price': _PRICE_50K,
+})
 
 
 def _fill(
     venue_trade_id: str = 'vt-001',
-    qty: Decimal = Decimal('0.5'),
-    price: Decimal = Decimal('50000.00'),
-    fee: Decimal = Decimal('0.001'),
+    qty: Decimal = _QTY_HALF,
+    price: Decimal = _PRICE_50K,
+    fee: Decimal = _FEE,
 ) -> Fill:
 
-    return Fill(
-        venue_trade_id=venue_trade_id,
-        venue_order_id='vo-001',
-        client_order_id='new_order-cmd1-0',
-        account_id='acc-1',
-        trade_id='trade-1',
-        command_id='cmd-1',
-        symbol='BTCUSDT',
-        side=OrderSide.BUY,
-        qty=qty,
-        price=price,
-        fee=fee,
-        fee_asset='BTC',
-        is_maker=True,
-        timestamp=_TS,
-    )
+    return Fill(**{
+        **_FILL_KWARGS,
+        'venue_trade_id': venue_trade_id,
+        'qty': qty,
+        'price': price,
+        'fee': fee,
+    })
 
 
 def _order(
     status: OrderStatus = OrderStatus.SUBMITTING,
-    qty: Decimal = Decimal('1.0'),
-    filled_qty: Decimal = Decimal('0'),
-    cumulative_notional: Decimal = Decimal('0'),
-    price: Decimal | None = Decimal('50000.00'),
+    qty: Decimal = _QTY_ONE,
+    filled_qty: Decimal = _ZERO,
+    cumulative_notional: Decimal = _ZERO,
+    price: Decimal | None = _PRICE_50K,
     stop_price: Decimal | None = None,
     order_type: OrderType = OrderType.LIMIT,
 ) -> Order:
 
-    return Order(
-        client_order_id='new_order-cmd1-0',
-        venue_order_id=None,
-        account_id='acc-1',
-        command_id='cmd-1',
-        symbol='BTCUSDT',
-        side=OrderSide.BUY,
-        order_type=order_type,
-        qty=qty,
-        filled_qty=filled_qty,
-        cumulative_notional=cumulative_notional,
-        price=price,
-        stop_price=stop_price,
-        status=status,
-        created_at=_TS,
-        updated_at=_TS,
-    )
+    return Order(**{
+        **_ORDER_KWARGS,
+        'order_type': order_type,
+        'qty': qty,
+        'filled_qty': filled_qty,
+        'cumulative_notional': cumulative_notional,
+        'price': price,
+        'stop_price': stop_price,
+        'status': status,
+    })
 
 
 def _quote_native_order(
-    quote_qty: Decimal = Decimal('100'),
-    filled_qty: Decimal = Decimal('0'),
-    cumulative_notional: Decimal = Decimal('0'),
+    quote_qty: Decimal = _QUOTE_QTY_100,
+    filled_qty: Decimal = _ZERO,
+    cumulative_notional: Decimal = _ZERO,
     status: OrderStatus = OrderStatus.SUBMITTING,
 ) -> Order:
 
@@ -106,72 +146,83 @@ def _quote_native_order(
     )
 
 
-def _position(qty: Decimal = Decimal('1.0'), avg_entry_price: Decimal = Decimal('50000.00')) -> Position:
+def _position(qty: Decimal = _QTY_ONE, avg_entry_price: Decimal = _PRICE_50K) -> Position:
 
-    return Position(
-        account_id='acc-1',
-        trade_id='trade-1',
-        symbol='BTCUSDT',
-        side=OrderSide.BUY,
-        qty=qty,
-        avg_entry_price=avg_entry_price,
-    )
+    return Position(**{**_POSITION_KWARGS, 'qty': qty, 'avg_entry_price': avg_entry_price})
 
 
-def test_order_side_members() -> None:
+@pytest.fixture(scope='module')
+def canonical_fill() -> Fill:
 
-    assert set(OrderSide) == {OrderSide.BUY, OrderSide.SELL}
+    return _fill()
 
 
-def test_order_type_members() -> None:
+@pytest.fixture
+def canonical_order() -> Order:
 
-    expected = {
-        OrderType.MARKET,
-        OrderType.LIMIT,
-        OrderType.LIMIT_IOC,
-        OrderType.STOP,
-        OrderType.STOP_LIMIT,
-        OrderType.TAKE_PROFIT,
-        OrderType.TP_LIMIT,
-        OrderType.OCO,
-    }
-    assert set(OrderType) == expected
+    return _order()
 
 
-def test_order_status_members() -> None:
+@pytest.fixture
+def canonical_position() -> Position:
 
-    expected = {
-        OrderStatus.SUBMITTING,
-        OrderStatus.OPEN,
-        OrderStatus.PARTIALLY_FILLED,
-        OrderStatus.FILLED,
-        OrderStatus.CANCELED,
-        OrderStatus.REJECTED,
-        OrderStatus.EXPIRED,
-    }
-    assert set(OrderStatus) == expected
+    return _position()
 
 
-def test_enum_values_are_strings() -> None:
+@pytest.mark.parametrize(
+    ('enum_cls', 'expected_names'),
+    [
+        pytest.param(OrderSide, {'BUY', 'SELL'}, id='OrderSide'),
+        pytest.param(
+            OrderType,
+            {
+                'MARKET',
+                'LIMIT',
+                'LIMIT_IOC',
+                'STOP',
+                'STOP_LIMIT',
+                'TAKE_PROFIT',
+                'TP_LIMIT',
+                'OCO',
+            },
+            id='OrderType',
+        ),
+        pytest.param(
+            OrderStatus,
+            {
+                'SUBMITTING',
+                'OPEN',
+                'PARTIALLY_FILLED',
+                'FILLED',
+                'CANCELED',
+                'REJECTED',
+                'EXPIRED',
+            },
+            id='OrderStatus',
+        ),
+    ],
+)
+def test_enum_members_and_string_values(
+    enum_cls: type[OrderSide | OrderType | OrderStatus], expected_names: set[str],
+) -> None:
 
-    for enum_cls in (OrderSide, OrderType, OrderStatus):
-        for member in enum_cls:
-            assert isinstance(member.value, str)
+    members = list(enum_cls)
+    assert {m.name for m in members} == expected_names
+    assert all(isinstance(m.value, str) for m in members)
 
 
-def test_fill_creation() -> None:
+def test_fill_creation(canonical_fill: Fill) -> None:
 
-    fill = _fill()
+    fill = canonical_fill
     assert fill.symbol == 'BTCUSDT'
     assert fill.side == OrderSide.BUY
-    assert fill.qty == Decimal('0.5')
+    assert fill.qty == _QTY_HALF
 
 
-def test_fill_frozen() -> None:
+def test_fill_frozen(canonical_fill: Fill) -> None:
 
-    fill = _fill()
     with pytest.raises(AttributeError):
-        fill.qty = Decimal('999')  # type: ignore[misc]
+        canonical_fill.qty = Decimal('999')  # type: ignore[misc]
 
 
 def test_fill_dedup_key_with_venue_trade_id() -> None:
@@ -191,46 +242,34 @@ def test_fill_dedup_key_fallback() -> None:
     )
 
 
-def test_fill_financial_values_are_decimal() -> None:
-
-    fill = _fill()
-    assert isinstance(fill.qty, Decimal)
-    assert isinstance(fill.price, Decimal)
-    assert isinstance(fill.fee, Decimal)
-
+def test_order_creation(canonical_order: Order) -> None:
 
-def test_order_creation() -> None:
-
-    order = _order()
+    order = canonical_order
     assert order.symbol == 'BTCUSDT'
     assert order.status == OrderStatus.SUBMITTING
     assert order.venue_order_id is None
 
 
-def test_order_is_terminal_for_terminal_statuses() -> None:
-
-    for status in (
-        OrderStatus.FILLED,
-        OrderStatus.CANCELED,
-        OrderStatus.REJECTED,
-        OrderStatus.EXPIRED,
-    ):
-        assert _order(status=status).is_terminal is True
-
-
-def test_order_is_terminal_for_non_terminal_statuses() -> None:
+@pytest.mark.parametrize(
+    ('status', 'expected'),
+    [
+        (OrderStatus.FILLED, True),
+        (OrderStatus.CANCELED, True),
+        (OrderStatus.REJECTED, True),
+        (OrderStatus.EXPIRED, True),
+        (OrderStatus.SUBMITTING, False),
+        (OrderStatus.OPEN, False),
+        (OrderStatus.PARTIALLY_FILLED, False),
+    ],
+)
+def test_order_is_terminal(status: OrderStatus, expected: bool) -> None:
 
-    for status in (
-        OrderStatus.SUBMITTING,
-        OrderStatus.OPEN,
-        OrderStatus.PARTIALLY_FILLED,
-    ):
-        assert _order(status=status).is_terminal is False
+    assert _order(status=status).is_terminal is expected
 
 
 def test_order_remaining_qty() -> None:
 
-    order = _order(qty=Decimal('1.0'), filled_qty=Decimal('0.3'))
+    order = _order(qty=_QTY_ONE, filled_qty=Decimal('0.3'))
     assert order.remaining_qty == Decimal('0.7')
 
 
@@ -241,26 +280,18 @@ def test_order_status_mutation() -> None:
     assert order.status == OrderStatus.OPEN
 
 
-def test_order_financial_values_are_decimal() -> None:
-
-    order = _order()
-    assert isinstance(order.qty, Decimal)
-    assert isinstance(order.filled_qty, Decimal)
-    assert isinstance(order.price, Decimal)
-
-
 def test_order_setattr_rejects_non_positive_quote_qty() -> None:
 
     order = _quote_native_order()
     with pytest.raises(ValueError, match='quote_qty must be a finite positive Decimal'):
-        order.quote_qty = Decimal('0')
+        order.quote_qty = _ZERO
 
 
 def test_order_setattr_rejects_negative_quote_qty() -> None:
 
     order = _quote_native_order()
     with pytest.raises(ValueError, match='quote_qty must be a finite positive Decimal'):
-        order.quote_qty = Decimal('-1')
+        order.quote_qty = _NEG_ONE
 
 
 def test_order_setattr_rejects_non_decimal_quote_qty() -> None:
@@ -272,7 +303,7 @@ def test_order_setattr_rejects_non_decimal_quote_qty() -> None:
 
 def test_order_setattr_accepts_replacing_positive_quote_qty() -> None:
 
-    order = _quote_native_order(quote_qty=Decimal('100'))
+    order = _quote_native_order(quote_qty=_QUOTE_QTY_100)
     order.quote_qty = Decimal('250')
     assert order.quote_qty == Decimal('250')
     assert order.qty is None
@@ -289,88 +320,81 @@ def test_order_setattr_rejects_quote_qty_when_qty_is_set() -> None:
 
     order = _order()
     with pytest.raises(ValueError, match='quote_qty cannot be set while qty is set'):
-        order.quote_qty = Decimal('100')
+        order.quote_qty = _QUOTE_QTY_100
 
 
 def test_order_setattr_rejects_qty_when_quote_qty_is_set() -> None:
 
     order = _quote_native_order()
     with pytest.raises(ValueError, match='qty cannot be set while quote_qty is set'):
-        order.qty = Decimal('1.0')
+        order.qty = _QTY_ONE
 
 
 def test_order_setattr_swap_qty_to_quote_qty_via_none() -> None:
 
     order = _order()
     order.qty = None
-    order.quote_qty = Decimal('100')
+    order.quote_qty = _QUOTE_QTY_100
     assert order.qty is None
-    assert order.quote_qty == Decimal('100')
+    assert order.quote_qty == _QUOTE_QTY_100
 
 
 def test_order_setattr_swap_quote_qty_to_qty_via_none() -> None:
 
     order = _quote_native_order()
     order.quote_qty = None
-    order.qty = Decimal('1.0')
+    order.qty = _QTY_ONE
     assert order.quote_qty is None
-    assert order.qty == Decimal('1.0')
+    assert order.qty == _QTY_ONE
 
 
-def test_position_creation() -> None:
+def test_position_creation(canonical_position: Position) -> None:
 
-    pos = _position()
+    pos = canonical_position
     assert pos.symbol == 'BTCUSDT'
     assert pos.side == OrderSide.BUY
-    assert pos.qty == Decimal('1.0')
-
-
-def test_position_is_closed_at_zero() -> None:
+    assert pos.qty == _QTY_ONE
 
-    assert _position(qty=Decimal('0')).is_closed is True
 
+@pytest.mark.parametrize(
+    ('qty', 'closed'),
+    [(_ZERO, True), (_QTY_HALF, False), (_QTY_ONE, False)],
+)
+def test_position_is_closed(qty: Decimal, closed: bool) -> None:
 
-def test_position_is_not_closed_with_quantity() -> None:
-
-    assert _position(qty=Decimal('0.5')).is_closed is False
+    assert _position(qty=qty).is_closed is closed
 
 
-def test_position_financial_values_are_decimal() -> None:
+@pytest.mark.parametrize(
+    ('instance', 'fields'),
+    [
+        ('canonical_fill', ('qty', 'price', 'fee')),
+        ('canonical_order', ('qty', 'filled_qty', 'price')),
+        ('canonical_position', ('qty', 'avg_entry_price')),
+    ],
+)
+def test_financial_values_are_decimal(
+    request: pytest.FixtureRequest, instance: str, fields: tuple[str, ...],
+) -> None:
 
-    pos = _position()
-    assert isinstance(pos.qty, Decimal)
-    assert isinstance(pos.avg_entry_price, Decimal)
+    obj = request.getfixturevalue(instance)
+    assert all(isinstance(getattr(obj, field), Decimal) for field in fields)
 
 
 def test_fill_rejects_naive_timestamp() -> None:
 
     with pytest.raises(ValueError, match='timezone-aware'):
-        Fill(
-            venue_trade_id='vt-001',
-            venue_order_id='vo-001',
-            client_order_id='new_order-cmd1-0',
-            account_id='acc-1',
-            trade_id='trade-1',
-            command_id='cmd-1',
-            symbol='BTCUSDT',
-            side=OrderSide.BUY,
-            qty=Decimal('0.5'),
-            price=Decimal('50000.00'),
-            fee=Decimal('0.001'),
-            fee_asset='BTC',
-            is_maker=True,
-            timestamp=datetime(2026, 1, 1),
-        )
+        Fill(**{**_FILL_KWARGS, 'timestamp': _NAIVE_TS})
 
 
-@pytest.mark.parametrize('bad', [Decimal('0'), Decimal('-1')])
+@pytest.mark.parametrize('bad', _NON_POSITIVE)
 def test_fill_rejects_non_positive_qty(bad: Decimal) -> None:
 
     with pytest.raises(ValueError, match='positive'):
         _fill(qty=bad)
 
 
-@pytest.mark.parametrize('bad', [Decimal('0'), Decimal('-1')])
+@pytest.mark.parametrize('bad', _NON_POSITIVE)
 def test_fill_rejects_non_positive_price(bad: Decimal) -> None:
 
     with pytest.raises(ValueError, match='positive'):
@@ -380,68 +404,36 @@ def test_fill_rejects_non_positive_price(bad: Decimal) -> None:
 def test_fill_rejects_negative_fee() -> None:
 
     with pytest.raises(ValueError, match='non-negative'):
-        _fill(fee=Decimal('-1'))
+        _fill(fee=_NEG_ONE)
 
 
 def test_order_rejects_naive_created_at() -> None:
 
     with pytest.raises(ValueError, match='timezone-aware'):
-        Order(
-            client_order_id='new_order-cmd1-0',
-            venue_order_id=None,
-            account_id='acc-1',
-            command_id='cmd-1',
-            symbol='BTCUSDT',
-            side=OrderSide.BUY,
-            order_type=OrderType.LIMIT,
-            qty=Decimal('1.0'),
-            filled_qty=Decimal('0'),
-            cumulative_notional=Decimal('0'),
-            price=Decimal('50000.00'),
-            stop_price=None,
-            status=OrderStatus.SUBMITTING,
-            created_at=datetime(2026, 1, 1),
-            updated_at=datetime(2026, 1, 1, tzinfo=UTC),
-        )
+        Order(**{**_ORDER_KWARGS, 'created_at': _NAIVE_TS})
 
 
 def test_order_rejects_naive_updated_at() -> None:
 
     with pytest.raises(ValueError, match='timezone-aware'):
-        Order(
-            client_order_id='new_order-cmd1-0',
-            venue_order_id=None,
-            account_id='acc-1',
-            command_id='cmd-1',
-            symbol='BTCUSDT',
-            side=OrderSide.BUY,
-            order_type=OrderType.LIMIT,
-            qty=Decimal('1.0'),
-            filled_qty=Decimal('0'),
-            cumulative_notional=Decimal('0'),
-            price=Decimal('50000.00'),
-            stop_price=None,
-            status=OrderStatus.SUBMITTING,
-            created_at=datetime(2026, 1, 1, tzinfo=UTC),
-            updated_at=datetime(2026, 1, 1),
-        )
+        Order(**{**_ORDER_KWARGS, 'updated_at': _NAIVE_TS})
 
 
-@pytest.mark.parametrize('bad', [Decimal('0'), Decimal('-1')])
+@pytest.mark.parametrize('bad', _NON_POSITIVE)
 def test_order_rejects_non_positive_qty(bad: Decimal) -> None:
 
     with pytest.raises(ValueError, match='positive'):
         _order(qty=bad)
 
 
-@pytest.mark.parametrize('bad', [Decimal('NaN'), Decimal('Infinity'), Decimal('-Infinity')])
+@pytest.mark.parametrize('bad', _NON_FINITE)
 def test_order_rejects_non_finite_qty(bad: Decimal) -> None:
 
     with pytest.raises(ValueError, match='finite positive Decimal'):
         _order(qty=bad)
 
 
-@pytest.mark.parametrize('bad', [Decimal('NaN'), Decimal('Infinity'), Decimal('-Infinity')])
+@pytest.mark.parametrize('bad', _NON_FINITE)
 def test_order_rejects_non_finite_quote_qty(bad: Decimal) -> None:
 
     with pytest.raises(ValueError, match='quote_qty must be a finite positive Decimal'):
@@ -455,8 +447,8 @@ def test_order_rejects_non_finite_quote_qty(bad: Decimal) -> None:
             order_type=OrderType.MARKET,
             qty=None,
             quote_qty=bad,
-            filled_qty=Decimal('0'),
-            cumulative_notional=Decimal('0'),
+            filled_qty=_ZERO,
+            cumulative_notional=_ZERO,
             price=None,
             stop_price=None,
             status=OrderStatus.SUBMITTING,
@@ -486,8 +478,8 @@ def test_order_rejects_non_decimal_quote_qty(bad: object) -> None:
             order_type=OrderType.MARKET,
             qty=None,
             quote_qty=bad,  # type: ignore[arg-type]
-            filled_qty=Decimal('0'),
-            cumulative_notional=Decimal('0'),
+            filled_qty=_ZERO,
+            cumulative_notional=_ZERO,
             price=None,
             stop_price=None,
             status=OrderStatus.SUBMITTING,
@@ -499,23 +491,23 @@ def test_order_rejects_non_decimal_quote_qty(bad: object) -> None:
 def test_order_rejects_negative_filled_qty() -> None:
 
     with pytest.raises(ValueError, match='non-negative'):
-        _order(filled_qty=Decimal('-1'))
+        _order(filled_qty=_NEG_ONE)
 
 
 def test_position_rejects_negative_qty() -> None:
 
     with pytest.raises(ValueError, match='non-negative'):
-        _position(qty=Decimal('-1'))
+        _position(qty=_NEG_ONE)
 
 
-@pytest.mark.parametrize('bad', [Decimal('0'), Decimal('-1')])
+@pytest.mark.parametrize('bad', _NON_POSITIVE)
 def test_order_rejects_non_positive_price(bad: Decimal) -> None:
 
     with pytest.raises(ValueError, match='positive'):
         _order(price=bad)
 
 
-@pytest.mark.parametrize('bad', [Decimal('0'), Decimal('-1')])
+@pytest.mark.parametrize('bad', _NON_POSITIVE)
 def test_order_rejects_non_positive_stop_price(bad: Decimal) -> None:
 
     with pytest.raises(ValueError, match='positive'):
@@ -525,13 +517,13 @@ def test_order_rejects_non_positive_stop_price(bad: Decimal) -> None:
 def test_order_rejects_filled_qty_exceeding_qty() -> None:
 
     with pytest.raises(ValueError, match='cannot exceed'):
-        _order(qty=Decimal('1.0'), filled_qty=Decimal('2.0'))
+        _order(qty=_QTY_ONE, filled_qty=Decimal('2.0'))
 
 
 def test_position_rejects_negative_avg_entry_price() -> None:
 
     with pytest.raises(ValueError, match='non-negative'):
-        _position(avg_entry_price=Decimal('-1'))
+        _position(avg_entry_price=_NEG_ONE)
 
 
 def test_order_creation_market_with_no_price() -> None:
@@ -544,48 +536,21 @@ def test_order_creation_market_with_no_price() -> None:
 def test_order_rejects_market_with_price() -> None:
 
     with pytest.raises(ValueError, match='MARKET'):
-        _order(order_type=OrderType.MARKET, price=Decimal('50000.00'))
+        _order(order_type=OrderType.MARKET, price=_PRICE_50K)
 
 
 @pytest.mark.parametrize('field', ['account_id', 'trade_id', 'symbol'])
 def test_position_rejects_empty_string(field: str) -> None:
 
-    kwargs: dict[str, Any] = {
-        'account_id': 'acc-1',
-        'trade_id': 'trade-1',
-        'symbol': 'BTCUSDT',
-        'side': OrderSide.BUY,
-        'qty': Decimal('1.0'),
-        'avg_entry_price': Decimal('50000.00'),
-    }
-    kwargs[field] = ''
     with pytest.raises(ValueError, match='non-empty string'):
-        Position(**kwargs)
+        Position(**{**_POSITION_KWARGS, field: ''})
 
 
 @pytest.mark.parametrize('field', ['client_order_id', 'account_id', 'command_id', 'symbol'])
 def test_order_rejects_empty_string(field: str) -> None:
 
-    kwargs: dict[str, Any] = {
-        'client_order_id': 'new_order-cmd1-0',
-        'venue_order_id': None,
-        'account_id': 'acc-1',
-        'command_id': 'cmd-1',
-        'symbol': 'BTCUSDT',
-        'side': OrderSide.BUY,
-        'order_type': OrderType.LIMIT,
-        'qty': Decimal('1.0'),
-        'filled_qty': Decimal('0'),
-        'cumulative_notional': Decimal('0'),
-        'price': Decimal('50000.00'),
-        'stop_price': None,
-        'status': OrderStatus.SUBMITTING,
-        'created_at': _TS,
-        'updated_at': _TS,
-    }
-    kwargs[field] = ''
     with pytest.raises(ValueError, match='non-empty string'):
-        Order(**kwargs)
+        Order(**{**_ORDER_KWARGS, field: ''})
 
 
 @pytest.mark.parametrize('field', [
@@ -594,28 +559,11 @@ def test_order_rejects_empty_string(field: str) -> None:
 ])
 def test_fill_rejects_empty_string(field: str) -> None:
 
-    kwargs: dict[str, Any] = {
-        'venue_trade_id': 'vt-001',
-        'venue_order_id': 'vo-001',
-        'client_order_id': 'new_order-cmd1-0',
-        'account_id': 'acc-1',
-        'trade_id': 'trade-1',
-        'command_id': 'cmd-1',
-        'symbol': 'BTCUSDT',
-        'side': OrderSide.BUY,
-        'qty': Decimal('0.5'),
-        'price': Decimal('50000.00'),
-        'fee': Decimal('0.001'),
-        'fee_asset': 'BTC',
-        'is_maker': True,
-        'timestamp': _TS,
-    }
-    kwargs[field] = ''
     with pytest.raises(ValueError, match='non-empty string'):
-        Fill(**kwargs)
+        Fill(**{**_FILL_KWARGS, field: ''})
 
 
-@pytest.mark.parametrize('bad', [Decimal('0'), Decimal('-1')])
+@pytest.mark.parametrize('bad', _NON_POSITIVE)
 def test_order_rejects_qty_mutation_to_non_positive(bad: Decimal) -> None:
 
     order = _order()
@@ -623,7 +571,7 @@ def test_order_rejects_qty_mutation_to_non_positive(bad: Decimal) -> None:
         order.qty = bad
 
 
-@pytest.mark.parametrize('bad', [Decimal('NaN'), Decimal('Infinity'), Decimal('-Infinity')])
+@pytest.mark.parametrize('bad', _NON_FINITE)
 def test_order_rejects_qty_mutation_to_non_finite(bad: Decimal) -> None:
 
     order = _order()
@@ -631,7 +579,7 @@ def test_order_rejects_qty_mutation_to_non_finite(bad: Decimal) -> None:
         order.qty = bad
 
 
-@pytest.mark.parametrize('bad', [Decimal('NaN'), Decimal('Infinity'), Decimal('-Infinity')])
+@pytest.mark.parametrize('bad', _NON_FINITE)
 def test_order_rejects_quote_qty_mutation_to_non_finite(bad: Decimal) -> None:
 
     order = _quote_native_order()
@@ -643,21 +591,21 @@ def test_order_rejects_filled_qty_mutation_to_negative() -> None:
 
     order = _order()
     with pytest.raises(ValueError, match='non-negative'):
-        order.filled_qty = Decimal('-1')
+        order.filled_qty = _NEG_ONE
 
 
 def test_position_rejects_qty_mutation_to_negative() -> None:
 
     pos = _position()
     with pytest.raises(ValueError, match='non-negative'):
-        pos.qty = Decimal('-1')
+        pos.qty = _NEG_ONE
 
 
 def test_position_rejects_avg_entry_price_mutation_to_negative() -> None:
 
     pos = _position()
     with pytest.raises(ValueError, match='non-negative'):
-        pos.avg_entry_price = Decimal('-1')
+        pos.avg_entry_price = _NEG_ONE
 
 
 def _intent(
@@ -679,14 +627,14 @@ def _intent(
     )
 
 
-@pytest.mark.parametrize('bad', [Decimal('NaN'), Decimal('Infinity'), Decimal('-Infinity')])
+@pytest.mark.parametrize('bad', _NON_FINITE)
 def test_order_submit_intent_rejects_non_finite_qty(bad: Decimal) -> None:
 
     with pytest.raises(ValueError, match='qty must be a finite positive Decimal'):
         _intent(qty=bad)
 
 
-@pytest.mark.parametrize('bad', [Decimal('NaN'), Decimal('Infinity'), Decimal('-Infinity')])
+@pytest.mark.parametrize('bad', _NON_FINITE)
 def test_order_submit_intent_rejects_non_finite_quote_qty(bad: Decimal) -> None:
 
     with pytest.raises(ValueError, match='quote_qty must be a finite positive Decimal'):
@@ -715,7 +663,7 @@ def _outcome(target_qty: Decimal | None = Decimal('1')) -> TradeOutcome:
         account_id='acc-1',
         status=TradeStatus.PENDING,
         target_qty=target_qty,
-        filled_qty=Decimal('0'),
+        filled_qty=_ZERO,
         avg_fill_price=None,
         slices_completed=0,
         slices_total=1,
@@ -724,7 +672,7 @@ def _outcome(target_qty: Decimal | None = Decimal('1')) -> TradeOutcome:
     )
 
 
-@pytest.mark.parametrize('bad', [Decimal('NaN'), Decimal('Infinity'), Decimal('-Infinity')])
+@pytest.mark.parametrize('bad', _NON_FINITE)
 def test_trade_outcome_rejects_non_finite_target_qty(bad: Decimal) -> None:
 
     with pytest.raises(ValueError, match='target_qty must be a finite positive Decimal'):
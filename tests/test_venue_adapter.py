@@ -15,13 +15,17 @@ from praxis.infrastructure.venue_adapter import (
     AuthenticationError,
     BalanceEntry,
     CancelResult,
+    CancelToken,
     CommandQuantization,
+    ErrorCode,
     ImmediateFill,
+    LocalOrderRejectedError,
     NotFoundError,
     OrderBookLevel,
     OrderBookSnapshot,
     OrderRejectedError,
     RateLimitError,
+    SubmitCancelledError,
     SubmitResult,
     SymbolFilters,
     TransientError,
@@ -94,6 +98,38 @@ class TestResponseDataclasses:
         with pytest.raises(AttributeError):
             result.immediate_fills.append(fill)  # type: ignore[attr-defined]
 
+    def test_submit_result_hashable_and_slotted(self) -> None:
+
+        fill = ImmediateFill(
+            venue_trade_id='vt-001',
+            qty=Decimal('0.5'),
+            price=Decimal('50000'),
+            fee=Decimal('0.001'),
+            fee_asset='BTC',
+            is_maker=False,
+        )
+        first = SubmitResult('vo-001', OrderStatus.FILLED, (fill,))
+        second = SubmitResult('vo-001', OrderStatus.FILLED, (fill,))
+        assert hash(first) == hash(second)
+        assert not hasattr(first, '__dict__')
+        assert not hasattr(fill, '__dict__')
+
+    @pytest.mark.parametrize(
+        'cls',
+        [
+            CancelResult,
+            VenueOrder,
+            VenueTrade,
+            BalanceEntry,
+            SymbolFilters,
+            CommandQuantization,
+            OrderBookLevel,
+            OrderBookSnapshot,
+        ],
+    )
+    def test_venue_dtos_are_slotted(self, cls: type) -> None:
+        assert '__slots__' in cls.__dict__
+
     def test_cancel_result_frozen(self) -> None:
         result = CancelResult(
             venue_order_id='vo-001',
@@ -185,6 +221,34 @@ class TestResponseDataclasses:
         with pytest.raises(AttributeError):
             filters.tick_size = Decimal('0.001')  # type: ignore[misc]
 
+    def test_symbol_filters_intern_returns_shared_instance(self) -> None:
+
+        kwargs: dict[str, Any] = {
+            'symbol': 'BTCUSDT',
+            'tick_size': Decimal('0.01'),
+            'lot_step': Decimal('0.00001'),
+            'lot_min': Decimal('0.00001'),
+            'lot_max': Decimal('9000'),
+            'min_notional': Decimal('5'),
+        }
+        first = SymbolFilters.intern(**kwargs)
+        assert SymbolFilters.intern(**kwargs) is first
+        assert first == SymbolFilters(**kwargs)
+
+    def test_symbol_filters_intern_keeps_wire_precision_distinct(self) -> None:
+
+        kwargs: dict[str, Any] = {
+            'symbol': 'BTCUSDT',
+            'lot_step': Decimal('0.00001'),
+            'lot_min': Decimal('0.00001'),
+            'lot_max': Decimal('9000'),
+            'min_notional': Decimal('5'),
+        }
+        first = SymbolFilters.intern(tick_size=Decimal('0.01'), **kwargs)
+        second = SymbolFilters.intern(tick_size=Decimal('0.01000000'), **kwargs)
+        assert first is not second
+        assert str(second.tick_size) == '0.01000000'
+
     def test_order_book_level_frozen(self) -> None:
         level = OrderBookLevel(price=Decimal('50000'), qty=Decimal('1.5'))
         with pytest.raises(AttributeError):
@@ -285,6 +349,57 @@ class TestErrorHierarchy:
         err = RateLimitError('rate limited')
         assert err.status_code is None
 
+    @pytest.mark.parametrize(
+        ('cls', 'code'),
+        [
+            (VenueError, ErrorCode.VENUE),
+            (OrderRejectedError, ErrorCode.REJECTED),
+            (LocalOrderRejectedError, ErrorCode.REJECTED),
+            (RateLimitError, ErrorCode.RATE_LIMIT),
+            (AuthenticationError, ErrorCode.AUTH),
+            (TransientError, ErrorCode.TRANSIENT),
+            (NotFoundError, ErrorCode.NOT_FOUND),
+            (SubmitCancelledError, ErrorCode.CANCELLED),
+        ],
+    )
+    def test_error_class_carries_code(self, cls: type[VenueError], code: ErrorCode) -> None:
+        assert cls.code is code
+
+    def test_instance_code_matches_class(self) -> None:
+
+        err = RateLimitError('rate limited', retry_after=1.0)
+        assert err.code is ErrorCode.RATE_LIMIT
+
+    @pytest.mark.parametrize(
+        ('err', 'retryable'),
+        [
+            (TransientError('timeout'), True),
+            (RateLimitError('rate limited', status_code=429), True),
+            (AuthenticationError('bad key'), False),
+            (NotFoundError('missing'), False),
+            (OrderRejectedError('rejected', venue_code=-1013, reason='filter'), False),
+            (SubmitCancelledError('withdrawn'), False),
+            (VenueError('venue'), False),
+        ],
+    )
+    def test_only_transient_and_rate_limit_errors_are_retryable(
+        self, err: VenueError, retryable: bool,
+    ) -> None:
+        assert err.code.is_retryable is retryable
+
+
+class TestCancelToken:
+
+    def test_starts_unfired(self) -> None:
+        assert CancelToken().cancelled is False
+
+    def test_cancel_is_idempotent(self) -> None:
+
+        token = CancelToken()
+        token.cancel()
+        token.cancel()
+        assert token.cancelled is True
+
 
 class TestVenueAdapterProtocol:
 